@@ -1,5 +1,36 @@
-from .monads.maybe import Maybe
-from .monads.result import Result, Success, Failed
-from .monads.delay import Delay
-from .monads.state import State
-from .monads.context import Context
+# typing을 불러오지 않도록 직접 정의함. 타입 검사기는 이 이름을 typing.TYPE_CHECKING과 같이 취급함
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .monads.maybe import Maybe
+    from .monads.result import Result, Success, Failed
+    from .monads.delay import Delay
+    from .monads.state import State
+    from .monads.context import Context
+
+# 이름을 처음 접근할 때 모듈을 임포트해 시작 시간을 줄임
+EXPORTS = {
+    "Maybe": ".monads.maybe",
+    "Result": ".monads.result",
+    "Success": ".monads.result",
+    "Failed": ".monads.result",
+    "Delay": ".monads.delay",
+    "State": ".monads.state",
+    "Context": ".monads.context",
+}
+
+__all__ = list(EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,12 @@
+import time
+from typing import Callable
+
+
+def measure(func: Callable[[], object], repeat: int = 3) -> float:
+    """func를 repeat번 실행해 가장 빠른 실행시간(초)을 반환함"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,97 @@
+"""모나드 핫패스 벤치마크 실행기
+
+python -m benchmarks [--filter maybe] [--lengths 1,10,100] [--sizes 1,1000]
+                     [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+# 이름은 쓰지 않지만 임포트하는 것만으로 hot_paths의 @case들이 CASES에 등록됨
+from . import hot_paths  # noqa: F401
+from .suite import CASES, run
+
+
+def numbers(text: str) -> list[int]:
+    return [int(number) for number in text.split(",")]
+
+
+def commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def key(entry: dict) -> tuple[str, int, int]:
+    return entry["name"], entry["length"], entry["size"]
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--filter", default="", help="이름에 포함된 케이스만 실행")
+    parser.add_argument("--lengths", type=numbers, default=[1, 10, 100])
+    parser.add_argument("--sizes", type=numbers, default=[1, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", help="이전 JSON 결과와 비교")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+    baselines = {CASES[name].baseline for name in names} - {None}
+    names += sorted(baselines - set(names))
+    measurements = run(names, args.lengths, args.sizes, args.repeat)
+
+    entries = [
+        {
+            "name": m.name,
+            "baseline": m.baseline,
+            "length": m.length,
+            "size": m.size,
+            "seconds": m.seconds,
+            "ns_per_stage": m.ns_per_stage,
+        }
+        for m in measurements
+    ]
+    previous: dict[tuple[str, int, int], dict] = {}
+    if args.compare:
+        with open(args.compare) as file:
+            previous = {key(entry): entry for entry in json.load(file)["results"]}
+
+    by_key = {key(entry): entry for entry in entries}
+    print(
+        f"{'case':>20} {'length':>7} {'size':>6} {'ns/stage':>10} {'vs base':>8}"
+        + (f" {'vs prev':>8}" if previous else "")
+    )
+    for entry in entries:
+        line = f"{entry['name']:>20} {entry['length']:>7} {entry['size']:>6} {entry['ns_per_stage']:>10.1f}"
+        base = by_key.get((entry["baseline"], entry["length"], entry["size"]))
+        line += f" {entry['seconds'] / base['seconds']:>7.2f}x" if base else f" {'':>8}"
+        if previous:
+            before = previous.get(key(entry))
+            line += f" {entry['seconds'] / before['seconds']:>7.2f}x" if before else ""
+        print(line)
+
+    if args.output:
+        report = {
+            "commit": commit(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "results": entries,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""원소별 Maybe/Result 체인과 MaybeArray/ResultArray 벡터 연산 비교 (numpy 필요)
+
+python -m benchmarks.array [원소 수]
+"""
+
+import sys
+
+from . import measure
+from monads.array import MaybeArray, ResultArray, np
+from monads.maybe import Maybe
+from monads.result import Success
+
+
+def main(size: int = 1_000_000):
+    if np is None:
+        print("numpy가 설치되어 있지 않음")
+        return
+    values = np.arange(size, dtype=np.float64)
+    mask = values % 10 != 0
+    maybes = [
+        Maybe.of(v) if m else Maybe.nothing()
+        for v, m in zip(values.tolist(), mask.tolist())
+    ]
+    results = [Success(v) for v in values.tolist()]
+    maybe_array = MaybeArray.of(values, mask)
+    result_array = ResultArray.of(values)
+
+    cases = {
+        "Maybe.map x3": (
+            lambda: [
+                m.map(lambda x: x + 1).map(lambda x: x * 2).map(lambda x: x - 3)
+                for m in maybes
+            ],
+            lambda: maybe_array.map(lambda x: x + 1)
+            .map(lambda x: x * 2)
+            .map(lambda x: x - 3),
+        ),
+        "Result.bind x3": (
+            lambda: [
+                r.bind(lambda x: x + 1).bind(lambda x: x * 2).bind(lambda x: x - 3)
+                for r in results
+            ],
+            lambda: result_array.bind(lambda x: x + 1)
+            .bind(lambda x: x * 2)
+            .bind(lambda x: x - 3),
+        ),
+    }
+    print(f"{'case':>16} {'objects(s)':>11} {'array(s)':>9} {'speedup':>8}")
+    for name, (scalar, vector) in cases.items():
+        baseline = measure(scalar, repeat=1)
+        elapsed = measure(vector)
+        print(
+            f"{name:>16} {baseline:>11.3f} {elapsed:>9.4f} {baseline / elapsed:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
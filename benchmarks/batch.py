@@ -0,0 +1,38 @@
+"""호출마다 고정 비용이 있는 백엔드를 Result.wraps로 하나씩 부를 때와 Result.batched로 모아 부를 때 비교
+
+python -m benchmarks.batch [키 수] [호출당 지연(us)]
+"""
+
+import sys
+import time
+
+from . import measure
+from monads.result import Result
+
+
+def main(keys: int = 1_000, latency: int = 200):
+    def backend(ids: list[int]) -> list[int]:
+        # 왕복 한번의 지연은 키 수와 상관없이 고정
+        time.sleep(latency / 1e6)
+        return [id * 2 for id in ids]
+
+    single = Result.wraps(lambda id: backend([id])[0])
+    batched = Result.batched(backend, size=100)
+
+    def one_by_one():
+        return [single(id) for id in range(keys)]
+
+    def coalesced():
+        handles = [batched(id) for id in range(keys)]
+        return [handle.run() for handle in handles]
+
+    assert one_by_one() == coalesced()
+    print(f"{keys:,} keys, {latency}us per call")
+    print(f"{'case':>10} {'run(s)':>10} {'us/key':>10}")
+    for name, func in (("wraps", one_by_one), ("batched", coalesced)):
+        elapsed = measure(func, repeat=3)
+        print(f"{name:>10} {elapsed:>10.4f} {elapsed / keys * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
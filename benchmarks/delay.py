@@ -0,0 +1,51 @@
+"""Delay 파이프라인의 합성(fused) 실행과 클로저 중첩(unfused) 실행 비교
+
+python -m benchmarks.delay [스테이지 수]
+unfused는 스테이지마다 클로저로 감싸던 기존 방식을 그대로 재현함.
+"""
+
+import sys
+
+from . import measure
+from monads.delay import Delay
+
+
+def increase(value: int) -> int:
+    return value + 1
+
+
+def unfused(stages: int):
+    def run(value: int) -> int:
+        return value
+
+    for _ in range(stages):
+
+        def run(value: int, previous=run) -> int:
+            return increase(previous(value))
+
+    return run
+
+
+def fused(stages: int) -> Delay[[int], int]:
+    delay = Delay[[int], int].identity()
+    for _ in range(stages):
+        delay = delay.map(increase)
+    return delay
+
+
+def main(stages: int = 10_000):
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), stages * 3))
+    tower = unfused(stages)
+    pipeline = fused(stages)
+    assert tower(0) == pipeline.run(0) == stages
+
+    baseline = measure(lambda: tower(0), repeat=5)
+    elapsed = measure(lambda: pipeline.run(0), repeat=5)
+    print(f"{'stages':>8} {'unfused(ms)':>12} {'fused(ms)':>10} {'speedup':>8}")
+    print(
+        f"{stages:>8} {baseline * 1e3:>12.3f} {elapsed * 1e3:>10.3f} {baseline / elapsed:>7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
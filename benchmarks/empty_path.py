@@ -0,0 +1,39 @@
+"""빈 경로(Nothing/Failed)에서 map/bind/combined가 단락될 때의 비용 측정
+
+python -m benchmarks.empty_path [반복 횟수]
+"""
+
+import sys
+import timeit
+
+from monads.maybe import Maybe
+from monads.result import Failed, Result, Success
+
+
+def increase(value: int) -> int:
+    return value + 1
+
+
+def main(number: int = 200_000):
+    just, nothing = Maybe.of(1), Maybe[int].nothing()
+    success, failed = Success(1), Failed[int](ValueError())
+    cases = {
+        "Maybe.map just": lambda: just.map(increase),
+        "Maybe.map nothing": lambda: nothing.map(increase),
+        "Maybe.bind nothing": lambda: nothing.bind(Maybe.of),
+        "Maybe.combined nothing": lambda: just.combined(nothing, max),
+        "Maybe.nothing()": Maybe.nothing,
+        "Result.bind success": lambda: success.bind(increase),
+        "Result.bind failed": lambda: failed.bind(increase),
+        "Result.flat_bind failed": lambda: failed.flat_bind(Success),
+        "Result.combined failed": lambda: success.combined(failed, max),
+        "Result.identity()": Result.identity,
+    }
+    print(f"{'case':>24} {'ns/op':>8}")
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:>24} {elapsed / number * 1e9:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,44 @@
+"""같은 Program을 Direct, Batch, Concurrent로 실행했을 때 비교
+
+python -m benchmarks.free [사용자 수] [호출당 지연(us)]
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import measure
+from monads.free import Batch, Concurrent, Program
+
+
+def main(users: int = 100, latency: int = 500):
+    def roundtrip(keys: list[int]) -> list[int]:
+        # 왕복 한번의 지연은 키 수와 상관없이 고정
+        time.sleep(latency / 1e6)
+        return [key * 2 for key in keys]
+
+    def profile(id: int) -> Program[tuple]:
+        return Program.fetch(roundtrip, id).bind(
+            lambda friend: Program.all(
+                Program.fetch(roundtrip, friend), Program.fetch(roundtrip, id % 10)
+            )
+        )
+
+    program = Program.all(*(profile(id) for id in range(users)))
+    with ThreadPoolExecutor(16) as pool:
+        interpreters = {
+            "direct": None,
+            "batch": Batch(),
+            "concurrent": Concurrent(pool),
+        }
+        expected = program.run()
+        print(f"{users:,} users, {latency}us per call")
+        print(f"{'case':>10} {'run(s)':>10}")
+        for name, interpreter in interpreters.items():
+            assert program.run(interpreter) == expected
+            elapsed = measure(lambda: program.run(interpreter), repeat=3)
+            print(f"{name:>10} {elapsed:>10.4f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,243 @@
+"""각 모나드의 자주 쓰이는 경로와 같은 일을 하는 순수 파이썬 기준선
+
+모든 단계는 페이로드를 얕은 복사하므로, 페이로드 크기에 따라 모나드 오버헤드의 비중을 볼 수 있음.
+"""
+
+from monads.context import Context
+from monads.delay import Delay
+from monads.maybe import Maybe
+from monads.result import Result, Success
+from monads.state import State
+
+from .suite import case
+
+
+def step(payload: list[int]) -> list[int]:
+    return payload[:]
+
+
+def fail(payload: list[int]) -> list[int]:
+    raise ValueError
+
+
+@case("maybe.map", baseline="plain.if")
+def maybe_map(length: int, payload: list[int]):
+    def run():
+        maybe = Maybe.of(payload)
+        for _ in range(length):
+            maybe = maybe.map(step)
+        return maybe
+
+    return run
+
+
+@case("maybe.bind", baseline="plain.if")
+def maybe_bind(length: int, payload: list[int]):
+    wrapped = Maybe.wraps(step)
+
+    def run():
+        maybe = Maybe.of(payload)
+        for _ in range(length):
+            maybe = maybe.bind(wrapped)
+        return maybe
+
+    return run
+
+
+@case("maybe.compiled", baseline="plain.if")
+def maybe_compiled(length: int, payload: list[int]):
+    def build(maybe: Maybe[list[int]]) -> Maybe[list[int]]:
+        for _ in range(length):
+            maybe = maybe.map(step)
+        return maybe
+
+    compiled = Maybe.compile(build)
+    return lambda: compiled(payload)
+
+
+@case("plain.if")
+def plain_if(length: int, payload: list[int]):
+    def run():
+        value = payload
+        for _ in range(length):
+            if value is None:
+                break
+            value = step(value)
+        return value
+
+    return run
+
+
+@case("result.bind", baseline="plain.try")
+def result_bind(length: int, payload: list[int]):
+    def run():
+        result: Result[list[int]] = Success(payload)
+        for _ in range(length):
+            result = result.bind(step)
+        return result
+
+    return run
+
+
+@case("result.flat_bind", baseline="plain.try")
+def result_flat_bind(length: int, payload: list[int]):
+    wrapped = Result.wraps(step)
+
+    def run():
+        result: Result[list[int]] = Success(payload)
+        for _ in range(length):
+            result = result.flat_bind(wrapped)
+        return result
+
+    return run
+
+
+@case("result.wraps", baseline="plain.try")
+def result_wraps(length: int, payload: list[int]):
+    wrapped = Result.wraps(step)
+
+    def run():
+        for _ in range(length):
+            wrapped(payload)
+
+    return run
+
+
+@case("result.compiled", baseline="plain.try")
+def result_compiled(length: int, payload: list[int]):
+    def build(result: Result[list[int]]) -> Result[list[int]]:
+        for _ in range(length):
+            result = result.bind(step)
+        return result
+
+    compiled = Result.compile(build)
+    return lambda: compiled(payload)
+
+
+@case("plain.try")
+def plain_try(length: int, payload: list[int]):
+    def run():
+        value = payload
+        for _ in range(length):
+            try:
+                value = step(value)
+            except Exception:
+                break
+        return value
+
+    return run
+
+
+@case("result.bind.failed", baseline="plain.try.failed")
+def result_bind_failed(length: int, payload: list[int]):
+    def run():
+        for _ in range(length):
+            Success(payload).bind(fail)
+
+    return run
+
+
+@case("result.wraps.failed", baseline="plain.try.failed")
+def result_wraps_failed(length: int, payload: list[int]):
+    wrapped = Result.wraps(fail)
+
+    def run():
+        for _ in range(length):
+            wrapped(payload)
+
+    return run
+
+
+@case("result.wraps.code", baseline="plain.try.failed")
+def result_wraps_code(length: int, payload: list[int]):
+    wrapped = Result.wraps(fail, codes={ValueError: 1})
+
+    def run():
+        for _ in range(length):
+            wrapped(payload)
+
+    return run
+
+
+@case("plain.try.failed")
+def plain_try_failed(length: int, payload: list[int]):
+    def run():
+        for _ in range(length):
+            try:
+                fail(payload)
+            except Exception as e:
+                pass
+
+    return run
+
+
+@case("delay.run", baseline="plain.loop")
+def delay_run(length: int, payload: list[int]):
+    delay = Delay(step)
+    for _ in range(length - 1):
+        delay = delay.map(step)
+    return lambda: delay.run(payload)
+
+
+@case("plain.loop")
+def plain_loop(length: int, payload: list[int]):
+    def run():
+        value = payload
+        for _ in range(length):
+            value = step(value)
+        return value
+
+    return run
+
+
+@case("state.run", baseline="plain.state")
+def state_run(length: int, payload: list[int]):
+    def push(_: object) -> State:
+        return State(lambda state: (state, step(state)))
+
+    state: State = State.of(None)
+    for _ in range(length):
+        state = state.bind(push)
+    return lambda: state.run(payload)
+
+
+@case("plain.state")
+def plain_state(length: int, payload: list[int]):
+    def run():
+        value, state = None, payload
+        for _ in range(length):
+            value, state = state, step(state)
+        return value, state
+
+    return run
+
+
+def concat(left: list[int], right: list[int]) -> list[int]:
+    return left + right
+
+
+@case("monoid.fold", baseline="monoid.reduce")
+def monoid_fold(length: int, payload: list[int]):
+    maybes = [Maybe.of(payload) for _ in range(length)]
+    return lambda: Maybe.fold(maybes, concat)
+
+
+@case("monoid.reduce")
+def monoid_reduce(length: int, payload: list[int]):
+    maybes = [Maybe.of(payload) for _ in range(length)]
+
+    def run():
+        result = maybes[0]
+        for maybe in maybes[1:]:
+            result = result.combined(maybe, concat)
+        return result
+
+    return run
+
+
+@case("context.pipe", baseline="plain.loop")
+def context_pipe(length: int, payload: list[int]):
+    context = Context(step)
+    for _ in range(length - 1):
+        context = context.pipe(Context(step))
+    return lambda: context(payload)
@@ -0,0 +1,133 @@
+"""-X importtime으로 모듈별 임포트 시간을 측정해 시작 시간 회귀를 확인함
+
+python -m benchmarks.importtime [--repeat 5] [--budget 모듈:배율 ...]
+예산을 넘거나 무거운 모듈을 불러오는 모듈이 있으면 종료 코드 1을 반환하므로 CI에서 그대로 쓸 수 있음.
+site가 미리 불러오는 모듈에 가려지지 않도록 -S로 실행하고, 컴파일 시간이 섞이지 않도록 바이트코드를
+임시 디렉터리에 캐시한 뒤 측정함.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+MODULES = [
+    "monads",
+    "monads.maybe",
+    "monads.result",
+    "monads.delay",
+    "monads.state",
+    "monads.context",
+]
+
+BUDGETS = {
+    "monads": 0.1,
+    "monads.maybe": 0.75,
+    "monads.result": 0.75,
+    "monads.delay": 0.75,
+    "monads.state": 0.75,
+    "monads.context": 0.75,
+}
+"""모듈별 기본 예산. 같은 인터프리터에서 typing을 임포트한 시간의 몇배까지 허용하는지를 나타내며,
+기계나 파이썬 버전이 달라도 같은 예산을 쓸 수 있음. --budget으로 덮어쓸 수 있음"""
+
+HEAVY = [
+    "asyncio",
+    "concurrent.futures",
+    "multiprocessing",
+    "pickle",
+    "numpy",
+    "threading",
+    "contextlib",
+    "importlib",
+    "monads.trace",
+    "monads.parallel",
+]
+"""핫패스 모듈을 임포트하는 것만으로는 불러오면 안되는 무거운 모듈들. typing이 이미 불러온 것은 제외함"""
+
+REFERENCE = "typing"
+"""모든 모듈이 먼저 불러오는 기준 모듈. 예산과 무거운 모듈 모두 이 모듈을 임포트한 뒤를 기준으로 함"""
+
+
+def probe(module: str) -> str:
+    """REFERENCE를 임포트한 뒤 module을 임포트하고, 그 사이에 새로 불러와진 무거운 모듈들을 출력하는 코드"""
+    return (
+        f"import sys, {REFERENCE}; before = set(sys.modules); import {module}; "
+        f"print(' '.join(name for name in {HEAVY!r} "
+        f"if name in sys.modules and name not in before))"
+    )
+
+
+def importtime(module: str, cache: str) -> tuple[float, float, list[str]]:
+    """module을 새 인터프리터에서 임포트한 누적 시간(ms), 그 시간의 REFERENCE 대비 비율,
+    새로 불러와진 무거운 모듈들을 반환함
+
+    누적 시간에는 부모 패키지를 임포트한 시간도 포함되며 REFERENCE를 임포트한 시간은 빠짐.
+    """
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": cache}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    process = subprocess.run(
+        [sys.executable, "-S", "-X", "importtime", "-c", probe(module)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    parts = module.split(".")
+    packages = {".".join(parts[:index]) for index in range(1, len(parts) + 1)}
+    cumulative = reference = 0.0
+    for line in process.stderr.splitlines():
+        _, _, fields = line.partition("import time:")
+        columns = fields.split("|")
+        if len(columns) != 3:
+            continue
+        # 들여쓰기가 없는 줄만 세야 하위 모듈이 두번 더해지지 않음
+        name = columns[2].rstrip()[1:]
+        if name in packages:
+            cumulative += int(columns[1]) / 1000
+        elif name == REFERENCE:
+            reference = int(columns[1]) / 1000
+    return cumulative, cumulative / reference, process.stdout.split()
+
+
+def budget(text: str) -> tuple[str, float]:
+    module, _, ratio = text.rpartition(":")
+    return module, float(ratio)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.importtime")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=budget,
+        nargs="*",
+        default=[],
+        help=f"모듈:{REFERENCE} 임포트 시간 대비 최대 배율",
+    )
+    args = parser.parse_args(argv)
+    budgets = {**BUDGETS, **dict(args.budget)}
+
+    failed = False
+    print(f"{'module':>16} {'ms':>8} {'ratio':>8} {'budget':>8}  heavy imports")
+    with tempfile.TemporaryDirectory() as cache:
+        for module in MODULES:
+            # 첫 실행은 바이트코드를 캐시하기 위한 것이므로 버림
+            importtime(module, cache)
+            runs = [importtime(module, cache) for _ in range(args.repeat)]
+            best = min(ms for ms, _, _ in runs)
+            ratio = min(ratio for _, ratio, _ in runs)
+            heavy = runs[0][2]
+            limit = budgets.get(module)
+            over = limit is not None and ratio > limit
+            failed |= over or bool(heavy)
+            print(
+                f"{module:>16} {best:>8.2f} {ratio:>8.2f} {limit or '':>8}  "
+                f"{' '.join(heavy)}" + ("  <- over budget" if over else "")
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
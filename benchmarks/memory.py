@@ -0,0 +1,65 @@
+"""Maybe/Result 체인의 인스턴스당 메모리와 초당 생성 객체 수 측정
+
+python -m benchmarks.memory [인스턴스 수]
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from monads.maybe import Maybe
+from monads.result import Result, Success
+
+
+def increase(value: int) -> int:
+    return value + 1
+
+
+def maybe_chain(length: int) -> Maybe[int]:
+    maybe = Maybe.of(0)
+    for _ in range(length):
+        maybe = maybe.map(increase)
+    return maybe
+
+
+def result_chain(length: int) -> Result[int]:
+    result: Result[int] = Success(0)
+    for _ in range(length):
+        result = result.bind(increase)
+    return result
+
+
+def retained(factory: Callable[[], object], count: int) -> float:
+    """살아있는 인스턴스 count개가 차지하는 인스턴스당 바이트"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [factory() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    size -= sys.getsizeof(kept)
+    return size / count
+
+
+def rate(chain: Callable[[int], object], length: int = 100_000) -> float:
+    """체인 한 단계마다 인스턴스 하나가 생기므로 초당 단계 수가 곧 초당 생성 객체 수"""
+    start = time.perf_counter()
+    chain(length)
+    return length / (time.perf_counter() - start)
+
+
+def main(count: int = 100_000):
+    cases: dict[str, tuple[Callable[[], object], Callable[[int], object]]] = {
+        "Maybe.map": (lambda: Maybe.of(1), maybe_chain),
+        "Result.bind": (lambda: Success(1), result_chain),
+    }
+    print(f"{'case':>12} {'bytes/obj':>10} {'objects/s':>12}")
+    for name, (factory, chain) in cases.items():
+        size = retained(factory, count)
+        objects = max(rate(chain) for _ in range(3))
+        print(f"{name:>12} {size:>10.1f} {objects:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
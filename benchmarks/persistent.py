@@ -0,0 +1,59 @@
+"""큰 상태를 State로 갱신할 때 dict 복사, 제자리 수정, PMap의 스텝당 시간 비교
+
+python -m benchmarks.persistent [키 수] [스텝 수]
+"""
+
+import sys
+from typing import Callable
+
+from . import measure
+from monads.persistent import PMap
+from monads.state import State
+
+
+def chain(steps: int, update: Callable[[object, int], object]) -> State:
+    def step(index: int):
+        return lambda _: State.modify(lambda state: update(state, index))
+
+    state: State = State.of(None)
+    for index in range(steps):
+        state = state.bind(step(index))
+    return state
+
+
+def copy_dict(state: dict, index: int) -> dict:
+    state = dict(state)
+    state[index] = -index
+    return state
+
+
+def in_place(state: dict, index: int) -> dict:
+    state[index] = -index
+    return state
+
+
+def persistent(state: PMap, index: int) -> PMap:
+    return state.set(index, -index)
+
+
+def main(keys: int = 100_000, steps: int = 1_000):
+    initial = {index: index for index in range(keys)}
+    pmap = PMap(initial)
+    cases: dict[str, tuple[Callable[[object, int], object], Callable[[], object]]] = {
+        "dict copy": (copy_dict, lambda: initial),
+        "in place": (in_place, lambda: dict(initial)),
+        "PMap.set": (persistent, lambda: pmap),
+    }
+    print(f"{keys:,} keys, {steps:,} steps")
+    print(f"{'case':>10} {'run(s)':>10} {'us/step':>10}")
+    for name, (update, state) in cases.items():
+        program = chain(steps, update)
+        elapsed = min(
+            measure(lambda: program.run(initial_state), repeat=1)
+            for initial_state in (state() for _ in range(3))
+        )
+        print(f"{name:>10} {elapsed:>10.4f} {elapsed / steps * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
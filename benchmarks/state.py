@@ -0,0 +1,45 @@
+"""State.bind 체인 길이에 따른 run 시간 측정
+
+python -m benchmarks.state [최대 스텝 수]
+스텝당 시간이 길이와 무관하게 일정하면 선형 시간으로 실행되는 것임.
+resume은 체크포인트를 남긴 체인에 스텝 하나를 이어붙여 다시 실행한 시간임.
+"""
+
+import sys
+
+from . import measure
+from monads.state import Checkpoints, State
+
+
+def increase(_: int) -> State[int, int, int]:
+    return State(lambda value: (value, value + 1))
+
+
+def build(steps: int) -> State[int, int, int]:
+    state = State[int, int, int].of(0)
+    for _ in range(steps):
+        state = state.bind(increase)
+    return state
+
+
+def main(max_steps: int = 1_000_000):
+    steps = 1_000
+    print(
+        f"{'steps':>10} {'build(s)':>10} {'run(s)':>10} {'ns/step':>10} {'resume(s)':>10}"
+    )
+    while steps <= max_steps:
+        chain = build(steps)
+        built = measure(lambda: build(steps), repeat=1)
+        elapsed = measure(lambda: chain.run(0), repeat=3)
+        checkpoints = Checkpoints(interval=1_000)
+        chain.run(0, checkpoints)
+        resumed = measure(lambda: chain.bind(increase).run(0, checkpoints), repeat=3)
+        print(
+            f"{steps:>10} {built:>10.4f} {elapsed:>10.4f} "
+            f"{elapsed / steps * 1e9:>10.1f} {resumed:>10.6f}"
+        )
+        steps *= 10
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
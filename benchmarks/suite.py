@@ -0,0 +1,57 @@
+import timeit
+from dataclasses import dataclass
+from typing import Callable
+
+Factory = Callable[[int, list[int]], Callable[[], object]]
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    factory: Factory
+    baseline: str | None = None
+    """같은 일을 모나드 없이 하는 케이스의 이름"""
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, baseline: str | None = None):
+    """(체인 길이, 페이로드)를 받아 측정할 함수를 만드는 팩토리를 등록함"""
+
+    def decorator(factory: Factory) -> Factory:
+        CASES[name] = Case(name, factory, baseline)
+        return factory
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class Measurement:
+    name: str
+    baseline: str | None
+    length: int
+    size: int
+    seconds: float
+
+    @property
+    def ns_per_stage(self) -> float:
+        return self.seconds / self.length * 1e9
+
+
+def run(
+    names: list[str], lengths: list[int], sizes: list[int], repeat: int = 5
+) -> list[Measurement]:
+    measurements: list[Measurement] = []
+    for name in names:
+        case = CASES[name]
+        for size in sizes:
+            payload = list(range(size))
+            for length in lengths:
+                func = case.factory(length, payload)
+                number, _ = timeit.Timer(func).autorange()
+                best = min(timeit.repeat(func, number=number, repeat=repeat))
+                measurements.append(
+                    Measurement(name, case.baseline, length, size, best / number)
+                )
+    return measurements
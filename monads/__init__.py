@@ -0,0 +1,47 @@
+# typing을 불러오지 않도록 직접 정의함. 타입 검사기는 이 이름을 typing.TYPE_CHECKING과 같이 취급함
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .maybe import Maybe, Nothing
+    from .result import Result, Success, Failed
+    from .delay import Delay
+    from .state import State
+    from .context import Context
+    from .stream import Stream
+    from .aio import AsyncMaybe, AsyncResult
+    from .persistent import PMap, PVector
+    from .free import Program
+
+# 이름을 처음 접근할 때 모듈을 임포트해 시작 시간을 줄임
+EXPORTS = {
+    "Maybe": ".maybe",
+    "Nothing": ".maybe",
+    "Result": ".result",
+    "Success": ".result",
+    "Failed": ".result",
+    "Delay": ".delay",
+    "State": ".state",
+    "Context": ".context",
+    "Stream": ".stream",
+    "AsyncMaybe": ".aio",
+    "AsyncResult": ".aio",
+    "PMap": ".persistent",
+    "PVector": ".persistent",
+    "Program": ".free",
+}
+
+__all__ = list(EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
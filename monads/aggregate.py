@@ -0,0 +1,179 @@
+import functools
+from collections import Counter
+from contextlib import closing
+from typing import TYPE_CHECKING, Callable, Iterable, TypeVar
+
+from .parallel import map_chunks
+from .result import ErrorCode, Failed, Result, Success
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+U = TypeVar("U")
+A = TypeVar("A")
+
+
+class Empty:
+    """executor로 나눈 청크의 Report가 아직 아무 값도 접지 않았음을 나타냄. initial은 최종 Report에서 한번만 쓰임
+
+    프로세스 풀에서 돌아온 Report도 동일성으로 비교할 수 있도록 pickle에서 되살리면 모듈의 EMPTY가 됨.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return "EMPTY"
+
+    def __repr__(self):
+        return "EMPTY"
+
+
+EMPTY = Empty()
+
+
+def key_of(error: Exception) -> str:
+    """실패를 세는 키. 코드로 된 실패는 코드별로, 나머지는 예외 클래스별로 셈"""
+    if isinstance(error, ErrorCode):
+        return str(error)
+    return type(error).__qualname__
+
+
+class Report[A]:
+    """결과들을 모은 요약
+
+    성공은 reducer로 접은 value 하나만, 실패는 처음 keep개와 종류별 개수만 남기므로
+    입력이 아무리 커도 메모리가 일정함. stopped는 fail_fast에 걸려 입력을 끝까지 처리하지 않았는지를 나타냄.
+    """
+
+    __slots__ = ("value", "successes", "failures", "first", "counts", "stopped")
+
+    def __init__(self, value: A):
+        self.value = value
+        self.successes = 0
+        self.failures = 0
+        self.first: list[Failed] = []
+        self.counts: Counter[str] = Counter()
+        self.stopped = False
+
+    def result(self) -> Result[A]:
+        """실패가 없으면 모은 값을, 있으면 첫번째 Failed를 반환함"""
+        if self.first:
+            return self.first[0]
+        return Success(self.value)
+
+    def __repr__(self):
+        return (
+            f"<Report : value={self.value!r} successes={self.successes} "
+            f"failures={self.failures} counts={dict(self.counts)} stopped={self.stopped}>"
+        )
+
+
+class Aggregator[T, A]:
+    """Result들을 하나씩 받아 Report로 모으는 누산기
+
+    aggregator = Aggregator(operator.add, 0, keep=10, fail_fast=1000)
+    report = aggregator.run(parse, lines, executor=pool)
+
+    combine은 청크별로 모은 값 두개를 합치는 함수로, 없으면 reducer를 그대로 씀.
+    reducer가 (A, A) -> A가 아니라면 executor를 쓸 때 combine을 넘겨야 하며, 이때 청크마다 initial에서
+    시작하므로 initial은 combine의 항등원이어야됨(예: 리스트를 모은다면 []).
+    """
+
+    __slots__ = ("reducer", "initial", "combine", "keep", "fail_fast")
+
+    def __init__(
+        self,
+        reducer: Callable[[A, T], A],
+        initial: A,
+        combine: Callable[[A, A], A] | None = None,
+        keep: int = 10,
+        fail_fast: int | None = None,
+    ):
+        self.reducer = reducer
+        self.initial = initial
+        self.combine = combine or reducer
+        self.keep = keep
+        self.fail_fast = fail_fast
+
+    def add(self, report: Report[A], result: Result[T]) -> bool:
+        """result를 report에 더하고, 계속 진행해도 되는지를 반환함"""
+        if not isinstance(result, Failed):
+            value = report.value
+            if value is EMPTY:
+                report.value = result.value
+            else:
+                report.value = self.reducer(value, result.value)
+            report.successes += 1
+            return True
+        report.failures += 1
+        report.counts[key_of(result.value)] += 1
+        if len(report.first) < self.keep:
+            report.first.append(result)
+        return self.proceed(report)
+
+    def merge(self, report: Report[A], other: Report[A]) -> bool:
+        if other.value is not EMPTY:
+            if report.value is EMPTY:
+                report.value = other.value
+            else:
+                report.value = self.combine(report.value, other.value)
+        report.successes += other.successes
+        report.failures += other.failures
+        report.counts.update(other.counts)
+        report.first.extend(other.first[: self.keep - len(report.first)])
+        report.stopped |= other.stopped
+        return self.proceed(report)
+
+    def proceed(self, report: Report[A]) -> bool:
+        if self.fail_fast is not None and report.failures >= self.fail_fast:
+            report.stopped = True
+            return False
+        return True
+
+    def seed(self) -> "A | Empty":
+        """executor로 나눈 청크의 Report가 시작할 값"""
+        return EMPTY if self.combine is self.reducer else self.initial
+
+    def feed(
+        self, results: Iterable[Result[T]], report: Report[A] | None = None
+    ) -> Report[A]:
+        if report is None:
+            report = Report(self.initial)
+        for result in results:
+            if not self.add(report, result):
+                break
+        return report
+
+    def run(
+        self,
+        func: Callable[[U], T],
+        iterable: Iterable[U],
+        executor: "Executor | None" = None,
+        chunksize: int = 1024,
+        window: int | None = None,
+    ) -> Report[A]:
+        """iterable의 각 원소에 func를 Result.wraps로 감싸 적용한 결과를 모음
+
+        executor가 주어지면 청크마다 따로 모은 Report를 합치며, fail_fast에 걸리면 남은 청크는 취소함.
+        ProcessPoolExecutor를 쓰려면 func와 reducer, combine이 pickle 가능해야됨.
+        """
+        if executor is None:
+            return self.feed(map(Result.wraps(func, capture_traceback=False), iterable))
+        if self.combine is not self.reducer:
+            if self.combine(self.initial, self.initial) != self.initial:
+                raise ValueError("combine을 넘기면 initial은 combine의 항등원이어야됨")
+        report = Report(self.initial)
+        chunk = functools.partial(aggregate_chunk, self, func)
+        with closing(map_chunks(chunk, iterable, executor, chunksize, window)) as parts:
+            for part in parts:
+                if not self.merge(report, part):
+                    break
+        return report
+
+
+def aggregate_chunk(
+    aggregator: Aggregator[T, A], func: Callable[[U], T], chunk: list[U]
+) -> Report[A]:
+    wrapped = Result.wraps(func, capture_traceback=False)
+    return aggregator.feed(map(wrapped, chunk), Report(aggregator.seed()))
@@ -0,0 +1,235 @@
+import asyncio
+import functools
+from inspect import isawaitable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    NamedTuple,
+    ParamSpec,
+    TypeVar,
+)
+
+from .functor import Functor
+from .maybe import Maybe
+from .result import Failed, Result, Success
+
+if TYPE_CHECKING:
+    from .policy import RetryPolicy
+
+P = ParamSpec("P")
+T = TypeVar("T")
+M = TypeVar("M")
+N = TypeVar("N")
+
+MAP = 0
+BIND = 1
+
+
+class Stage(NamedTuple):
+    """이전 단계를 가리키는 단계 노드. 체인을 늘릴 때 앞의 단계들을 복사하지 않음"""
+
+    previous: "Stage | None"
+    kind: int
+    func: Callable
+
+
+def flatten(stage: Stage | None) -> list[tuple[int, Callable]]:
+    """연결된 단계들을 실행 순서대로 풀어냄"""
+    stages: list[tuple[int, Callable]] = []
+    while stage is not None:
+        stages.append((stage.kind, stage.func))
+        stage = stage.previous
+    stages.reverse()
+    return stages
+
+
+class AsyncResult[T](Functor[Callable[[], Awaitable[Result[T]]]]):
+    """Result를 만드는 코루틴 함수와 그 뒤에 이어질 단계들을 들고있음
+
+    await 할 때마다 처음부터 다시 실행되며, 동기 함수로 된 단계는 await 없이 바로 적용됨.
+    """
+
+    __slots__ = ("stages",)
+
+    def __init__(
+        self,
+        value: Callable[[], Awaitable[Result[T]]],
+        stages: Stage | None = None,
+    ):
+        self.value = value
+        self.stages = stages
+
+    @classmethod
+    def of(cls, value: "T | Result[T]") -> "AsyncResult[T]":
+        result = value if isinstance(value, Result) else Success(value)
+
+        async def thunk():
+            return result
+
+        return AsyncResult(thunk)
+
+    @classmethod
+    def wraps(
+        cls,
+        func: Callable[P, Awaitable[N]] | None = None,
+        *,
+        policy: "RetryPolicy | None" = None,
+    ) -> "Callable[P, AsyncResult[N]]":
+        """코루틴 함수의 결과를 AsyncResult로 감쌈. policy가 주어지면 await 할 때마다 정책에 따라 재시도함"""
+        if func is None:
+            return functools.partial(cls.wraps, policy=policy)  # type: ignore
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> "AsyncResult[N]":
+            async def thunk() -> Result[N]:
+                try:
+                    return Success(await func(*args, **kwargs))
+                except Exception as e:
+                    return Failed(e)
+
+            if policy is None:
+                return AsyncResult(thunk)
+            return AsyncResult.retry(thunk, policy)
+
+        return wrapper
+
+    @classmethod
+    def retry(
+        cls, attempt: "Callable[[], Awaitable[Result[N]]]", policy: "RetryPolicy"
+    ) -> "AsyncResult[N]":
+        """await 할 때마다 attempt를 policy에 따라 성공하거나 포기할때까지 다시 실행함"""
+        return AsyncResult(functools.partial(policy.arun, attempt))
+
+    @classmethod
+    def gather(cls, *results: "AsyncResult[Any]") -> "AsyncResult[tuple]":
+        """모든 결과를 동시에 실행하고, 하나라도 실패하면 나머지를 취소하고 그 Failed를 반환함"""
+
+        async def thunk() -> Result[tuple]:
+            tasks = [asyncio.ensure_future(result.run()) for result in results]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    result = await task
+                    if isinstance(result, Failed):
+                        return result
+                return Success(tuple(task.result().value for task in tasks))
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return AsyncResult(thunk)
+
+    def bind(self, func: "Callable[[T], N | Awaitable[N]]") -> "AsyncResult[N]":
+        return AsyncResult(self.value, Stage(self.stages, MAP, func))
+
+    map = bind
+
+    def flat_bind(
+        self, func: "Callable[[T], Result[N] | AsyncResult[N] | Awaitable[Result[N]]]"
+    ) -> "AsyncResult[N]":
+        return AsyncResult(self.value, Stage(self.stages, BIND, func))
+
+    async def run(self) -> Result[T]:
+        result: Result = await self.value()
+        for kind, func in flatten(self.stages):
+            if isinstance(result, Failed):
+                return result
+            try:
+                value = func(result.value)
+                if isawaitable(value):
+                    value = await value
+            except Exception as e:
+                result = Failed(e)
+                continue
+            if kind == MAP:
+                result = Success(value)
+            elif isinstance(value, AsyncResult):
+                result = await value.run()
+            else:
+                result = value
+        return result
+
+    def __await__(self):
+        return self.run().__await__()
+
+
+class AsyncMaybe[M](Functor[Callable[[], Awaitable[Maybe[M]]]]):
+    """Maybe를 만드는 코루틴 함수와 그 뒤에 이어질 단계들을 들고있음"""
+
+    __slots__ = ("stages",)
+
+    def __init__(
+        self,
+        value: Callable[[], Awaitable[Maybe[M]]],
+        stages: Stage | None = None,
+    ):
+        self.value = value
+        self.stages = stages
+
+    @classmethod
+    def of(cls, value: "M | None | Maybe[M]") -> "AsyncMaybe[M]":
+        maybe = value if isinstance(value, Maybe) else Maybe.of(value)
+
+        async def thunk():
+            return maybe
+
+        return AsyncMaybe(thunk)
+
+    @classmethod
+    def wraps(
+        cls, func: Callable[P, Awaitable[N | None]]
+    ) -> "Callable[P, AsyncMaybe[N]]":
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> "AsyncMaybe[N]":
+            async def thunk() -> Maybe[N]:
+                return Maybe.of(await func(*args, **kwargs))
+
+            return AsyncMaybe(thunk)
+
+        return wrapper
+
+    @classmethod
+    def gather(cls, *maybes: "AsyncMaybe[Any]") -> "AsyncMaybe[tuple]":
+        """모든 값을 동시에 구하고, 하나라도 비어있으면 나머지를 취소하고 nothing을 반환함"""
+
+        async def thunk() -> Maybe[tuple]:
+            tasks = [asyncio.ensure_future(maybe.run()) for maybe in maybes]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    maybe = await task
+                    if maybe.is_nothing():
+                        return Maybe.nothing()
+                return Maybe.of(tuple(task.result().get() for task in tasks))
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return AsyncMaybe(thunk)
+
+    def map(self, func: "Callable[[M], N | None | Awaitable[N | None]]"):
+        return AsyncMaybe(self.value, Stage(self.stages, MAP, func))
+
+    def bind(
+        self, func: "Callable[[M], Maybe[N] | AsyncMaybe[N] | Awaitable[Maybe[N]]]"
+    ) -> "AsyncMaybe[N]":
+        return AsyncMaybe(self.value, Stage(self.stages, BIND, func))
+
+    async def run(self) -> Maybe[M]:
+        maybe: Maybe = await self.value()
+        for kind, func in flatten(self.stages):
+            if maybe.is_nothing():
+                return maybe
+            value = func(maybe.get())
+            if isawaitable(value):
+                value = await value
+            if kind == MAP:
+                maybe = Maybe.of(value)
+            elif isinstance(value, AsyncMaybe):
+                maybe = await value.run()
+            else:
+                maybe = value
+        return maybe
+
+    def __await__(self):
+        return self.run().__await__()
@@ -0,0 +1,266 @@
+from typing import Any, Callable, Iterable
+
+from .functor import Functor
+from .maybe import Maybe, Nothing
+from .monoid import Monoid
+from .result import IDENTITY, Failed, Result, Success
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성
+    np = None
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("MaybeArray/ResultArray는 numpy가 필요함 (pip install numpy)")
+
+
+def scatter(mask: Any, valid: Any, length: int) -> Any:
+    """mask가 참인 칸에만 valid 값을 채운 길이 length의 배열을 만듦"""
+    valid = np.asarray(valid)
+    if valid.shape[0] == length:
+        return valid
+    values = np.zeros(length, dtype=valid.dtype)
+    values[mask] = valid
+    return values
+
+
+class MaybeArray(Functor[Any], Monoid[Any]):
+    """값 배열과 유효 마스크로 Maybe 여러개를 한번에 다룸
+
+    map과 combined는 유효한 칸에만 벡터 연산을 적용하며, Maybe.map/combined와 같은 의미를 가짐.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, value: Any, mask: Any = None):
+        require_numpy()
+        value = np.atleast_1d(np.asarray(value))
+        if mask is None:
+            mask = True
+        if value.dtype == object:
+            mask = np.logical_and(mask, value != None)
+        self.value = value
+        self.mask = np.broadcast_to(np.asarray(mask, dtype=bool), value.shape)
+
+    @classmethod
+    def of(cls, value: Any, mask: Any = None) -> "MaybeArray":
+        return cls(value, mask)
+
+    @classmethod
+    def identity(cls) -> "MaybeArray":
+        require_numpy()
+        return cls(np.zeros(1), False)
+
+    @classmethod
+    def from_maybes(cls, maybes: Iterable[Maybe]) -> "MaybeArray":
+        require_numpy()
+        values = [maybe.value for maybe in maybes]
+        mask = np.fromiter((value is not None for value in values), bool, len(values))
+        if mask.all():
+            return cls(np.asarray(values), mask)
+        array = np.asarray(values, dtype=object)
+        valid = np.asarray(array[mask].tolist())
+        return cls(scatter(mask, valid, len(values)), mask)
+
+    def to_maybes(self) -> list[Maybe]:
+        return [
+            Maybe.of(value) if valid else Nothing
+            for value, valid in zip(self.value.tolist(), self.mask.tolist())
+        ]
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index: int) -> Maybe:
+        if self.mask[index]:
+            return Maybe.of(self.value[index].item())
+        return Nothing
+
+    def is_nothing(self) -> Any:
+        return ~self.mask
+
+    def or_else(self, fill: Any) -> Any:
+        return np.where(self.mask, self.value, fill)
+
+    def map(self, func: Callable[[Any], Any]) -> "MaybeArray":
+        """func는 유효한 칸만 모은 배열을 받는 벡터 함수여야됨"""
+        if self.mask.all():
+            return MaybeArray(func(self.value))
+        valid = func(self.value[self.mask])
+        return MaybeArray(scatter(self.mask, valid, len(self)), self.mask)
+
+    def bind(self, func: "Callable[[Any], MaybeArray]") -> "MaybeArray":
+        """func는 유효한 칸만 모은 배열을 받아 같은 길이의 MaybeArray를 반환해야됨"""
+        if self.mask.all():
+            return func(self.value)
+        inner = func(self.value[self.mask])
+        mask = self.mask.copy()
+        mask[self.mask] = inner.mask
+        return MaybeArray(scatter(self.mask, inner.value, len(self)), mask)
+
+    def combined(
+        self, other: "MaybeArray", operator: Callable[[Any, Any], Any]
+    ) -> "MaybeArray":
+        left, right, mask = np.broadcast_arrays(self.value, other.value, self.mask)
+        mask = mask & np.broadcast_to(other.mask, mask.shape)
+        if mask.all():
+            return MaybeArray(operator(left, right))
+        valid = operator(left[mask], right[mask])
+        return MaybeArray(scatter(mask, valid, len(mask)), mask)
+
+    def __eq__(self, obj: object) -> bool:
+        if not isinstance(obj, MaybeArray):
+            return False
+        return bool(
+            np.array_equal(self.mask, obj.mask)
+            and np.array_equal(self.value[self.mask], obj.value[obj.mask])
+        )
+
+    def __repr__(self) -> str:
+        return f"<MaybeArray : {self.value} mask={self.mask}>"
+
+
+RAISE = {"divide": "raise", "over": "raise", "invalid": "raise", "under": "ignore"}
+"""bind에서 실패로 취급할 부동소수점 오류. 스칼라 Result.bind와 결과가 같도록 언더플로는 무시함"""
+
+
+class ResultArray(Functor[Any], Monoid[Any]):
+    """값 배열과 에러 코드 배열로 Result 여러개를 한번에 다룸
+
+    codes가 0인 칸은 성공이고, k인 칸은 errors[k-1]로 실패한 칸임.
+    bind는 벡터 연산을 먼저 시도하고, 예외가 나면 칸별로 다시 실행해 실패한 칸만 Failed로 만듦.
+    """
+
+    __slots__ = ("codes", "errors")
+
+    def __init__(
+        self, value: Any, codes: Any = None, errors: tuple[Exception, ...] = ()
+    ):
+        require_numpy()
+        value = np.atleast_1d(np.asarray(value))
+        if codes is None:
+            codes = np.zeros(value.shape, dtype=np.intp)
+        self.value = value
+        self.codes = np.broadcast_to(np.asarray(codes, dtype=np.intp), value.shape)
+        self.errors = errors
+
+    @classmethod
+    def of(cls, value: Any) -> "ResultArray":
+        return cls(value)
+
+    @classmethod
+    def identity(cls) -> "ResultArray":
+        require_numpy()
+        return cls(np.zeros(1), 1, (IDENTITY.value,))
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result]) -> "ResultArray":
+        require_numpy()
+        successes: list[Any] = []
+        errors: list[Exception] = []
+        codes: list[int] = []
+        for result in results:
+            if isinstance(result, Failed):
+                errors.append(result.value)
+                codes.append(len(errors))
+            else:
+                successes.append(result.value)
+                codes.append(0)
+        ok = np.asarray(codes) == 0
+        return cls(scatter(ok, successes, len(codes)), codes, tuple(errors))
+
+    def to_results(self) -> list[Result]:
+        return [
+            Success(value) if code == 0 else Failed(self.errors[code - 1])
+            for value, code in zip(self.value.tolist(), self.codes.tolist())
+        ]
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index: int) -> Result:
+        code = self.codes[index]
+        if code == 0:
+            return Success(self.value[index].item())
+        return Failed(self.errors[code - 1])
+
+    def is_success(self) -> Any:
+        return self.codes == 0
+
+    def value_or(self, fill: Any) -> Any:
+        return np.where(self.codes == 0, self.value, fill)
+
+    def bind(self, func: Callable[[Any], Any]) -> "ResultArray":
+        """func는 성공한 칸만 모은 배열을 받는 벡터 함수여야됨
+
+        부동소수점 오류도 예외로 취급해 0으로 나누기 같은 경우가 Result.bind와 같게 실패함.
+        언더플로는 math.exp처럼 0에 가까운 값이 되는 것이 정상이므로 실패로 보지 않음.
+        """
+        ok = self.codes == 0
+        valid = self.value[ok]
+        try:
+            with np.errstate(**RAISE):
+                values = scatter(ok, func(valid), len(self))
+                return ResultArray(values, self.codes, self.errors)
+        except Exception:
+            pass
+
+        codes = self.codes.copy()
+        errors = list(self.errors)
+        successes: list[Any] = []
+        lanes = np.flatnonzero(ok)
+        with np.errstate(**RAISE):
+            for lane, value in zip(lanes.tolist(), valid):
+                try:
+                    successes.append(func(value))
+                except Exception as e:
+                    errors.append(e)
+                    codes[lane] = len(errors)
+        ok = codes == 0
+        return ResultArray(scatter(ok, successes, len(self)), codes, tuple(errors))
+
+    map = bind
+
+    def flat_bind(self, func: "Callable[[Any], ResultArray]") -> "ResultArray":
+        """func는 성공한 칸만 모은 배열을 받아 같은 길이의 ResultArray를 반환해야됨"""
+        ok = self.codes == 0
+        inner = func(self.value[ok])
+        codes = self.codes.copy()
+        offset = len(self.errors)
+        codes[ok] = np.where(inner.codes == 0, 0, inner.codes + offset)
+        ok = codes == 0
+        return ResultArray(
+            scatter(ok, inner.value[inner.codes == 0], len(self)),
+            codes,
+            self.errors + inner.errors,
+        )
+
+    def combined(
+        self, other: "ResultArray", operator: Callable[[Any, Any], Any]
+    ) -> "ResultArray":
+        """한쪽이라도 실패한 칸은 Result.combined처럼 항등원의 에러를 가짐"""
+        left, right, codes = np.broadcast_arrays(self.value, other.value, self.codes)
+        ok = (codes == 0) & (np.broadcast_to(other.codes, codes.shape) == 0)
+        if ok.all():
+            return ResultArray(operator(left, right))
+        valid = operator(left[ok], right[ok])
+        return ResultArray(
+            scatter(ok, valid, len(ok)), np.where(ok, 0, 1), (IDENTITY.value,)
+        )
+
+    def __eq__(self, obj: object) -> bool:
+        if not isinstance(obj, ResultArray):
+            return False
+        ok = self.codes == 0
+        if not np.array_equal(ok, obj.codes == 0):
+            return False
+        if not np.array_equal(self.value[ok], obj.value[ok]):
+            return False
+        return [self.errors[code - 1].__class__ for code in self.codes[~ok]] == [
+            obj.errors[code - 1].__class__ for code in obj.codes[~ok]
+        ]
+
+    def __repr__(self) -> str:
+        return f"<ResultArray : {self.value} codes={self.codes}>"
@@ -0,0 +1,223 @@
+"""개별 호출들을 모아 한번의 대량 호출로 실행하는 dataloader 방식의 데코레이터
+
+@Result.batched(size=100)
+def fetch(ids: list[int]) -> list[User | Exception]: ...
+
+first, second = fetch(1), fetch(2)  # 아직 호출하지 않은 Delay
+first.run()  # fetch([1, 2]) 한번으로 둘 다 채워짐
+
+대량 호출 함수는 키 목록을 받아 같은 순서의 값 목록이나 키로 찾는 Mapping을 반환해야됨.
+각 값의 None과 예외 인스턴스는 그 키의 Nothing/Failed가 되고, Mapping에 없는 키는 KeyError로 실패함.
+대량 호출 자체가 예외를 던지면 그 배치의 모든 키가 실패함.
+"""
+
+import functools
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    TypeVar,
+)
+
+from .delay import Delay
+from .maybe import Maybe, Nothing
+from .result import Failed, Success
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .aio import AsyncMaybe, AsyncResult
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+PENDING = object()
+
+
+def lift_maybe(value: object) -> Maybe:
+    if value is None or isinstance(value, Exception):
+        return Nothing
+    return Maybe(value)
+
+
+def fail_maybe(error: Exception) -> Maybe:
+    return Nothing
+
+
+def lift_result(value: object):
+    if isinstance(value, Exception):
+        return Failed(value)
+    return Success(value)
+
+
+KINDS: dict[str, tuple[Callable[[object], Any], Callable[[Exception], Any]]] = {
+    "Maybe": (lift_maybe, fail_maybe),
+    "Result": (lift_result, Failed),
+}
+
+
+def align(keys: list, values: "Iterable | Mapping") -> list:
+    """대량 호출의 반환값을 keys와 같은 순서의 목록으로 맞춤"""
+    if isinstance(values, Mapping):
+        return [values.get(key, KeyError(key)) for key in keys]
+    values = list(values)
+    if len(values) != len(keys):
+        raise ValueError(f"{len(keys)}개의 키에 대해 {len(values)}개의 값을 반환함")
+    return values
+
+
+class Slot:
+    """배치 안의 키 하나. 배치가 실행되면 그 키의 Maybe/Result가 채워짐"""
+
+    __slots__ = ("batcher", "value")
+
+    def __init__(self, batcher: "Batcher"):
+        self.batcher = batcher
+        self.value: Any = PENDING
+
+    def get(self):
+        if self.value is PENDING:
+            self.batcher.flush()
+        return self.value
+
+
+class Batcher[K, V]:
+    """키 하나씩 호출되면 Delay를 반환하고, 모인 키들을 한번의 대량 호출로 실행함
+
+    배치는 size개가 모이거나, 반환된 Delay 중 하나가 실행될 때 나감. 같은 배치 안의 같은 키는 한번만 요청함.
+    """
+
+    def __init__(
+        self,
+        func: "Callable[[list[K]], Iterable[V | None | Exception] | Mapping[K, V | None | Exception]]",
+        kind: str,
+        size: int = 100,
+    ):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.lift, self.fail = KINDS[kind]
+        self.size = size
+        self.lock = threading.Lock()
+        # 대량 호출이 끝나기 전에 그 배치의 Delay를 실행한 스레드는 이 락에서 기다림
+        self.flushing = threading.Lock()
+        self.pending: dict[K, Slot] = {}
+
+    def __call__(self, key: K) -> "Delay[[], Any]":
+        with self.lock:
+            slot = self.pending.get(key)
+            if slot is None:
+                slot = self.pending[key] = Slot(self)
+            full = len(self.pending) >= self.size
+        if full:
+            self.flush()
+        return Delay(slot.get)
+
+    def flush(self):
+        """모인 키들을 지금 대량 호출로 실행함"""
+        with self.flushing:
+            with self.lock:
+                batch, self.pending = self.pending, {}
+            if not batch:
+                return
+            keys = list(batch)
+            try:
+                values = align(keys, self.func(keys))
+            except Exception as e:
+                failed = self.fail(e)
+                for slot in batch.values():
+                    slot.value = failed
+                return
+            for slot, value in zip(batch.values(), values):
+                slot.value = self.lift(value)
+
+    def __repr__(self) -> str:
+        return f"<Batcher : {self.func!r} size={self.size} pending={len(self.pending)}>"
+
+
+class AsyncBatcher[K, V]:
+    """코루틴 함수를 위한 Batcher. 반환된 AsyncMaybe/AsyncResult를 await 하면 키가 배치에 들어감
+
+    배치는 size개가 모이거나, 이벤트 루프가 한바퀴 돌아 같은 틱에 들어온 키들이 모두 모였을 때 나감.
+    하나의 이벤트 루프 안에서만 써야됨.
+    """
+
+    def __init__(
+        self,
+        func: "Callable[[list[K]], Awaitable[Iterable[V | None | Exception] | Mapping[K, V | None | Exception]]]",
+        kind: str,
+        size: int = 100,
+    ):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.kind = kind
+        self.lift, self.fail = KINDS[kind]
+        self.size = size
+        self.pending: "dict[K, asyncio.Future]" = {}
+        self.tasks: "set[asyncio.Task]" = set()
+
+    def __call__(self, key: K) -> "AsyncMaybe[V] | AsyncResult[V]":
+        from .aio import AsyncMaybe, AsyncResult
+
+        async def thunk():
+            import asyncio
+
+            # 같은 키를 기다리는 다른 호출이 있을 수 있으므로 취소가 공유된 퓨처로 번지지 않게 함
+            return await asyncio.shield(self.load(key))
+
+        return (AsyncMaybe if self.kind == "Maybe" else AsyncResult)(thunk)
+
+    def load(self, key: K) -> "asyncio.Future":
+        import asyncio
+
+        future = self.pending.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = self.pending[key] = loop.create_future()
+        if len(self.pending) == 1:
+            loop.call_soon(self.dispatch)
+        elif len(self.pending) >= self.size:
+            self.dispatch()
+        return future
+
+    def dispatch(self):
+        import asyncio
+
+        batch, self.pending = self.pending, {}
+        if batch:
+            task = asyncio.ensure_future(self.settle(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def settle(self, batch: "dict[K, asyncio.Future]"):
+        keys = list(batch)
+        try:
+            try:
+                values = [
+                    self.lift(value) for value in align(keys, await self.func(keys))
+                ]
+            except Exception as e:
+                values = [self.fail(e)] * len(keys)
+            for future, value in zip(batch.values(), values):
+                if not future.done():
+                    future.set_result(value)
+        finally:
+            # 대량 호출이 취소되면 기다리던 호출들도 취소함
+            for future in batch.values():
+                future.cancel()
+
+    def __repr__(self) -> str:
+        return f"<AsyncBatcher : {self.func!r} size={self.size} pending={len(self.pending)}>"
+
+
+def batched(kind: str, func: Callable, size: int) -> "Batcher | AsyncBatcher":
+    from inspect import iscoroutinefunction
+
+    if iscoroutinefunction(func):
+        return AsyncBatcher(func, kind, size)
+    return Batcher(func, kind, size)
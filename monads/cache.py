@@ -0,0 +1,268 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generic,
+    Hashable,
+    NamedTuple,
+    ParamSpec,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Future
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+
+
+class Policy:
+    """캐시 저장소와 축출 규칙을 정의함. Memo가 락을 잡은 상태에서만 호출됨"""
+
+    evictions: int = 0
+
+    def get(self, key: Hashable) -> object:
+        """값이 없으면 MISSING을 반환해야됨"""
+        ...
+
+    def put(self, key: Hashable, value: object) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class LRU(Policy):
+    """가장 오래 사용되지 않은 값부터 maxsize개를 넘지 않게 축출함"""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Hashable, object] = OrderedDict()
+
+    def get(self, key: Hashable):
+        value = self.entries.get(key, MISSING)
+        if value is not MISSING:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: object):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class TTL(Policy):
+    """저장된지 seconds초가 지난 값은 만료시킴. maxsize를 주면 오래된 순서로 축출함"""
+
+    def __init__(
+        self,
+        seconds: float,
+        maxsize: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.seconds = seconds
+        self.maxsize = maxsize
+        self.clock = clock
+        self.entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: Hashable):
+        entry = self.entries.get(key)
+        if entry is None:
+            return MISSING
+        expires, value = entry
+        if expires <= self.clock():
+            del self.entries[key]
+            self.evictions += 1
+            return MISSING
+        return value
+
+    def put(self, key: Hashable, value: object):
+        self.entries.pop(key, None)
+        self.entries[key] = (self.clock() + self.seconds, value)
+        if self.maxsize is not None:
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class MaxBytes(Policy):
+    """값의 크기 합이 max_bytes를 넘지 않도록 가장 오래 사용되지 않은 값부터 축출함
+
+    기본 sizeof인 sys.getsizeof는 얕은 크기만 재므로, 큰 객체들을 담은 리스트도 수십 바이트로 셈.
+    컨테이너나 사용자 객체를 캐시한다면 깊은 크기를 재는 sizeof를 넘겨야됨.
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[object], int] = sys.getsizeof):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.size = 0
+        self.entries: OrderedDict[Hashable, tuple[int, object]] = OrderedDict()
+
+    def get(self, key: Hashable):
+        entry = self.entries.get(key)
+        if entry is None:
+            return MISSING
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, value: object):
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= old[0]
+        self.entries[key] = (size, value)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.size -= evicted
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+
+KWARGS = object()
+"""키워드 인자 앞에 두는 구분자. 위치 인자만으로는 만들 수 없어 f(1, a=2)와 f((1,), ...)의 키가 겹치지 않음"""
+
+
+def make_key(args: tuple, kwargs: dict) -> Hashable:
+    if not kwargs:
+        return args
+    return (*args, KWARGS, frozenset(kwargs.items()))
+
+
+class Memo(Generic[P, T]):
+    """호출 인자를 키로 결과를 캐시하는 콜러블
+
+    같은 키를 동시에 요청하면 하나의 호출만 실행되고 나머지는 그 결과를 기다림.
+    예외는 캐시되지 않고 기다리던 호출자 모두에게 전달됨.
+    코루틴 함수는 acall로 불러야 코루틴 객체가 아니라 기다린 결과가 캐시됨.
+    """
+
+    def __init__(self, func: Callable[P, T], policy: Policy | None = None):
+        import threading
+
+        self.func = func
+        self.policy = policy if policy is not None else LRU()
+        self.lock = threading.Lock()
+        self.inflight: "dict[Hashable, Future]" = {}
+        self.tasks: "dict[Hashable, asyncio.Future]" = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        key = make_key(args, kwargs)
+        with self.lock:
+            value = self.policy.get(key)
+            if value is not MISSING:
+                self.hits += 1
+                return value  # type: ignore
+            future = self.inflight.get(key)
+            if future is None:
+                from concurrent.futures import Future
+
+                self.misses += 1
+                future = self.inflight[key] = Future()
+                leader = True
+            else:
+                self.hits += 1
+                leader = False
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = self.func(*args, **kwargs)
+        except BaseException as e:
+            with self.lock:
+                del self.inflight[key]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            self.policy.put(key, value)
+            del self.inflight[key]
+        future.set_result(value)
+        return value
+
+    async def acall(self, *args: P.args, **kwargs: P.kwargs):
+        """__call__과 같지만 반환값이 awaitable이면 기다린 결과를 캐시함
+
+        같은 키를 동시에 기다리는 호출들은 하나의 태스크를 공유하며, 하나가 취소되어도 태스크는 계속됨.
+        """
+        import asyncio
+
+        key = make_key(args, kwargs)
+        with self.lock:
+            value = self.policy.get(key)
+            if value is not MISSING:
+                self.hits += 1
+                return value
+            task = self.tasks.get(key)
+            if task is None:
+                self.misses += 1
+                task = asyncio.ensure_future(self.resolve(key, args, kwargs))
+                self.tasks[key] = task
+            else:
+                self.hits += 1
+        return await asyncio.shield(task)
+
+    async def resolve(self, key: Hashable, args: tuple, kwargs: dict):
+        # func가 Pipeline/All이면 단계마다 기다려야 하므로 Delay.arun과 같은 경로로 부름
+        from .delay import call_async
+
+        try:
+            value = await call_async(self.func, args, kwargs)
+        except BaseException:
+            with self.lock:
+                del self.tasks[key]
+            raise
+        with self.lock:
+            self.policy.put(key, value)
+            del self.tasks[key]
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(
+                self.hits, self.misses, self.policy.evictions, len(self.policy)
+            )
+
+    def cache_clear(self):
+        with self.lock:
+            self.policy.clear()
+            self.hits = self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<Memo : {self.func!r}>"
@@ -0,0 +1,125 @@
+"""Maybe/Result 체인을 빈 값 확인이 인라인된 함수 하나로 컴파일함
+
+pipeline = Maybe.compile(lambda maybe: maybe.map(parse).bind(lookup).map(str))
+pipeline(raw)  # Maybe.of(raw).map(parse).bind(lookup).map(str)와 같음
+
+체인은 한번만 기록되고, 같은 모양(모나드 종류와 연산 순서)의 체인은 생성된 코드를 공유함.
+"""
+
+import functools
+from typing import Any, Callable
+
+from . import flags
+from .maybe import Maybe, Nothing
+from .result import Failed, Success
+
+
+class Recorder:
+    """모나드 대신 넘겨져 체인의 연산과 함수를 기록함"""
+
+    __slots__ = ("kind", "operations", "funcs")
+
+    def __init__(self, kind: str, operations: tuple[str, ...] = (), funcs: tuple = ()):
+        self.kind = kind
+        self.operations = operations
+        self.funcs = funcs
+
+    def record(self, operation: str, func: Callable) -> "Recorder":
+        if operation not in OPERATIONS[self.kind]:
+            raise AttributeError(f"{self.kind}.compile은 {operation}을 지원하지 않음")
+        return Recorder(self.kind, self.operations + (operation,), self.funcs + (func,))
+
+    def map(self, func: Callable) -> "Recorder":
+        return self.record("map", func)
+
+    def bind(self, func: Callable) -> "Recorder":
+        return self.record("bind", func)
+
+    def flat_bind(self, func: Callable) -> "Recorder":
+        return self.record("flat_bind", func)
+
+
+OPERATIONS = {
+    "Maybe": ("map", "bind"),
+    "Result": ("bind", "flat_bind"),
+}
+
+
+def maybe_source(operations: tuple[str, ...]) -> list[str]:
+    lines = ["if value is None:", "    return Nothing"]
+    for index, operation in enumerate(operations):
+        if operation == "map":
+            lines.append(f"value = f{index}(value)")
+        else:
+            lines.append(f"value = f{index}(value).value")
+        lines += ["if value is None:", "    return Nothing"]
+    return lines + ["return Maybe(value)"]
+
+
+def result_source(operations: tuple[str, ...]) -> list[str]:
+    lines: list[str] = []
+    index = 0
+    while index < len(operations):
+        if operations[index] == "flat_bind":
+            lines += [
+                f"result = f{index}(value)",
+                "if isinstance(result, Failed):",
+                "    return result",
+                "value = result.value",
+            ]
+            index += 1
+            continue
+        # 연속된 bind는 하나의 try로 묶음
+        lines.append("try:")
+        while index < len(operations) and operations[index] == "bind":
+            lines.append(f"    value = f{index}(value)")
+            index += 1
+        lines += ["except Exception as e:", "    return Failed(e)"]
+    return lines + ["return Success(value)"]
+
+
+@functools.cache
+def factory(kind: str, operations: tuple[str, ...]) -> Callable[..., Callable]:
+    """체인 모양마다 한번 코드를 생성해, 단계 함수들을 받아 컴파일된 함수를 만드는 팩토리를 반환함"""
+    body = (maybe_source if kind == "Maybe" else result_source)(operations)
+    funcs = ", ".join(f"f{index}" for index in range(len(operations)))
+    source = "\n".join(
+        [
+            f"def factory(interpret, {funcs}):",
+            "    def compiled(value):",
+            "        if flags.tracing:",
+            "            return interpret(value)",
+            *(f"        {line}" for line in body),
+            "    return compiled",
+        ]
+    )
+    namespace: dict[str, Any] = {
+        "flags": flags,
+        "Maybe": Maybe,
+        "Nothing": Nothing,
+        "Success": Success,
+        "Failed": Failed,
+    }
+    filename = f"<monads.compiler {kind} {'.'.join(operations)}>"
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["factory"]
+
+
+def compile_chain(kind: str, build: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    recorder = build(Recorder(kind))
+    if not isinstance(recorder, Recorder) or recorder.kind != kind:
+        raise TypeError(
+            f"{kind}.compile에 넘긴 함수는 받은 {kind}에 이어붙인 체인을 반환해야됨"
+        )
+    start: Callable[[Any], Any] = Maybe.of if kind == "Maybe" else Success
+
+    def interpret(value: Any):
+        # 트레이서가 켜져있으면 모나드를 그대로 실행해 단계별 기록을 남김
+        monad = start(value)
+        for operation, func in zip(recorder.operations, recorder.funcs):
+            monad = getattr(monad, operation)(func)
+        return monad
+
+    compiled = factory(kind, recorder.operations)(interpret, *recorder.funcs)
+    compiled.__qualname__ = f"{kind}.compile({getattr(build, '__qualname__', build)})"
+    return compiled
@@ -1,8 +1,22 @@
 import functools
-from typing import Callable, ParamSpec, TypeVar
+import itertools
+from contextvars import ContextVar, copy_context
+from types import GeneratorType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Hashable,
+    ParamSpec,
+    TypeVar,
+)
 
 from .functor import Functor
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
 P = ParamSpec("P")
 # C = TypeVar("C")
 T = TypeVar("T")
@@ -10,6 +24,8 @@ N = TypeVar("N")
 
 
 class Context[C, T](Functor[Callable[[C], T]]):
+    __slots__ = ()
+
     def __call__(self, context: C):
         return self.value(context)
 
@@ -23,12 +39,289 @@ class Context[C, T](Functor[Callable[[C], T]]):
 
         return wrapper
 
+    @classmethod
+    def provider(
+        cls, factory: "Callable[[C], T | Generator[T, None, None]]"
+    ) -> "Provider[C,T]":
+        """컨텍스트 객체마다 한번만 계산되는 Context를 만드는 데코레이터
+
+        factory가 제너레이터 함수면 처음 yield한 값을 사용하고, 스코프가 닫힐 때 나머지를 실행해 정리함.
+        정리가 필요한 제너레이터 provider는 Context.scope 안에서만 사용할 수 있음.
+        """
+        return Provider(factory)
+
+    @classmethod
+    def scope(cls, context: C) -> "Scope[C]":
+        """with 블록 동안 context에 대한 provider 값을 캐시하고, 블록이 끝나면 생성 역순으로 정리함"""
+        return Scope(context)
+
+    @classmethod
+    def gather(
+        cls,
+        *contexts: "Context[C, Any]",
+        max_concurrency: int | None = None,
+        executor: "Executor | None" = None,
+    ) -> "Context[C, tuple]":
+        """같은 컨텍스트를 읽는 독립적인 컨텍스트들을 동시에 실행해 결과를 튜플로 반환함
+
+        코루틴 함수로 된 컨텍스트가 하나라도 있으면 결과 컨텍스트도 코루틴 함수가 되어 asyncio로 실행하고
+        (동기 컨텍스트는 asyncio.to_thread로), 아니면 스레드에서 실행함.
+        executor가 없으면 모듈이 처음 쓸 때 만들어 계속 재사용하는 스레드풀에서 실행하며,
+        동시에 실행되는 수는 max_concurrency로 제한되고, 하나가 실패하면 아직 시작하지 않은 것들을 취소하고
+        그 예외를 그대로 던짐. 이미 실행중인 스레드는 멈출 수 없으므로 끝날때까지 돌지만 결과는 버려짐.
+        """
+        from inspect import iscoroutinefunction
+
+        if any(iscoroutinefunction(context.value) for context in contexts):
+
+            async def gathered(context: C):
+                return await run_tasks(contexts, context, max_concurrency)
+
+            return Context(gathered)
+
+        def wrapper(context: C):
+            return run_threads(contexts, context, max_concurrency, executor)
+
+        return Context(wrapper)
+
+    def zip(
+        self, *others: "Context[C, Any]", max_concurrency: int | None = None
+    ) -> "Context[C, tuple]":
+        return Context.gather(self, *others, max_concurrency=max_concurrency)
+
     def bind(self, other: "Context[C,N]"):
         def wrapper(context: C):
             self(context)
             return other(context)
 
-        return Context[C, N](wrapper)
+        return Context(wrapper)
 
     def pipe(self, other: "Context[T,N]"):
-        return Context[C, N](lambda c: other(self(c)))
+        return Context(lambda c: other(self(c)))
+
+
+@functools.cache
+def default_executor() -> "Executor":
+    """executor 없이 gather/zip을 부를 때 쓰는 공유 스레드풀. 호출마다 스레드를 만들고 없애지 않음"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(thread_name_prefix="monads.context")
+
+
+def run_threads(
+    readers: "tuple[Context, ...]",
+    context: Any,
+    max_concurrency: int | None,
+    executor: "Executor | None",
+) -> tuple:
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    window = max_concurrency or len(readers)
+    pool = executor or default_executor()
+    results: list[Any] = [None] * len(readers)
+    queue = iter(enumerate(readers))
+    futures: "dict[Future, int]" = {}
+
+    def submit():
+        for index, reader in itertools.islice(queue, 1):
+            # 호출한 쪽의 contextvar(열려있는 Context.scope 등)를 그대로 보이게 함
+            futures[pool.submit(copy_context().run, reader, context)] = index
+
+    for _ in range(window):
+        submit()
+    try:
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures.pop(future)] = future.result()
+                submit()
+        return tuple(results)
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def run_tasks(
+    readers: "tuple[Context, ...]", context: Any, max_concurrency: int | None
+) -> tuple:
+    import asyncio
+    from inspect import iscoroutinefunction
+
+    semaphore = asyncio.Semaphore(max_concurrency or len(readers) or 1)
+
+    async def evaluate(reader: Context):
+        async with semaphore:
+            if iscoroutinefunction(reader.value):
+                return await reader(context)
+            return await asyncio.to_thread(reader, context)
+
+    tasks = [asyncio.ensure_future(evaluate(reader)) for reader in readers]
+    try:
+        for task in asyncio.as_completed(tasks):
+            await task
+        return tuple(task.result() for task in tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def create(factory: Callable, context: Any) -> tuple[Any, Callable[[], None] | None]:
+    value = factory(context)
+    if not isinstance(value, GeneratorType):
+        return value, None
+    generator = value
+    value = next(generator)
+
+    def teardown():
+        try:
+            next(generator)
+        except StopIteration:
+            return
+        raise RuntimeError(f"{factory!r} provider는 한번만 yield 해야됨")
+
+    return value, teardown
+
+
+def finalize(teardowns: list[Callable[[], None]]):
+    errors: list[Exception] = []
+    while teardowns:
+        try:
+            teardowns.pop()()
+        except Exception as e:
+            errors.append(e)
+    if errors:
+        raise errors[0]
+
+
+def compute_once(
+    values: "dict[Hashable, T]",
+    pending: "dict[Hashable, tuple[int, Future]]",
+    key: Hashable,
+    compute: Callable[[], T],
+) -> T:
+    """values에 key가 없으면 compute로 한번만 계산해 채움
+
+    같은 key를 동시에 찾는 호출들은 먼저 시작한 계산을 기다리며, 계산하는 동안에는 아무 락도 잡지 않으므로
+    compute 안에서 다른 스레드가 같은 캐시의 다른 key를 찾아도 막히지 않음.
+    """
+    try:
+        return values[key]
+    except KeyError:
+        pass
+    import threading
+    from concurrent.futures import Future
+
+    owner = threading.get_ident()
+    future: Future = Future()
+    leader, running = pending.setdefault(key, (owner, future))
+    if running is not future:
+        if leader == owner:
+            raise RuntimeError(f"{key!r}를 계산하는 중에 자기 자신을 다시 찾음")
+        return running.result()
+    try:
+        # pending에 들어가기 직전에 먼저 시작한 계산이 끝났을 수 있음
+        value = values[key] if key in values else compute()
+    except BaseException as e:
+        del pending[key]
+        future.set_exception(e)
+        raise
+    values[key] = value
+    del pending[key]
+    future.set_result(value)
+    return value
+
+
+scopes: ContextVar[tuple["Scope", ...]] = ContextVar("monads.context", default=())
+
+
+class Scope[C]:
+    """한 컨텍스트 객체(보통 요청 하나)에 묶인 provider 캐시"""
+
+    def __init__(self, context: C):
+        self.context = context
+        self.values: dict[Provider, Any] = {}
+        self.pending: "dict[Hashable, tuple[int, Future]]" = {}
+        self.teardowns: list[Callable[[], None]] = []
+        self.token = None
+
+    def get(self, provider: "Provider[C, T]") -> T:
+        return compute_once(
+            self.values,
+            self.pending,
+            provider,
+            functools.partial(self.create, provider),
+        )
+
+    def create(self, provider: "Provider[C, T]") -> T:
+        value, teardown = create(provider.value, self.context)
+        if teardown is not None:
+            self.teardowns.append(teardown)
+        return value
+
+    def close(self):
+        self.values.clear()
+        finalize(self.teardowns)
+
+    def __enter__(self) -> "Scope[C]":
+        self.token = scopes.set((*scopes.get(), self))
+        return self
+
+    def __exit__(self, *exc_info):
+        scopes.reset(self.token)
+        self.close()
+
+
+class Provider[C, T](Context[C, T]):
+    """컨텍스트 객체마다 값을 한번만 계산해 캐시하는 Context
+
+    같은 컨텍스트로 열린 스코프 안에서는 스코프에 캐시하고, 밖에서는 provider가 컨텍스트 객체의 id로 캐시해
+    컨텍스트가 수거될 때 weakref.finalize로 지움. 컨텍스트 객체는 건드리지 않으며 ==가 같은 다른 객체나
+    복사본과 값을 공유하지 않음. 값이 컨텍스트를 참조하면 컨텍스트가 수거되지 않으므로 그런 값과
+    약한 참조를 만들 수 없는 컨텍스트(dict, __weakref__ 없는 __slots__ 등)는 Context.scope 안에서 써야됨.
+    """
+
+    __slots__ = ("values", "pending", "scoped")
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+    def __init__(self, factory: "Callable[[C], T | Generator[T, None, None]]"):
+        from inspect import isgeneratorfunction
+
+        self.value = factory
+        self.values: dict[int, T] = {}
+        self.pending: "dict[Hashable, tuple[int, Future]]" = {}
+        # 제너레이터의 정리는 컨텍스트가 수거되는 시점이 아니라 스코프가 닫힐 때 해야됨
+        self.scoped = isgeneratorfunction(factory)
+
+    def __call__(self, context: C) -> T:
+        for scope in reversed(scopes.get()):
+            if scope.context is context:
+                return scope.get(self)
+        if self.scoped:
+            raise RuntimeError(
+                f"{self.value!r}는 정리가 필요한 provider라 Context.scope 안에서만 사용할 수 있음"
+            )
+        return compute_once(
+            self.values,
+            self.pending,
+            id(context),
+            functools.partial(self.create, context),
+        )
+
+    def create(self, context: C) -> T:
+        import weakref
+
+        try:
+            # 컨텍스트가 수거되면 같은 id를 가진 다른 객체가 이 값을 받지 않도록 바로 지움
+            forget = weakref.finalize(context, self.values.pop, id(context), None)
+        except TypeError as e:
+            raise TypeError(
+                f"{type(context).__name__}는 약한 참조를 만들 수 없어 캐시할 수 없음. "
+                "Context.scope(context) 안에서 실행해야됨"
+            ) from e
+        try:
+            return self.value(context)
+        except BaseException:
+            forget.detach()
+            raise
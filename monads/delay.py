@@ -1,8 +1,13 @@
-from typing import Callable, Generic, ParamSpec, TypeVar
+import functools
+import sys
+from typing import TYPE_CHECKING, Any, Callable, ParamSpec, TypeVar
 
+from .cache import CacheInfo, Memo, Policy
 from .functor import Functor
 from .monoid import Monoid
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
 
 P = ParamSpec("P")
 Q = ParamSpec("Q")
@@ -10,34 +15,255 @@ T = TypeVar("T")
 N = TypeVar("N")
 
 
+def fuse(funcs: list[Callable]) -> Callable:
+    """연속된 map 함수들을 하나의 호출로 합성함"""
+    if len(funcs) == 1:
+        return funcs[0]
+    stages = tuple(funcs)
+
+    def fused(value):
+        for func in stages:
+            value = func(value)
+        return value
+
+    return fused
+
+
+def unwrap(func: Callable, args: tuple, kwargs: dict):
+    """__call__로 인자가 묶인 Pipeline/All/Memo를 꺼내 인자와 함께 반환함"""
+    if isinstance(func, functools.partial) and isinstance(
+        func.func, (Pipeline, All, Memo)
+    ):
+        return func.func, (*func.args, *args), {**func.keywords, **kwargs}
+    return func, args, kwargs
+
+
+def evaluate_on(executor: "Executor", func: Callable, args: tuple, kwargs: dict):
+    func, args, kwargs = unwrap(func, args, kwargs)
+    if isinstance(func, (Pipeline, All)):
+        return func.call_on(executor, *args, **kwargs)
+    return func(*args, **kwargs)
+
+
+async def call_async(func: Callable, args: tuple, kwargs: dict):
+    """func를 호출해 awaitable이면 기다림
+
+    Memo는 기다린 결과를 캐시하고, Pipeline은 단계마다 기다리며, All은 딜레이들을 동시에 기다림.
+    """
+    from inspect import isawaitable
+
+    func, args, kwargs = unwrap(func, args, kwargs)
+    if isinstance(func, (Pipeline, All, Memo)):
+        return await func.acall(*args, **kwargs)
+    value = func(*args, **kwargs)
+    if isawaitable(value):
+        value = await value
+    return value
+
+
+def run_pickled(data: bytes):
+    import pickle
+
+    return pickle.loads(data).run()
+
+
+def is_process_pool(executor: "Executor") -> bool:
+    # 프로세스 풀을 쓰고 있다면 이미 임포트되어 있으므로, 확인하려고 multiprocessing을 불러오지 않음
+    process = sys.modules.get("concurrent.futures.process")
+    return process is not None and isinstance(executor, process.ProcessPoolExecutor)
+
+
+class All:
+    """서로 독립적인 딜레이들을 실행해 결과를 튜플로 모으는 콜러블
+
+    그냥 호출하면 순서대로 실행하고, call_on으로 호출하면 각 딜레이를 executor에 나눠 실행하며,
+    await 하면(acall) 각 딜레이를 asyncio.gather로 동시에 기다림.
+    """
+
+    __slots__ = ("delays",)
+
+    def __init__(self, delays: "tuple[Delay[[], Any], ...]"):
+        self.delays = delays
+
+    def __call__(self) -> tuple:
+        return tuple(delay.run() for delay in self.delays)
+
+    async def acall(self) -> tuple:
+        import asyncio
+
+        return tuple(await asyncio.gather(*(delay.arun() for delay in self.delays)))
+
+    def submit(self, executor: "Executor", delay: "Delay[[], Any]") -> "Future":
+        if not is_process_pool(executor):
+            return executor.submit(delay.run)
+        import pickle
+
+        try:
+            data = pickle.dumps(delay)
+        except Exception as e:
+            raise TypeError(
+                f"{delay!r}는 pickle 할 수 없어 프로세스 풀로 보낼 수 없음. "
+                "람다나 지역 함수 대신 모듈 최상위 함수를 사용해야됨"
+            ) from e
+        return executor.submit(run_pickled, data)
+
+    def call_on(self, executor: "Executor") -> tuple:
+        futures: "list[Future]" = []
+        try:
+            for delay in self.delays:
+                futures.append(self.submit(executor, delay))
+            return tuple(future.result() for future in futures)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def __repr__(self) -> str:
+        return f"<All : {len(self.delays)} delays>"
+
+
+class Pipeline:
+    """딜레이의 map/bind 단계를 클로저 대신 연결 리스트로 쌓아두는 콜러블
+
+    처음 호출될 때 연결을 평평한 목록으로 풀고 연속된 map을 합성해 캐시하며,
+    이후에는 루프로 실행하므로 단계 수와 상관없이 스택 깊이가 일정함.
+    """
+
+    __slots__ = ("source", "stage", "bind", "plan")
+
+    def __init__(self, source: Callable, stage: Callable, bind: bool):
+        self.source = source
+        self.stage = stage
+        self.bind = bind
+        self.plan: tuple[Callable, list[tuple[bool, Callable]]] | None = None
+
+    def compile(self):
+        stages: list[tuple[bool, Callable]] = []
+        node: Callable = self
+        while isinstance(node, Pipeline):
+            stages.append((node.bind, node.stage))
+            node = node.source
+        stages.reverse()
+
+        plan: list[tuple[bool, Callable]] = []
+        maps: list[Callable] = []
+        for bind, stage in stages:
+            if not bind:
+                maps.append(stage)
+                continue
+            if maps:
+                plan.append((False, fuse(maps)))
+                maps = []
+            plan.append((True, stage))
+        if maps:
+            plan.append((False, fuse(maps)))
+        return node, plan
+
+    def __call__(self, *args, **kwargs):
+        if self.plan is None:
+            self.plan = self.compile()
+        root, stages = self.plan
+        value = root(*args, **kwargs)
+        for bind, stage in stages:
+            value = stage(value).run() if bind else stage(value)
+        return value
+
+    def call_on(self, executor: "Executor", *args, **kwargs):
+        """__call__과 같지만 루트와 bind가 반환한 딜레이 안의 All을 executor로 실행함"""
+        if self.plan is None:
+            self.plan = self.compile()
+        root, stages = self.plan
+        value = evaluate_on(executor, root, args, kwargs)
+        for bind, stage in stages:
+            value = stage(value).run_on(executor) if bind else stage(value)
+        return value
+
+    def __getstate__(self):
+        return self.source, self.stage, self.bind
+
+    def __setstate__(self, state):
+        self.source, self.stage, self.bind = state
+        self.plan = None
+
+    async def acall(self, *args, **kwargs):
+        """__call__과 같지만 루트나 단계가 awaitable을 반환하면 기다렸다가 이어감"""
+        from inspect import isawaitable
+
+        if self.plan is None:
+            self.plan = self.compile()
+        root, stages = self.plan
+        value = await call_async(root, args, kwargs)
+        for bind, stage in stages:
+            if bind:
+                value = await stage(value).arun()
+                continue
+            value = stage(value)
+            if isawaitable(value):
+                value = await value
+        return value
+
+    def __repr__(self) -> str:
+        root, stages = self.plan or self.compile()
+        return f"<Pipeline : {root!r} -> {len(stages)} stages>"
+
+
 class Delay(Functor[Callable[P, T]], Monoid[Callable[P, T]]):
+    __slots__ = ()
+
     @classmethod
     def of(cls, func: Callable[P, T]):
         return cls(func)
 
+    @classmethod
+    def memo(cls, policy: Policy | None = None):
+        """인자별로 결과를 캐시하는 딜레이를 만드는 데코레이터"""
+
+        def decorator(func: Callable[Q, N]) -> "Delay[Q,N]":
+            return Delay(Memo(func, policy))
+
+        return decorator
+
     @classmethod
     def identity(cls) -> "Delay[[N],N]":
         return Delay(lambda x: x)
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs):
-        return Delay(lambda: self.value(*args, **kwargs))
+        return Delay(functools.partial(self.value, *args, **kwargs))
 
     def run(self, *args: P.args, **kwargs: P.kwargs):
         return self.value(*args, **kwargs)
 
-    def map(self, func: "Callable[[T],N]") -> "Delay[P,N]":
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> N:
-            t_value = self.run(*args, **kwargs)
-            return func(t_value)
+    def cached(self, policy: Policy | None = None) -> "Delay[P,T]":
+        return Delay(Memo(self.value, policy))
 
-        return Delay[P, N](wrapper)
+    def cache_info(self) -> CacheInfo:
+        if not isinstance(self.value, Memo):
+            raise TypeError("cached 혹은 memo로 만든 딜레이가 아님")
+        return self.value.cache_info()
 
-    def bind(self, delay: "Callable[[T],Delay[[],N]]") -> "Delay[P,N]":
-        def combine(*args: P.args, **kwargs: P.kwargs) -> N:
-            t_value = self.run(*args, **kwargs)
-            return delay(t_value).run()
+    async def arun(self, *args: P.args, **kwargs: P.kwargs):
+        """코루틴 함수를 감싼 딜레이도 실행할 수 있는 비동기 run"""
+        return await call_async(self.value, args, kwargs)
+
+    def __await__(self):
+        return self.arun().__await__()
 
-        return Delay[P, N](combine)
+    @classmethod
+    def all(cls, *delays: "Delay[[], Any]") -> "Delay[[], tuple]":
+        """독립적인 딜레이들의 결과를 튜플로 모으는 딜레이. run_on으로 실행하면 병렬로 실행됨"""
+        return Delay(All(delays))
+
+    def run_on(self, executor: "Executor", *args: P.args, **kwargs: P.kwargs) -> T:
+        """run과 같지만 Delay.all로 묶인 독립적인 딜레이들을 executor에서 동시에 실행함
+
+        ProcessPoolExecutor로 보낼 딜레이는 pickle 할 수 있어야 하며, 그렇지 않으면 TypeError가 남.
+        """
+        return evaluate_on(executor, self.value, args, kwargs)
+
+    def map(self, func: "Callable[[T],N]") -> "Delay[P,N]":
+        return Delay(Pipeline(self.value, func, False))
+
+    def bind(self, delay: "Callable[[T],Delay[[],N]]") -> "Delay[P,N]":
+        return Delay(Pipeline(self.value, delay, True))
 
     def combined(
         self,
@@ -0,0 +1,4 @@
+"""핫패스가 무거운 모듈을 임포트하지 않고 읽는 전역 플래그들"""
+
+tracing = 0
+"""켜져있는 트레이서 수. 0이면 모나드들은 monads.trace를 임포트하지도 contextvar를 읽지도 않고 바로 실행함"""
@@ -0,0 +1,363 @@
+"""효과가 있는 프로그램을 실행하지 않고 데이터로 기술한 뒤, 실행 방식을 고를 수 있게 하는 프리 모나드
+
+def profile(user_id: int) -> Program[tuple]:
+    return Program.fetch(users, user_id).bind(
+        lambda user: Program.all(Program.fetch(posts, user.id), Program.effect(avatar, user.id))
+    )
+
+program = Program.all(*(profile(id) for id in ids))
+program.run()                  # Direct: 효과를 만나는 즉시 하나씩 실행
+program.run(Batch())           # 라운드마다 모인 fetch를 한번에 부르고 같은 효과는 한번만 실행
+program.run(Concurrent(pool))  # Program.all의 가지들을 스레드 풀에서 동시에 실행
+
+fetch의 bulk는 monads.batch와 같이 키 목록을 받아 같은 순서의 값 목록이나 Mapping을 반환해야 하며,
+값이 예외 인스턴스면 그 키를 기다리는 프로그램에서 예외로 던져짐. 어느 인터프리터든 효과의 예외는 run 밖으로 전파됨.
+"""
+
+import functools
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Mapping, TypeVar
+
+from .batch import align
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+T = TypeVar("T")
+N = TypeVar("N")
+K = TypeVar("K", bound=Hashable)
+
+
+class Program[T]:
+    """Pure, Effect, Fetch, Bind, All 노드로 이루어진 프로그램. 만드는 것만으로는 아무것도 실행하지 않음"""
+
+    __slots__ = ()
+
+    @classmethod
+    def pure(cls, value: N) -> "Program[N]":
+        return Pure(value)
+
+    of = pure
+
+    @classmethod
+    def effect(cls, func: Callable[..., N], *args: Any) -> "Program[N]":
+        """func(*args)를 실행하는 효과. Batch는 같은 func와 인자의 효과를 한번만 실행함"""
+        return Effect(func, args)
+
+    @classmethod
+    def fetch(
+        cls,
+        bulk: "Callable[[list[K]], Iterable[N | Exception] | Mapping[K, N | Exception]]",
+        key: K,
+    ) -> "Program[N]":
+        """bulk로 key 하나를 가져오는 효과. Batch는 한 라운드의 같은 bulk를 한번의 호출로 묶음"""
+        return Fetch(bulk, key)
+
+    @classmethod
+    def all(cls, *programs: "Program[Any]") -> "Program[tuple]":
+        """서로 독립적인 프로그램들의 결과를 튜플로 모음"""
+        return All(programs)
+
+    def bind(self, func: "Callable[[T], Program[N]]") -> "Program[N]":
+        return Bind(self, func)
+
+    def map(self, func: Callable[[T], N]) -> "Program[N]":
+        return Bind(self, functools.partial(lift, func))
+
+    def run(self, interpreter: "Direct | Batch | None" = None) -> T:
+        return (interpreter or DIRECT).run(self)
+
+
+def lift(func: Callable, value: object) -> "Pure":
+    return Pure(func(value))
+
+
+class Pure(Program[T]):
+    __slots__ = ("value",)
+
+    def __init__(self, value: T):
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"<Pure : {self.value!r}>"
+
+
+class Effect(Program[T]):
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., T], args: tuple):
+        self.func = func
+        self.args = args
+
+    def perform(self) -> T:
+        return self.func(*self.args)
+
+    def __repr__(self) -> str:
+        return f"<Effect : {self.func!r}{self.args!r}>"
+
+
+class Fetch(Program[T]):
+    __slots__ = ("bulk", "key")
+
+    def __init__(self, bulk: Callable[[list], Any], key: Hashable):
+        self.bulk = bulk
+        self.key = key
+
+    def perform(self) -> T:
+        return settle(align([self.key], self.bulk([self.key]))[0])
+
+    def __repr__(self) -> str:
+        return f"<Fetch : {self.bulk!r}[{self.key!r}]>"
+
+
+class Bind(Program[T]):
+    __slots__ = ("program", "func")
+
+    def __init__(self, program: Program, func: Callable[[Any], Program[T]]):
+        self.program = program
+        self.func = func
+
+    def __repr__(self) -> str:
+        return f"<Bind : {self.program!r} -> {self.func!r}>"
+
+
+class All(Program[tuple]):
+    __slots__ = ("programs",)
+
+    def __init__(self, programs: tuple[Program, ...]):
+        self.programs = programs
+
+    def __repr__(self) -> str:
+        return f"<All : {len(self.programs)} programs>"
+
+
+def settle(value: object):
+    if isinstance(value, Exception):
+        raise value
+    return value
+
+
+class Direct:
+    """효과를 만나는 즉시 순서대로 실행함
+
+    Bind 체인은 루프로 풀어 실행하므로 길이와 상관없이 스택 깊이가 일정함.
+    """
+
+    def run(self, program: Program[T]) -> T:
+        funcs: list[Callable[[Any], Program]] = []
+        node: Program = program
+        while True:
+            while isinstance(node, Bind):
+                funcs.append(node.func)
+                node = node.program
+            if isinstance(node, Pure):
+                value = node.value
+            elif isinstance(node, All):
+                value = self.all(node.programs)
+            else:
+                value = node.perform()  # type: ignore
+            if not funcs:
+                return value
+            node = funcs.pop()(value)
+
+    def all(self, programs: tuple[Program, ...]) -> tuple:
+        return tuple(self.run(program) for program in programs)
+
+
+DIRECT = Direct()
+
+
+class Concurrent(Direct):
+    """Direct와 같지만 Program.all의 가지들을 executor에서 동시에 실행함
+
+    가지 안의 continuation은 보통 람다이므로 스레드 풀을 써야됨.
+    """
+
+    def __init__(self, executor: "Executor"):
+        self.executor = executor
+
+    def all(self, programs: tuple[Program, ...]) -> tuple:
+        from contextvars import copy_context
+
+        if len(programs) < 2:
+            return super().all(programs)
+        futures = [
+            self.executor.submit(copy_context().run, self.run, program)
+            for program in programs[1:]
+        ]
+        try:
+            values = [self.run(programs[0])]
+            for future, program in zip(futures, programs[1:]):
+                # 아직 시작하지 않은 가지는 직접 실행해, 풀의 스레드가 모두 중첩된 가지를 기다리며 멈추지 않게 함
+                values.append(self.run(program) if future.cancel() else future.result())
+            return tuple(values)
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+class Request:
+    """Batch의 한 실행에서 같은 효과를 기다리는 프로그램들이 공유하는 결과"""
+
+    __slots__ = ("node", "done", "value", "error")
+
+    def __init__(self, node: "Effect | Fetch"):
+        self.node = node
+        self.done = False
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+    def resolve(self, value: object):
+        self.value = value
+        self.done = True
+
+    def fail(self, error: BaseException):
+        self.error = error
+        self.done = True
+
+    def result(self):
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class Wait(Program[T]):
+    """Batch가 효과 자리에 남겨두는 노드. 다음 라운드에서 요청의 결과로 바뀜"""
+
+    __slots__ = ("request",)
+
+    def __init__(self, request: Request):
+        self.request = request
+
+
+class Blocked(Program[T]):
+    """Session.step이 효과에 막힌 노드와 그 뒤에 실행할 continuation 스택을 함께 남겨두는 노드
+
+    다음 라운드는 스택을 Bind로 다시 감싸지 않고 그대로 이어받으므로 라운드마다 체인 길이만큼 일하지 않음.
+    """
+
+    __slots__ = ("node", "funcs")
+
+    def __init__(self, node: Program, funcs: list[Callable[[Any], Program]]):
+        self.node = node
+        self.funcs = funcs
+
+
+class Batch:
+    """Haxl 방식으로 프로그램을 라운드 단위로 실행함
+
+    각 라운드에서 모든 가지를 효과에 막힐 때까지 진행시킨 뒤, 모인 fetch는 bulk별로 한번에,
+    효과는 같은 func와 인자끼리 한번만 실행함. 한 실행 안에서 이미 얻은 결과는 다시 요청하지 않음.
+    executor가 주어지면 한 라운드의 호출들을 동시에 실행함.
+    """
+
+    def __init__(self, executor: "Executor | None" = None):
+        self.executor = executor
+
+    def run(self, program: Program[T]) -> T:
+        session = Session()
+        node = session.step(program)
+        while not isinstance(node, Pure):
+            session.flush(self.executor)
+            node = session.step(node)
+        return node.value
+
+
+class Session:
+    """Batch의 한 실행 동안의 요청들"""
+
+    __slots__ = ("requests", "pending")
+
+    def __init__(self):
+        self.requests: dict[Hashable, Request] = {}
+        self.pending: list[Request] = []
+
+    def request(self, node: "Effect | Fetch") -> Request:
+        if isinstance(node, Fetch):
+            key: Hashable = (Fetch, node.bulk, node.key)
+        else:
+            key = (Effect, node.func, node.args)
+        try:
+            request = self.requests.get(key)
+        except TypeError:
+            # 인자를 해시할 수 없는 효과는 합치지 않음
+            key = request = None
+        if request is None:
+            request = Request(node)
+            if key is not None:
+                self.requests[key] = request
+            self.pending.append(request)
+        return request
+
+    def step(self, node: Program) -> Program:
+        """node를 효과에 막힐 때까지 진행시켜, 끝났으면 Pure를 아니면 남은 프로그램을 반환함"""
+        funcs: list[Callable[[Any], Program]] = []
+        if isinstance(node, Blocked):
+            funcs, node = node.funcs, node.node
+        while True:
+            while isinstance(node, Bind):
+                funcs.append(node.func)
+                node = node.program
+            if isinstance(node, (Effect, Fetch)):
+                node = Wait(self.request(node))
+            if isinstance(node, Wait):
+                if not node.request.done:
+                    break
+                node = Pure(node.request.result())
+            elif isinstance(node, All):
+                programs = [self.step(program) for program in node.programs]
+                if not all(isinstance(program, Pure) for program in programs):
+                    node = All(tuple(programs))
+                    break
+                node = Pure(tuple(program.value for program in programs))  # type: ignore
+            if not funcs:
+                return node
+            node = funcs.pop()(node.value)  # type: ignore
+        return Blocked(node, funcs) if funcs else node
+
+    def flush(self, executor: "Executor | None"):
+        """모인 요청들을 bulk별로 묶어 실행하고 결과를 채움"""
+        pending, self.pending = self.pending, []
+        fetches: dict[Callable, list[Request]] = {}
+        calls: list[Callable[[], None]] = []
+        for request in pending:
+            if isinstance(request.node, Fetch):
+                fetches.setdefault(request.node.bulk, []).append(request)
+            else:
+                calls.append(functools.partial(perform, request))
+        calls += [
+            functools.partial(perform_bulk, bulk, requests)
+            for bulk, requests in fetches.items()
+        ]
+        if executor is None or len(calls) < 2:
+            for call in calls:
+                call()
+            return
+        futures = [executor.submit(call) for call in calls]
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def perform(request: Request):
+    try:
+        value = request.node.perform()
+    except Exception as e:
+        request.fail(e)
+        return
+    request.resolve(value)
+
+
+def perform_bulk(bulk: Callable[[list], Any], requests: list[Request]):
+    keys = [request.node.key for request in requests]  # type: ignore
+    try:
+        values = align(keys, bulk(keys))
+    except Exception as e:
+        values = [e] * len(keys)
+    for request, value in zip(requests, values):
+        if isinstance(value, Exception):
+            request.fail(value)
+        else:
+            request.resolve(value)
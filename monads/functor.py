@@ -14,15 +14,23 @@ class Functor[V]:
     ex) Maybe * Endofunctor => Maybe
     """
 
+    __slots__ = ("value",)
+
     value: V
 
     def __init__(self, value: V):
         self.value = value
 
     def __eq__(self, obj: object):
+        if obj is self:
+            return True
         if isinstance(obj, self.__class__):
             return self.value == obj.value
         return False
 
     def __repr__(self):
         return f"<{self.__class__.__name__} : {self.value}>"
+
+
+set_value = Functor.value.__set__  # type: ignore
+"""__setattr__를 막은 불변 하위 클래스가 생성자에서 value를 채울 때 쓰는 슬롯 디스크립터"""
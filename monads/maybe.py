@@ -1,10 +1,15 @@
-from abc import ABC, abstractmethod
 import functools
-from typing import Callable, ParamSpec, Self, TypeVar
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, ParamSpec, TypeVar
 
-from .functor import Functor
+from . import flags
+from .functor import Functor, set_value
 from .monoid import Monoid
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .batch import AsyncBatcher, Batcher
+
 P = ParamSpec("P")
 M = TypeVar("M")
 N = TypeVar("N")
@@ -12,13 +17,38 @@ L = TypeVar("L")
 
 
 class Maybe[M](Functor[M | None], Monoid[M | None]):
+    """값이 없을 수 있는 불변 값
+
+    값이 해시 가능하면 Maybe도 해시 가능하며, 해시는 처음 계산할 때 캐시해 메모나 집합의 키로 바로 쓸 수 있음.
+    """
+
+    __slots__ = ("_hash",)
     __cls_key = object()
 
     def __init__(self, value: M | None):
-        self.value = value
+        set_value(self, value)
+
+    def __setattr__(self, name: str, value: object):
+        raise AttributeError(f"{type(self).__name__}는 불변 객체임")
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return Maybe.of, (self.value,)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        hashed = hash((Maybe, self.value))
+        set_hash(self, hashed)
+        return hashed
 
     @classmethod
     def of(cls, value: N | None) -> "Maybe[N]":
+        if value is None:
+            return Nothing
         return Maybe(value)
 
     @classmethod
@@ -27,21 +57,21 @@ class Maybe[M](Functor[M | None], Monoid[M | None]):
 
     @classmethod
     def just(cls, value: N) -> "Maybe[N]":
-        return Maybe[N].of(value)
+        return Maybe(value)
 
     @classmethod
     def nothing(cls) -> "Maybe[M]":
-        return Maybe[M].of(None)
+        return Nothing
 
     def is_nothing(self):
-        return self.get() == None
+        return self.value is None
 
     @classmethod
     def call(cls, callable: Callable[[], N]) -> "Maybe[N]":
         try:
             return Maybe.of(callable())
         except:
-            return Maybe.of(None)
+            return Nothing
 
     @classmethod
     def wraps(cls, callable: Callable[P, N | None]) -> "Callable[P,Maybe[N]]":
@@ -51,26 +81,106 @@ class Maybe[M](Functor[M | None], Monoid[M | None]):
 
         return wrapper
 
+    @classmethod
+    def batched(
+        cls,
+        func: "Callable[[list[L]], Iterable[N | None] | Mapping[L, N | None]] | None" = None,
+        *,
+        size: int = 100,
+    ) -> "Batcher[L, N] | AsyncBatcher[L, N]":
+        """키 목록을 받는 대량 호출 함수를 키 하나씩 부를 수 있게 감싸, 호출들을 모아 한번에 실행함
+
+        호출은 Delay[[], Maybe[N]]를 반환하며 size개가 모이거나 하나가 실행될 때 배치가 나감.
+        코루틴 함수는 AsyncMaybe를 반환하고, 같은 틱에 await 된 호출들이 한 배치가 됨.
+        각 값의 None과 예외 인스턴스는 그 키의 Nothing이 됨. 자세한 건 monads.batch 참고.
+        """
+        if func is None:
+            return functools.partial(cls.batched, size=size)  # type: ignore
+        from .batch import batched
+
+        return batched("Maybe", func, size)
+
+    @classmethod
+    def compile(
+        cls, build: "Callable[[Maybe[M]], Maybe[N]]"
+    ) -> "Callable[[M | None], Maybe[N]]":
+        """map/bind 체인을 단계마다 Maybe를 만들지 않는 함수 하나로 컴파일함
+
+        build는 받은 Maybe에 체인을 이어붙여 반환해야 하며 한번만 호출됨.
+        반환된 함수 f의 f(value)는 build(Maybe.of(value))와 같음.
+        """
+        from .compiler import compile_chain
+
+        return compile_chain("Maybe", build)
+
+    @classmethod
+    def traverse(
+        cls,
+        func: "Callable[[L], Maybe[N]]",
+        iterable: Iterable[L],
+        executor: "Executor | None" = None,
+        chunksize: int = 1024,
+    ) -> "Maybe[list[N]]":
+        """각 원소에 func를 적용해 모두 값이 있으면 Maybe[list]를, 하나라도 비어있으면 nothing을 반환함
+
+        executor가 주어지면 청크 단위로 나눠 병렬로 실행하며, nothing이 확인되면 남은 청크는 취소함.
+        """
+        from contextlib import closing
+
+        from .parallel import map_chunks
+
+        values: list[N] = []
+        chunk = functools.partial(traverse_chunk, func)
+        with closing(map_chunks(chunk, iterable, executor, chunksize)) as results:
+            for result in results:
+                if result is None:
+                    return Maybe.nothing()
+                values.extend(result)
+        return Maybe.of(values)
+
+    @classmethod
+    def sequence(cls, maybes: "Iterable[Maybe[N]]") -> "Maybe[list[N]]":
+        return cls.traverse(lambda maybe: maybe, maybes)
+
     def get(self):
         return self.value
 
     def map(self, callable: Callable[[M], N]) -> "Maybe[N]":
-        value = self.get()
-        if value == None:
-            return Maybe.of(None)
-        new_value = callable(value)
-        return Maybe.of(new_value)
+        value = self.value
+        if value is None:
+            if flags.tracing:
+                from . import trace
+
+                trace.skip("Maybe.map", callable)
+            return Nothing
+        if flags.tracing:
+            from . import trace
+
+            new_value = trace.call("Maybe.map", callable, value, outcome=outcome)
+        else:
+            new_value = callable(value)
+        if new_value is None:
+            return Nothing
+        return Maybe(new_value)
 
     def bind(self, func: "Callable[[M], Maybe[N]]") -> "Maybe[N]":
-        value = self.get()
-        if value == None:
-            return Maybe.nothing()
+        value = self.value
+        if value is None:
+            if flags.tracing:
+                from . import trace
+
+                trace.skip("Maybe.bind", func)
+            return Nothing
+        if flags.tracing:
+            from . import trace
+
+            return trace.call("Maybe.bind", func, value, outcome=outcome)
         return func(value)
 
     def combined(self, other: "Maybe[N]", operator: "Callable[[M,N],L]"):
-        if self.is_nothing() or other.is_nothing():
-            return self.__class__.nothing()
-        return Maybe.of(operator(self.or_else_throw(), other.or_else_throw()))
+        if self.value is None or other.value is None:
+            return Nothing
+        return Maybe.of(operator(self.value, other.value))
 
     def or_else(self, orValue: N) -> "M|N":
         value = self.get()
@@ -89,3 +199,29 @@ class Maybe[M](Functor[M | None], Monoid[M | None]):
         if value:
             return value
         raise exception
+
+
+set_hash = Maybe._hash.__set__  # type: ignore
+
+Nothing: Maybe = Maybe(None)
+"""값이 없는 경우를 나타내는 공유 인스턴스. nothing과 빈 경로의 map/bind/combined는 항상 이것을 반환함"""
+
+
+def outcome(value: object) -> str:
+    from . import trace
+
+    if value is None or value is Nothing:
+        return trace.EMPTY
+    if isinstance(value, Maybe) and value.value is None:
+        return trace.EMPTY
+    return trace.OK
+
+
+def traverse_chunk(func: "Callable[[L], Maybe[N]]", chunk: list[L]) -> list[N] | None:
+    values: list[N] = []
+    for item in chunk:
+        value = func(item).value
+        if value is None:
+            return None
+        values.append(value)
+    return values
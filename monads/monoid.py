@@ -1,10 +1,16 @@
-from typing import Callable, Self, TypeVar
+import functools
+from typing import TYPE_CHECKING, Callable, Iterable, Self, TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 U = TypeVar("U")
 V = TypeVar("V")
 
 
 class Monoid[T]:
+    __slots__ = ()
+
     def __init__(self, value: T):
         self.value = value
 
@@ -21,8 +27,62 @@ class Monoid[T]:
 
     """이항연산정의"""
 
+    @classmethod
+    def fold(
+        cls,
+        monoids: "Iterable[Monoid[T]]",
+        operator: "Callable[[T, T], T]",
+        executor: "Executor | None" = None,
+        chunksize: int = 1024,
+    ) -> Self:
+        """monoids를 순서대로 combined로 합친 하나의 값을 반환하고, 비어있으면 항등원을 반환함
+
+        결합법칙을 이용해 왼쪽부터 하나씩 접지 않고 크기가 비슷한 것끼리 합치는 균형 트리로 줄이므로,
+        합칠수록 커지는 값(문자열, 리스트 등)도 전체 비용이 O(n log n)으로 유지됨.
+        executor가 주어지면 청크마다 따로 줄인 뒤 그 결과들을 다시 합치며,
+        ProcessPoolExecutor를 쓰려면 모나드의 값과 operator가 pickle 가능해야됨.
+        """
+        if executor is None:
+            result = balanced(monoids, operator)
+        else:
+            from contextlib import closing
+
+            from .parallel import map_chunks
+
+            chunk = functools.partial(fold_chunk, operator)
+            with closing(map_chunks(chunk, monoids, executor, chunksize)) as partials:
+                result = balanced(partials, operator)
+        if result is None:
+            return cls.identity()
+        return result  # type: ignore
+
+    mconcat = fold
+
     def combined(
         self, other: "Monoid[U]", operator: "Callable[[T,U],V]"
     ) -> "Monoid[V]": ...
 
     """이항연산정의"""
+
+
+def balanced(monoids: "Iterable[Monoid | None]", operator: Callable) -> "Monoid | None":
+    """이진 카운터처럼 같은 높이의 부분 결과끼리만 합쳐, 스택에는 최대 log n개만 남김"""
+    stack: list[tuple[int, Monoid]] = []
+    for monoid in monoids:
+        if monoid is None:
+            continue
+        height = 0
+        while stack and stack[-1][0] == height:
+            monoid = stack.pop()[1].combined(monoid, operator)
+            height += 1
+        stack.append((height, monoid))
+    if not stack:
+        return None
+    result = stack.pop()[1]
+    while stack:
+        result = stack.pop()[1].combined(result, operator)
+    return result
+
+
+def fold_chunk(operator: Callable, chunk: "list[Monoid]") -> "Monoid | None":
+    return balanced(chunk, operator)
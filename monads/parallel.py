@@ -0,0 +1,48 @@
+import itertools
+import os
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def map_chunks(
+    func: Callable[[list[T]], R],
+    iterable: Iterable[T],
+    executor: "Executor | None" = None,
+    chunksize: int = 1024,
+    window: int | None = None,
+) -> Iterator[R]:
+    """iterable을 chunksize씩 나눠 func를 적용한 결과를 순서대로 반환함
+
+    executor가 주어지면 최대 window개의 청크만 미리 제출해 메모리를 일정하게 유지하고,
+    소비하는 쪽이 중간에 멈추면 아직 시작하지 않은 청크는 취소함.
+    """
+    chunks = chunked(iterable, chunksize)
+    if executor is None:
+        yield from map(func, chunks)
+        return
+
+    window = window or 2 * (os.cpu_count() or 1)
+    pending: "deque[Future[R]]" = deque(
+        executor.submit(func, chunk) for chunk in itertools.islice(chunks, window)
+    )
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(executor.submit(func, chunk))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,370 @@
+from collections.abc import ItemsView, Iterable, Iterator, Mapping, Sequence
+from typing import Any, overload
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+HASH_MASK = (1 << 64) - 1
+
+MISSING: Any = object()
+
+
+class Node:
+    """HAMT의 내부 노드. bitmap에 켜진 비트 순서대로 children에 자식이 들어있음
+
+    자식은 (해시, 키, 값) 튜플이거나 Node, Collision임.
+    """
+
+    __slots__ = ("bitmap", "children")
+
+    def __init__(self, bitmap: int, children: tuple):
+        self.bitmap = bitmap
+        self.children = children
+
+
+class Collision:
+    """64비트 해시가 완전히 같은 키들"""
+
+    __slots__ = ("hash", "pairs")
+
+    def __init__(self, hash: int, pairs: tuple[tuple[Any, Any], ...]):
+        self.hash = hash
+        self.pairs = pairs
+
+
+EMPTY = Node(0, ())
+
+
+def hash_of(key: Any) -> int:
+    return hash(key) & HASH_MASK
+
+
+def lookup(node: Node, h: int, key: Any, default: Any) -> Any:
+    shift = 0
+    while True:
+        if type(node) is Collision:
+            for k, v in node.pairs:
+                if k is key or k == key:
+                    return v
+            return default
+        bit = 1 << ((h >> shift) & MASK)
+        if not node.bitmap & bit:
+            return default
+        child = node.children[(node.bitmap & (bit - 1)).bit_count()]
+        if type(child) is tuple:
+            if child[0] == h and (child[1] is key or child[1] == key):
+                return child[2]
+            return default
+        node = child
+        shift += BITS
+
+
+def merge(shift: int, a: tuple, b: tuple) -> "Node | Collision":
+    if a[0] == b[0]:
+        return Collision(a[0], ((a[1], a[2]), (b[1], b[2])))
+    ia = (a[0] >> shift) & MASK
+    ib = (b[0] >> shift) & MASK
+    if ia == ib:
+        return Node(1 << ia, (merge(shift + BITS, a, b),))
+    return Node((1 << ia) | (1 << ib), (a, b) if ia < ib else (b, a))
+
+
+def assoc(
+    node: "Node | Collision", shift: int, h: int, key: Any, value: Any
+) -> tuple["Node | Collision", bool]:
+    """key를 value로 바꾼 새 노드와 키가 새로 추가됐는지를 반환함. 바뀐 경로의 노드만 복사함"""
+    if type(node) is Collision:
+        if h != node.hash:
+            bit = 1 << ((node.hash >> shift) & MASK)
+            return assoc(Node(bit, (node,)), shift, h, key, value)
+        pairs = tuple(pair for pair in node.pairs if pair[0] != key)
+        return Collision(h, (*pairs, (key, value))), len(pairs) == len(node.pairs)
+    bit = 1 << ((h >> shift) & MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    children = node.children
+    if not node.bitmap & bit:
+        entry = (h, key, value)
+        return (
+            Node(node.bitmap | bit, (*children[:index], entry, *children[index:])),
+            True,
+        )
+    child = children[index]
+    if type(child) is tuple:
+        if child[0] == h and (child[1] is key or child[1] == key):
+            if child[2] is value:
+                return node, False
+            new, added = (h, key, value), False
+        else:
+            new, added = merge(shift + BITS, child, (h, key, value)), True
+    else:
+        new, added = assoc(child, shift + BITS, h, key, value)
+        if new is child:
+            return node, False
+    return Node(node.bitmap, (*children[:index], new, *children[index + 1 :])), added
+
+
+def dissoc(node: "Node | Collision", shift: int, h: int, key: Any) -> Any:
+    """key를 뺀 새 노드를 반환함. 키가 없으면 node를, 비게되면 None을 반환함"""
+    if type(node) is Collision:
+        if h != node.hash:
+            return node
+        pairs = tuple(pair for pair in node.pairs if pair[0] != key)
+        if len(pairs) == len(node.pairs):
+            return node
+        if len(pairs) == 1:
+            return (h, *pairs[0])
+        return Collision(h, pairs)
+    bit = 1 << ((h >> shift) & MASK)
+    if not node.bitmap & bit:
+        return node
+    index = (node.bitmap & (bit - 1)).bit_count()
+    children = node.children
+    child = children[index]
+    if type(child) is tuple:
+        if not (child[0] == h and (child[1] is key or child[1] == key)):
+            return node
+        new = None
+    else:
+        new = dissoc(child, shift + BITS, h, key)
+        if new is child:
+            return node
+        # 자식이 하나뿐인 노드는 위로 끌어올려 트리 깊이를 줄임
+        if type(new) is Node and len(new.children) == 1:
+            if type(new.children[0]) is not Node:
+                new = new.children[0]
+    if new is None:
+        if len(children) == 1:
+            return None
+        return Node(node.bitmap ^ bit, (*children[:index], *children[index + 1 :]))
+    return Node(node.bitmap, (*children[:index], new, *children[index + 1 :]))
+
+
+def entries(node: "Node | Collision") -> Iterator[tuple[Any, Any]]:
+    if type(node) is Collision:
+        yield from node.pairs
+        return
+    for child in node.children:
+        if type(child) is tuple:
+            yield child[1], child[2]
+        else:
+            yield from entries(child)
+
+
+class PMap[K, V](Mapping[K, V]):
+    """구조를 공유하는 불변 해시 맵(HAMT)
+
+    set/delete는 O(log32 n)개의 노드만 복사한 새 맵을 반환하고, 나머지 노드는 원래 맵과 공유함.
+    State로 큰 상태를 넘길 때 매 스텝 dict를 복사하지 않고도 이전 상태를 그대로 보존할 수 있음.
+    """
+
+    __slots__ = ("root", "size")
+
+    root: Node
+    size: int
+
+    def __init__(self, items: "Mapping[K, V] | Iterable[tuple[K, V]]" = ()):
+        root, size = EMPTY, 0
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            root, added = assoc(root, 0, hash_of(key), key, value)
+            size += added
+        self.root = root
+        self.size = size
+
+    @classmethod
+    def create(cls, root: Node, size: int) -> "PMap[K, V]":
+        pmap = PMap.__new__(PMap)
+        pmap.root = root
+        pmap.size = size
+        return pmap
+
+    def __getitem__(self, key: K) -> V:
+        value = lookup(self.root, hash_of(key), key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: K, default: Any = None) -> Any:
+        return lookup(self.root, hash_of(key), key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return lookup(self.root, hash_of(key), key, MISSING) is not MISSING
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[K]:
+        return (key for key, _ in entries(self.root))
+
+    def items(self) -> "Items[K, V]":
+        return Items(self)
+
+    def set(self, key: K, value: V) -> "PMap[K, V]":
+        root, added = assoc(self.root, 0, hash_of(key), key, value)
+        if root is self.root:
+            return self
+        return PMap.create(root, self.size + added)
+
+    def delete(self, key: K) -> "PMap[K, V]":
+        root = dissoc(self.root, 0, hash_of(key), key)
+        if root is self.root:
+            raise KeyError(key)
+        return PMap.create(root or EMPTY, self.size - 1)
+
+    def update(self, items: "Mapping[K, V] | Iterable[tuple[K, V]]") -> "PMap[K, V]":
+        root, size = self.root, self.size
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            root, added = assoc(root, 0, hash_of(key), key, value)
+            size += added
+        return PMap.create(root, size)
+
+    def __repr__(self):
+        return f"PMap({dict(self.items())!r})"
+
+
+class Items[K, V](ItemsView[K, V]):
+    """키마다 다시 찾지 않고 트리를 한번만 훑는 items 뷰"""
+
+    _mapping: PMap[K, V]
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        return entries(self._mapping.root)
+
+
+def new_path(level: int, node: tuple) -> tuple:
+    while level:
+        node = (node,)
+        level -= BITS
+    return node
+
+
+class PVector[T](Sequence[T]):
+    """구조를 공유하는 불변 벡터(32갈래 트라이 + 꼬리)
+
+    append는 대부분 꼬리만 복사하고, set은 O(log32 n)개의 노드만 복사한 새 벡터를 반환함.
+    """
+
+    __slots__ = ("size", "shift", "root", "tail")
+
+    size: int
+    shift: int
+    root: tuple
+    tail: tuple
+
+    def __init__(self, items: Iterable[T] = ()):
+        self.size, self.shift, self.root, self.tail = 0, BITS, (), ()
+        vector = self.extend(items)
+        self.size, self.shift, self.root, self.tail = (
+            vector.size,
+            vector.shift,
+            vector.root,
+            vector.tail,
+        )
+
+    @classmethod
+    def create(cls, size: int, shift: int, root: tuple, tail: tuple) -> "PVector[T]":
+        vector = PVector.__new__(PVector)
+        vector.size = size
+        vector.shift = shift
+        vector.root = root
+        vector.tail = tail
+        return vector
+
+    def __len__(self) -> int:
+        return self.size
+
+    def tail_offset(self) -> int:
+        return 0 if self.size < WIDTH else ((self.size - 1) >> BITS) << BITS
+
+    def leaf(self, index: int) -> tuple:
+        if index >= self.tail_offset():
+            return self.tail
+        node = self.root
+        level = self.shift
+        while level > 0:
+            node = node[(index >> level) & MASK]
+            level -= BITS
+        return node
+
+    def normalize(self, index: int) -> int:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("PVector index out of range")
+        return index
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> "PVector[T]": ...
+    def __getitem__(self, index: int | slice) -> "T | PVector[T]":
+        if isinstance(index, slice):
+            return PVector(self[i] for i in range(*index.indices(self.size)))
+        index = self.normalize(index)
+        return self.leaf(index)[index & MASK]
+
+    def __iter__(self) -> Iterator[T]:
+        for start in range(0, self.tail_offset(), WIDTH):
+            yield from self.leaf(start)
+        yield from self.tail
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PVector):
+            return NotImplemented
+        return self.size == other.size and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore
+
+    def append(self, value: T) -> "PVector[T]":
+        if len(self.tail) < WIDTH:
+            return PVector.create(
+                self.size + 1, self.shift, self.root, (*self.tail, value)
+            )
+        shift = self.shift
+        # 루트가 꽉 찼으면 한 단계 높은 루트를 만듦
+        if (self.size >> BITS) > (1 << shift):
+            root = (self.root, new_path(shift, self.tail))
+            shift += BITS
+        else:
+            root = self.push_tail(shift, self.root, self.tail)
+        return PVector.create(self.size + 1, shift, root, (value,))
+
+    def push_tail(self, level: int, parent: tuple, tail: tuple) -> tuple:
+        index = ((self.size - 1) >> level) & MASK
+        if level == BITS:
+            child = tail
+        elif index < len(parent):
+            child = self.push_tail(level - BITS, parent[index], tail)
+        else:
+            child = new_path(level - BITS, tail)
+        return (*parent[:index], child, *parent[index + 1 :])
+
+    def extend(self, items: Iterable[T]) -> "PVector[T]":
+        vector = self
+        for item in items:
+            vector = vector.append(item)
+        return vector
+
+    def set(self, index: int, value: T) -> "PVector[T]":
+        index = self.normalize(index)
+        offset = self.tail_offset()
+        if index >= offset:
+            i = index - offset
+            tail = (*self.tail[:i], value, *self.tail[i + 1 :])
+            return PVector.create(self.size, self.shift, self.root, tail)
+        return PVector.create(
+            self.size,
+            self.shift,
+            assign(self.shift, self.root, index, value),
+            self.tail,
+        )
+
+    def __repr__(self):
+        return f"PVector({list(self)!r})"
+
+
+def assign(level: int, node: tuple, index: int, value: Any) -> tuple:
+    i = (index >> level) & MASK
+    child = value if level == 0 else assign(level - BITS, node[i], index, value)
+    return (*node[:i], child, *node[i + 1 :])
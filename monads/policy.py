@@ -0,0 +1,274 @@
+"""불안정한 호출을 Result로 감쌀 때 쓰는 재시도, 데드라인, 서킷 브레이커 정책
+
+breaker = CircuitBreaker(failures=5, reset=30)
+policy = RetryPolicy(attempts=3, backoff=Backoff(0.1), deadline=2.0, breaker=breaker)
+
+@Result.wraps(policy=policy)
+def fetch(url: str) -> bytes: ...
+"""
+
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
+
+from .result import Failed, Result
+
+if TYPE_CHECKING:
+    from .aio import AsyncResult
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려있어 호출하지 않고 바로 실패함"""
+
+
+class Backoff:
+    """실패한 횟수에 따라 지수적으로 늘어나는 재시도 대기 시간
+
+    jitter=True면 0과 계산된 시간 사이에서 무작위로 골라(full jitter), 여러 워커가 같은 순간에
+    다시 몰리지 않게 함.
+    """
+
+    __slots__ = ("base", "factor", "maximum", "jitter", "random")
+
+    def __init__(
+        self,
+        base: float = 0.1,
+        factor: float = 2.0,
+        maximum: float = 10.0,
+        jitter: bool = True,
+        random: Callable[[], float] = random.random,
+    ):
+        self.base = base
+        self.factor = factor
+        self.maximum = maximum
+        self.jitter = jitter
+        self.random = random
+
+    def delay(self, failures: int) -> float:
+        delay = min(self.maximum, self.base * self.factor ** (failures - 1))
+        return delay * self.random() if self.jitter else delay
+
+
+class CircuitBreaker:
+    """여러 정책이 공유하는 서킷 브레이커
+
+    연속으로 failures번 실패하면 열려서 reset초 동안 모든 호출을 바로 실패시키고,
+    그 뒤에는 한 번의 시험 호출만 허용해 성공하면 닫히고 실패하면 다시 열림.
+    열려있는 동안의 실패는 매번 만들지 않고 rejection 하나를 공유함.
+    """
+
+    def __init__(
+        self,
+        failures: int = 5,
+        reset: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failures = failures
+        self.reset = reset
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.state = CLOSED
+        self.consecutive = 0
+        self.opened_at = 0.0
+        self.trial = False
+        self.opened = 0
+        self.rejection: Failed = Failed(CircuitOpenError("circuit breaker is open"))
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if self.clock() - self.opened_at < self.reset:
+                    return False
+                self.state = HALF_OPEN
+                self.trial = False
+            if self.trial:
+                return False
+            self.trial = True
+            return True
+
+    def succeeded(self):
+        with self.lock:
+            self.state = CLOSED
+            self.consecutive = 0
+            self.trial = False
+
+    def failed(self):
+        with self.lock:
+            self.consecutive += 1
+            if self.state == HALF_OPEN or self.consecutive >= self.failures:
+                if self.state != OPEN:
+                    self.opened += 1
+                self.state = OPEN
+                self.opened_at = self.clock()
+                self.trial = False
+
+    def summary(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive,
+                "opened": self.opened,
+            }
+
+
+class RetryMetrics:
+    """정책을 거친 호출들의 집계"""
+
+    FIELDS = (
+        "calls",
+        "attempts",
+        "successes",
+        "failures",
+        "retries",
+        "timeouts",
+        "rejected",
+    )
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = dict.fromkeys(RetryMetrics.FIELDS, 0)
+
+    def record(self, field: str):
+        with self.lock:
+            self.counts[field] += 1
+
+    def summary(self) -> dict[str, int]:
+        with self.lock:
+            return dict(self.counts)
+
+
+class RetryPolicy:
+    """Result를 반환하는 시도를 재시도, 데드라인, 서킷 브레이커와 함께 실행함
+
+    attempts는 첫 시도를 포함한 최대 시도 횟수이고, retry_on에 해당하는 실패만 재시도함.
+    deadline은 재시도와 대기를 모두 포함한 한 호출의 시간(초)으로, 넘으면 TimeoutError로 실패함.
+    동기 호출은 실행중인 시도를 중단할 수 없으므로 시도 사이에서만 확인하고,
+    비동기 호출은 남은 시간이 지나면 시도를 취소함.
+    재시도 사이의 대기는 동기 호출이면 sleep으로, 비동기 호출이면 async_sleep(기본값 asyncio.sleep)으로 함.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: Backoff | None = None,
+        deadline: float | None = None,
+        retry_on: tuple[type[Exception], ...] = (Exception,),
+        breaker: CircuitBreaker | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] | None = None,
+    ):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.deadline = deadline
+        self.retry_on = retry_on
+        self.breaker = breaker
+        self.clock = clock
+        self.sleep = sleep
+        self.async_sleep = async_sleep
+        self.metrics = RetryMetrics()
+
+    def summary(self) -> dict[str, Any]:
+        summary: dict[str, Any] = self.metrics.summary()
+        if self.breaker is not None:
+            summary["breaker"] = self.breaker.summary()
+        return summary
+
+    def admit(self) -> bool:
+        if self.breaker is None or self.breaker.allow():
+            self.metrics.record("attempts")
+            return True
+        self.metrics.record("rejected")
+        return False
+
+    def settle(self, result: Result[T]) -> bool:
+        """시도 결과를 기록하고, 성공했는지를 반환함"""
+        if isinstance(result, Failed):
+            if self.breaker is not None:
+                self.breaker.failed()
+            return False
+        if self.breaker is not None:
+            self.breaker.succeeded()
+        self.metrics.record("successes")
+        return True
+
+    def pause(self, failures: int, start: float, result: Failed) -> "float | Failed":
+        """다음 시도 전에 기다릴 시간을, 더 시도하지 않는다면 최종 실패를 반환함"""
+        if failures >= self.attempts or not isinstance(result.value, self.retry_on):
+            return self.fail(result)
+        delay = self.backoff.delay(failures) if self.backoff is not None else 0.0
+        if self.deadline is not None and self.clock() - start + delay >= self.deadline:
+            return self.timeout(result.value)
+        self.metrics.record("retries")
+        return delay
+
+    def fail(self, result: Failed) -> Failed:
+        self.metrics.record("failures")
+        return result
+
+    def timeout(self, cause: BaseException | None) -> Failed:
+        self.metrics.record("timeouts")
+        error = TimeoutError(f"{self.deadline}초 데드라인을 넘김")
+        error.__cause__ = cause
+        return self.fail(Failed(error))
+
+    def run(self, attempt: Callable[[], Result[T]]) -> Result[T]:
+        self.metrics.record("calls")
+        start = self.clock()
+        failures = 0
+        while True:
+            if not self.admit():
+                return self.fail(self.breaker.rejection)  # type: ignore
+            try:
+                result = attempt()
+            except Exception as e:
+                result = Failed(e)
+            if self.settle(result):
+                return result
+            failures += 1
+            delay = self.pause(failures, start, result)  # type: ignore
+            if isinstance(delay, Failed):
+                return delay
+            if delay:
+                self.sleep(delay)
+
+    async def arun(
+        self, attempt: "Callable[[], Awaitable[Result[T]] | AsyncResult[T]]"
+    ) -> Result[T]:
+        import asyncio
+
+        self.metrics.record("calls")
+        start = self.clock()
+        failures = 0
+        while True:
+            if not self.admit():
+                return self.fail(self.breaker.rejection)  # type: ignore
+            remaining = None
+            if self.deadline is not None:
+                remaining = self.deadline - (self.clock() - start)
+            timeout = asyncio.timeout(remaining)
+            try:
+                async with timeout:
+                    result = await attempt()
+            except Exception as e:
+                if isinstance(e, TimeoutError) and timeout.expired():
+                    if self.breaker is not None:
+                        self.breaker.failed()
+                    return self.timeout(e)
+                result = Failed(e)
+            if self.settle(result):
+                return result
+            failures += 1
+            delay = self.pause(failures, start, result)  # type: ignore
+            if isinstance(delay, Failed):
+                return delay
+            await (self.async_sleep or asyncio.sleep)(delay)
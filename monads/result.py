@@ -1,9 +1,23 @@
 import functools
-from typing import Callable, Literal, ParamSpec, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Mapping,
+    ParamSpec,
+    TypeVar,
+    overload,
+)
 
-from .functor import Functor
+from . import flags
+from .functor import Functor, set_value
 from .monoid import Monoid
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .batch import AsyncBatcher, Batcher
+    from .policy import RetryPolicy
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -12,25 +26,228 @@ V = TypeVar("V")
 N = TypeVar("N")
 
 
+class ErrorCode(Exception):
+    """정수 코드로 구분되는 가벼운 실패 사유
+
+    ErrorCode.of로 코드마다 하나의 인스턴스만 만들어 재사용하므로, 실패할 때마다 예외 객체나
+    트레이스백을 만들지 않음. 같은 코드는 항상 같은 객체이며 코드가 다르면 다른 실패로 비교됨.
+    메시지는 코드를 처음 등록할 때 정해지고 바뀌지 않으므로, 메시지가 필요하면 처음부터 메시지와 함께 등록해야됨.
+    """
+
+    codes: "dict[int, ErrorCode]" = {}
+
+    def __init__(self, code: int, message: str = ""):
+        super().__init__(code, message)
+        self.code = code
+        self.message = message
+
+    @classmethod
+    def of(cls, code: int, message: str = "") -> "ErrorCode":
+        """code의 공유 인스턴스를 반환함
+
+        message 없이 부르면 등록된 인스턴스를 그대로 반환하고, 이미 다른 메시지로 등록된 코드에
+        메시지를 주면 공유 인스턴스를 고치지 않고 ValueError를 던짐.
+        """
+        error = ErrorCode.codes.get(code)
+        if error is None:
+            error = ErrorCode.codes.setdefault(code, ErrorCode(code, message))
+        if message and message != error.message:
+            registered = repr(error.message) if error.message else "메시지 없이"
+            raise ValueError(f"{code} 코드는 이미 {registered} 등록되어 있음")
+        return error
+
+    def __str__(self):
+        return f"[{self.code}] {self.message}" if self.message else f"[{self.code}]"
+
+    def __reduce__(self):
+        return interned, (self.code, self.message)
+
+
 class Result[T](Functor[T | Exception], Monoid[T | Exception]):
+    """성공한 값이나 실패를 담는 불변 값
+
+    Failed끼리는 예외 클래스로(코드로 된 실패는 코드로) 비교하고 해시하며, 해시는 처음 계산할 때 캐시함.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, value: T | Exception):
+        set_value(self, value)
+
+    def __setattr__(self, name: str, value: object):
+        raise AttributeError(f"{type(self).__name__}는 불변 객체임")
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return self.__class__, (self.value,)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        value = self.value
+        if isinstance(value, Exception) and not isinstance(value, ErrorCode):
+            value = value.__class__
+        hashed = hash((self.__class__, value))
+        set_hash(self, hashed)
+        return hashed
+
     @classmethod
     def of(cls, value: T | Exception):
         return cls(value)
 
     @classmethod
     def identity(cls) -> "Result[T]":
-        return Failed[T].of(Exception())
+        return IDENTITY
 
+    @overload
+    @classmethod
+    def wraps(cls, func: Callable[P, N]) -> "Callable[P, Result[N]]": ...
+    @overload
+    @classmethod
+    def wraps(
+        cls,
+        *,
+        capture_traceback: bool = True,
+        codes: "Mapping[type[Exception], int] | None" = None,
+        policy: "RetryPolicy | None" = None,
+    ) -> "Callable[[Callable[P, N]], Callable[P, Result[N]]]": ...
     @classmethod
-    def wraps(cls, func: Callable[P, N]) -> "Callable[P, Result[N]]":
+    def wraps(
+        cls,
+        func: "Callable[P, N] | None" = None,
+        *,
+        capture_traceback: bool = True,
+        codes: "Mapping[type[Exception], int] | None" = None,
+        policy: "RetryPolicy | None" = None,
+    ):
+        """함수의 반환값을 Success로, 예외를 Failed로 감쌈
+
+        capture_traceback=False면 예외의 트레이스백을 버려 프레임들이 바로 해제되게 함.
+        codes에 있는 예외 클래스(하위 클래스 포함)는 예외 대신 해당 코드의 공유 Failed로 바꾸며,
+        여러 클래스에 해당하면 codes의 순서와 상관없이 MRO에서 가장 가까운 클래스의 코드를 씀.
+        policy가 주어지면 각 호출을 monads.policy.RetryPolicy의 재시도, 데드라인, 서킷 브레이커 아래에서 실행함.
+        """
+        if func is None:
+            return functools.partial(
+                cls.wraps,
+                capture_traceback=capture_traceback,
+                codes=codes,
+                policy=policy,
+            )
+        if policy is not None:
+            attempt = cls.wraps(func, capture_traceback=capture_traceback, codes=codes)
+
+            @functools.wraps(func)
+            def guarded(*args: P.args, **kwargs: P.kwargs):
+                return policy.run(functools.partial(attempt, *args, **kwargs))
+
+            return guarded
+        if capture_traceback and not codes:
+
+            @functools.wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs):
+                try:
+                    return Success(func(*args, **kwargs))
+                except Exception as e:
+                    return Failed(e)
+
+            return wrapper
+
+        coded = {error: Failed.with_code(code) for error, code in (codes or {}).items()}
+        # 예외 클래스별로 찾은 결과를 기억해 두번째부터는 딕셔너리 조회 한번으로 끝냄
+        failures: dict[type, Failed | None] = {}
+
         @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs):
+        def lightweight(*args: P.args, **kwargs: P.kwargs):
             try:
-                return Success[N].of(func(*args, **kwargs))
+                return Success(func(*args, **kwargs))
             except Exception as e:
-                return Failed.of(e)
+                kind = type(e)
+                try:
+                    failed = failures[kind]
+                except KeyError:
+                    failed = next(
+                        (coded[error] for error in kind.__mro__ if error in coded), None
+                    )
+                    failures[kind] = failed
+                if failed is not None:
+                    return failed
+                if not capture_traceback:
+                    e.__traceback__ = None
+                return Failed(e)
+
+        return lightweight
+
+    @classmethod
+    def retry(
+        cls, attempt: "Callable[[], Result[N]]", policy: "RetryPolicy"
+    ) -> "Result[N]":
+        """Result를 반환하는 attempt를 policy에 따라 성공하거나 포기할때까지 다시 실행함"""
+        return policy.run(attempt)
+
+    @classmethod
+    def batched(
+        cls,
+        func: "Callable[[list[U]], Iterable[N | Exception] | Mapping[U, N | Exception]] | None" = None,
+        *,
+        size: int = 100,
+    ) -> "Batcher[U, N] | AsyncBatcher[U, N]":
+        """키 목록을 받는 대량 호출 함수를 키 하나씩 부를 수 있게 감싸, 호출들을 모아 한번에 실행함
 
-        return wrapper
+        호출은 Delay[[], Result[N]]를 반환하며 size개가 모이거나 하나가 실행될 때 배치가 나감.
+        코루틴 함수는 AsyncResult를 반환하고, 같은 틱에 await 된 호출들이 한 배치가 됨.
+        각 값의 예외 인스턴스는 그 키의 Failed가 됨. 자세한 건 monads.batch 참고.
+        """
+        if func is None:
+            return functools.partial(cls.batched, size=size)  # type: ignore
+        from .batch import batched
+
+        return batched("Result", func, size)
+
+    @classmethod
+    def compile(
+        cls, build: "Callable[[Result[T]], Result[N]]"
+    ) -> "Callable[[T], Result[N]]":
+        """bind/flat_bind 체인을 단계마다 Result를 만들지 않는 함수 하나로 컴파일함
+
+        build는 받은 Result에 체인을 이어붙여 반환해야 하며 한번만 호출됨.
+        반환된 함수 f의 f(value)는 build(Success(value))와 같음.
+        """
+        from .compiler import compile_chain
+
+        return compile_chain("Result", build)
+
+    @classmethod
+    def traverse(
+        cls,
+        func: "Callable[[U], Result[N]]",
+        iterable: Iterable[U],
+        executor: "Executor | None" = None,
+        chunksize: int = 1024,
+    ) -> "Result[list[N]]":
+        """각 원소에 func를 적용해 모두 성공하면 Success[list]를, 아니면 첫번째 Failed를 반환함
+
+        executor가 주어지면 청크 단위로 나눠 병렬로 실행하며, 실패가 확인되면 남은 청크는 취소함.
+        """
+        from contextlib import closing
+
+        from .parallel import map_chunks
+
+        values: list[N] = []
+        chunk = functools.partial(traverse_chunk, func)
+        with closing(map_chunks(chunk, iterable, executor, chunksize)) as results:
+            for result in results:
+                if isinstance(result, Failed):
+                    return result
+                values.extend(result.value)
+        return Success(values)
+
+    @classmethod
+    def sequence(cls, results: "Iterable[Result[N]]") -> "Result[list[N]]":
+        return cls.traverse(lambda result: result, results)
 
     def bind(self, callable: Callable[[T], N]) -> "Result[N]": ...
 
@@ -38,8 +255,8 @@ class Result[T](Functor[T | Exception], Monoid[T | Exception]):
         self, other: "Result[U]", operator: Callable[[T, U], V]
     ) -> "Result[V]":
         if isinstance(self.value, Exception) or isinstance(other.value, Exception):
-            return Result.identity()
-        return Result.of(operator(self.value, other.value))
+            return IDENTITY
+        return Success(operator(self.value, other.value))
 
     def flat_bind(self, callable: "Callable[[T],Result[N]]") -> "Result[N]": ...
     def value_or(self, get: N) -> T | N: ...
@@ -47,29 +264,43 @@ class Result[T](Functor[T | Exception], Monoid[T | Exception]):
     def value_or_get(self, get: Callable[[], N]) -> T | N: ...
 
     def __eq__(self, obj: "Result[U]"):
-        eq = super().__eq__(obj)
-        if eq:
-            return eq
+        if obj is self:
+            return True
         if not isinstance(obj, self.__class__):
-            return eq
-        if isinstance(self.value, Exception) and isinstance(obj.value, Exception):
-            return self.value.__class__ == obj.value.__class__
-        return False
+            return False
+        value, other = self.value, obj.value
+        if value is other:
+            return True
+        if isinstance(value, Exception) and isinstance(other, Exception):
+            if isinstance(value, ErrorCode) or isinstance(other, ErrorCode):
+                return False
+            return value.__class__ == other.__class__
+        return value == other
 
 
 class Success(Result[T]):
+    __slots__ = ()
+
     value: T
 
     def __init__(self, value: T):
-        self.value = value
+        set_value(self, value)
 
     def bind(self, callable: Callable[[T], N]) -> "Result[N]":
         try:
-            return Success[N].of(callable(self.value))
+            if flags.tracing:
+                from . import trace
+
+                return Success(trace.call("Result.bind", callable, self.value))
+            return Success(callable(self.value))
         except Exception as e:
-            return Failed[N].of(e)
+            return Failed(e)
 
     def flat_bind(self, callable: Callable[[T], Result[N]]) -> "Result[N]":
+        if flags.tracing:
+            from . import trace
+
+            return trace.call("Result.flat_bind", callable, self.value, outcome=outcome)
         return callable(self.value)
 
     def value_or(self, get: N) -> T:
@@ -83,12 +314,32 @@ class Success(Result[T]):
 
 
 class Failed(Result[T]):
+    __slots__ = ()
+
     value: Exception
 
     def __init__(self, value: Exception):
-        self.value = value
+        set_value(self, value)
+
+    @classmethod
+    def with_code(cls, code: int, message: str = "") -> "Failed":
+        """코드마다 하나만 만들어 재사용하는 Failed. 실패 경로에서 아무것도 할당하지 않음"""
+        failed = CODES.get(code)
+        if failed is None:
+            failed = CODES.setdefault(code, Failed(ErrorCode.of(code, message)))
+        elif message:
+            ErrorCode.of(code, message)
+        return failed
+
+    @property
+    def code(self) -> int | None:
+        return self.value.code if isinstance(self.value, ErrorCode) else None
 
     def bind(self, callable: Callable[P, N]):
+        if flags.tracing:
+            from . import trace
+
+            trace.skip("Result.bind", callable)
         return self
 
     def value_or(self, get: N) -> N:
@@ -101,4 +352,39 @@ class Failed(Result[T]):
         raise throw
 
     def flat_bind(self, callable: Callable[[T], Result[N]]) -> "Result[N]":
-        return Failed.of(self.value)
+        if flags.tracing:
+            from . import trace
+
+            trace.skip("Result.flat_bind", callable)
+        return self
+
+
+def interned(code: int, message: str) -> ErrorCode:
+    """pickle에서 되살릴 때는 메시지가 달라도 이 프로세스에 등록된 인스턴스를 씀"""
+    return ErrorCode.codes.get(code) or ErrorCode.of(code, message)
+
+
+set_hash = Result._hash.__set__  # type: ignore
+
+CODES: dict[int, Failed] = {}
+
+IDENTITY: Failed = Failed(Exception())
+"""Result의 항등원. 실패한 combined는 새로 만들지 않고 항상 이것을 반환함"""
+
+
+def outcome(result: Result) -> str:
+    from . import trace
+
+    return trace.ERROR if isinstance(result, Failed) else trace.OK
+
+
+def traverse_chunk(
+    func: "Callable[[U], Result[N]]", chunk: list[U]
+) -> "Result[list[N]]":
+    values: list[N] = []
+    for item in chunk:
+        result = func(item)
+        if isinstance(result, Failed):
+            return result
+        values.append(result.value)
+    return Success(values)
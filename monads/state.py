@@ -1,23 +1,124 @@
-from typing import Callable, ParamSpec, TypeVar
+from typing import Any, Callable, ParamSpec, TypeVar
 
+from .cache import LRU, CacheInfo
 from .functor import Functor
 
-
 # 제너릭 타입 변수 정의
 P = ParamSpec("P")
 B = TypeVar("B")  # New Value
 
 
+class Checkpoints:
+    """State.run이 bind 경계에서 남기는 (값, 상태) 스냅샷의 LRU 저장소
+
+    체인은 bind마다 이전 노드를 그대로 가리키는 새 노드를 만들므로, 앞부분을 공유하는 체인을 같은
+    초기 상태로 다시 실행하면 공유된 노드 중 가장 뒤의 스냅샷부터 이어서 실행함.
+    스냅샷은 체인의 처음부터 interval번째 bind마다, 그리고 실행한 체인의 끝에서 남기며 maxsize개를 넘으면
+    가장 오래 사용되지 않은 것부터 버림. 노드와 초기 상태는 동일성으로 구분하고 상태는 복사하지 않으므로,
+    스텝이 상태를 제자리에서 고치면 안됨(monads.persistent의 PMap/PVector 참고).
+    """
+
+    def __init__(self, interval: int = 1, maxsize: int = 128):
+        import threading
+
+        if interval < 1:
+            raise ValueError("interval은 1 이상이어야됨")
+        self.interval = interval
+        self.entries = LRU(maxsize)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def find(
+        self, node: "State", initial_state: object
+    ) -> "tuple[list[State], State, tuple[int, Any, Any] | None]":
+        """node에서 체인을 거슬러 올라가 initial_state로 실행한 스냅샷이 있는 가장 뒤의 노드를 찾음
+
+        (지나온 노드들, 멈춘 노드, 그 노드의 (깊이, 값, 상태) 스냅샷)을 반환하며, 스냅샷이 없으면
+        멈춘 노드는 체인의 처음 노드이고 스냅샷은 None임. 조회 한번마다 적중이나 실패를 한번 셈.
+        """
+        # 노드마다 락을 잡지 않도록 거슬러 올라가는 동안은 읽기만 하고, 찾은 뒤에 한번만 락을 잡음
+        entries = self.entries.entries
+        ident = id(initial_state)
+        path: list[State] = []
+        while (entry := entries.get((id(node), ident))) is None:
+            if node._prev is None:
+                break
+            path.append(node)
+            node = node._prev
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return path, node, None
+            self.hits += 1
+            self.entries.get((id(node), ident))
+        # 키의 id가 재사용되지 않도록 노드와 초기 상태를 함께 들고있음
+        return path, node, entry[2]  # type: ignore
+
+    def put(
+        self, node: "State", initial_state: object, depth: int, value: Any, state: Any
+    ):
+        with self.lock:
+            self.entries.put(
+                (id(node), id(initial_state)),
+                (node, initial_state, (depth, value, state)),
+            )
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def cache_info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(
+                self.hits, self.misses, self.entries.evictions, len(self.entries)
+            )
+
+
 class State[S, A, C](Functor[Callable[[S], tuple[A, C]]]):
-    """S값을 받으면 A의 결과, C의 값을 반환함"""
+    """S값을 받으면 A의 결과, C의 값을 반환함
+
+    bind는 클로저를 중첩시키지 않고 이전 State와 다음 스텝만 연결해두며,
+    run이 이 연결을 평평한 명령 목록으로 풀어 루프로 실행하므로
+    체인 길이와 상관없이 스택 깊이가 일정함.
+    """
+
+    __slots__ = ("_prev", "_step")
+
+    _prev: "State | None"
+    _step: "Callable[[A], State] | None"
 
     def __init__(self, value: Callable[[S], tuple[A, C]]):
         self.value = value
+        self._prev = None
+        self._step = None
 
     @classmethod
     def of(cls, value: A) -> "State[S, A, S]":
         return State(lambda state: (value, state))
 
+    @classmethod
+    def get(cls) -> "State[S, S, S]":
+        """현재 상태를 결과로 꺼냄. 상태는 복사하지 않고 그대로 넘김"""
+        return State(lambda state: (state, state))
+
+    @classmethod
+    def gets(cls, func: Callable[[S], A]) -> "State[S, A, S]":
+        return State(lambda state: (func(state), state))
+
+    @classmethod
+    def put(cls, new_state: C) -> "State[S, None, C]":
+        return State(lambda _: (None, new_state))
+
+    @classmethod
+    def modify(cls, func: Callable[[S], C]) -> "State[S, None, C]":
+        """상태를 func의 반환값으로 바꿈
+
+        큰 상태는 monads.persistent의 PMap/PVector로 두고 func에서 set을 쓰면,
+        매 스텝 복사하지 않으면서도 이전 상태가 보존됨.
+        """
+        return State(lambda state: (None, func(state)))
+
     @classmethod
     def wraps(
         cls, func: "Callable[P,Callable[[S],tuple[A,C]]]"
@@ -27,12 +128,49 @@ class State[S, A, C](Functor[Callable[[S], tuple[A, C]]]):
 
         return wrapper
 
-    def run(self, initial_state: S) -> tuple[A, C]:
-        return self.value(initial_state)
+    def run(
+        self, initial_state: S, checkpoints: Checkpoints | None = None
+    ) -> tuple[A, C]:
+        """initial_state로 체인을 실행해 (값, 최종 상태)를 반환함
 
-    def bind(self, func: Callable[[A], "State[C, A, B]"]) -> "State[S, A, B]":
-        def new_run_state(state: S) -> tuple[A, B]:
-            current_value, next_state = self.value(state)
-            return func(current_value).value(next_state)
+        checkpoints가 주어지면 같은 초기 상태로 실행한 적 있는 가장 뒤의 노드부터 이어서 실행함.
+        """
+        if checkpoints is not None:
+            return self.resume(initial_state, checkpoints)
+        state = initial_state
+        # 다음에 실행할 스텝이 마지막에 오도록 쌓아두는 스택
+        pending: list[Callable[[A], State]] = []
+        current: State = self
+        while True:
+            while current._prev is not None:
+                pending.append(current._step)
+                current = current._prev
+            value, state = current.value(state)
+            if not pending:
+                return value, state
+            current = pending.pop()(value)
+
+    def resume(self, initial_state: S, checkpoints: Checkpoints) -> tuple[A, C]:
+        # 최상위 bind들을 스냅샷이 있는 노드까지 거슬러 올라간 뒤 하나씩 실행하며 스냅샷을 남김
+        path, current, snapshot = checkpoints.find(self, initial_state)
+        if snapshot is None:
+            value, state = current.value(initial_state)
+            depth = 0
+        else:
+            depth, value, state = snapshot
+            if not path:
+                return value, state
+        interval = checkpoints.interval
+        for node in reversed(path):
+            value, state = node._step(value).run(state)  # type: ignore
+            depth += 1
+            if depth % interval == 0 or node is self:
+                checkpoints.put(node, initial_state, depth, value, state)
+        return value, state
 
-        return State(new_run_state)
+    def bind(self, func: Callable[[A], "State[C, A, B]"]) -> "State[S, A, B]":
+        state = State.__new__(State)
+        state._prev = self
+        state._step = func
+        state.value = state.run
+        return state
@@ -0,0 +1,227 @@
+import functools
+import itertools
+import operator
+from collections import deque
+from typing import Callable, Iterable, Iterator, NamedTuple, TypeVar
+
+from .functor import Functor
+from .maybe import Maybe
+from .parallel import chunked
+from .result import Failed, Result
+
+T = TypeVar("T")
+N = TypeVar("N")
+A = TypeVar("A")
+
+MAP = 0
+FILTER = 1
+WRAP = 2
+
+NEST = 32
+"""원소 단위 단계가 이보다 길게 이어지면 map/filter를 겹치지 않고 한 루프로 합쳐 실행함"""
+
+
+class Stage(NamedTuple):
+    """이전 단계를 가리키는 단계 노드. 순회할 때 재귀 없이 풀어냄
+
+    MAP/FILTER는 원소 하나에, WRAP은 이터레이터 전체에 func를 적용함.
+    """
+
+    previous: "Stage | None"
+    kind: int
+    func: Callable
+
+
+def flatten(stage: Stage | None) -> list[tuple[int, Callable]]:
+    """연결된 단계들을 실행 순서대로 풀어냄"""
+    stages: list[tuple[int, Callable]] = []
+    while stage is not None:
+        stages.append((stage.kind, stage.func))
+        stage = stage.previous
+    stages.reverse()
+    return stages
+
+
+def pipeline(
+    iterator: Iterator[object], stages: list[tuple[int, Callable]]
+) -> Iterator[object]:
+    for item in iterator:
+        for kind, func in stages:
+            if kind == MAP:
+                item = func(item)
+            elif not func(item):
+                break
+        else:
+            yield item
+
+
+def fuse(
+    iterator: Iterator[object], stages: list[tuple[int, Callable]]
+) -> Iterator[object]:
+    """이어진 원소 단위 단계들을 적용함. 짧으면 C로 된 map/filter를 겹치는 편이 빠름"""
+    if len(stages) > NEST:
+        return pipeline(iterator, stages)
+    for kind, func in stages:
+        iterator = map(func, iterator) if kind == MAP else filter(func, iterator)
+    return iterator
+
+
+class Iterate[T]:
+    """iter를 호출할 때마다 factory로 새 이터레이터를 만드는 지연 이터러블"""
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory: Callable[[], Iterator[T]]):
+        self.factory = factory
+
+    def __iter__(self) -> Iterator[T]:
+        return self.factory()
+
+
+def lines(path: str, encoding: str) -> Iterator[str]:
+    with open(path, encoding=encoding) as file:
+        for line in file:
+            yield line.rstrip("\n")
+
+
+def windows(iterable: Iterable[T], size: int, step: int) -> Iterator[tuple[T, ...]]:
+    iterator = iter(iterable)
+    window: deque[T] = deque(itertools.islice(iterator, size), maxlen=size)
+    if len(window) < size:
+        return
+    yield tuple(window)
+    while True:
+        # step이 size보다 커도 maxlen 덕분에 마지막 size개만 남아 다음 창이 됨
+        items = list(itertools.islice(iterator, step))
+        if len(items) < step:
+            return
+        window.extend(items)
+        yield tuple(window)
+
+
+def positive(name: str, value: int):
+    if value < 1:
+        raise ValueError(f"{name}는 1 이상이어야 함: {value}")
+
+
+def succeeded(on_failed: Callable[[Exception], object] | None, result: Result) -> bool:
+    if isinstance(result, Failed):
+        if on_failed is not None:
+            on_failed(result.value)
+        return False
+    return True
+
+
+def is_just(maybe: Maybe) -> bool:
+    return maybe.value is not None
+
+
+def flat_map(func: "Callable[[T], Iterable[N]]", iterator: Iterator[T]) -> Iterator[N]:
+    return itertools.chain.from_iterable(map(func, iterator))
+
+
+def take(count: int, iterator: Iterator[T]) -> Iterator[T]:
+    return itertools.islice(iterator, count)
+
+
+VALUE = operator.attrgetter("value")
+
+
+class Stream[T](Functor[Iterable[T]]):
+    """순서가 있는 값들을 지연 평가로 다루는 모나드
+
+    map/bind/filter 등은 값을 미리 만들지 않고 단계만 쌓아두며, 순회할 때 한 원소씩 흘려보내므로
+    메모리 사용량이 입력 크기와 무관함. 원본이 다시 순회 가능하면 스트림도 여러번 순회할 수 있음.
+    """
+
+    __slots__ = ("stages",)
+
+    def __init__(self, value: Iterable[T], stages: Stage | None = None):
+        super().__init__(value)
+        self.stages = stages
+
+    @classmethod
+    def of(cls, iterable: Iterable[N]) -> "Stream[N]":
+        return Stream(iterable)
+
+    @classmethod
+    def lines(cls, path: str, encoding: str = "utf-8") -> "Stream[str]":
+        """순회할 때마다 파일을 열어 한 줄씩 읽는 스트림"""
+        return Stream(Iterate(functools.partial(lines, path, encoding)))
+
+    def __iter__(self) -> Iterator[T]:
+        iterator = iter(self.value)
+        run: list[tuple[int, Callable]] = []
+        for kind, func in flatten(self.stages):
+            if kind != WRAP:
+                run.append((kind, func))
+                continue
+            if run:
+                iterator, run = fuse(iterator, run), []
+            iterator = func(iterator)
+        if run:
+            iterator = fuse(iterator, run)
+        return iterator
+
+    def __eq__(self, obj: object):
+        if obj is self:
+            return True
+        if isinstance(obj, Stream):
+            return self.value == obj.value and self.stages == obj.stages
+        return False
+
+    def map(self, func: Callable[[T], N]) -> "Stream[N]":
+        return Stream(self.value, Stage(self.stages, MAP, func))
+
+    def bind(self, func: "Callable[[T], Iterable[N]]") -> "Stream[N]":
+        return Stream(
+            self.value, Stage(self.stages, WRAP, functools.partial(flat_map, func))
+        )
+
+    def filter(self, predicate: Callable[[T], object]) -> "Stream[T]":
+        return Stream(self.value, Stage(self.stages, FILTER, predicate))
+
+    def take(self, count: int) -> "Stream[T]":
+        return Stream(
+            self.value, Stage(self.stages, WRAP, functools.partial(take, count))
+        )
+
+    def chunk(self, size: int) -> "Stream[list[T]]":
+        positive("size", size)
+        return Stream(
+            self.value, Stage(self.stages, WRAP, functools.partial(chunked, size=size))
+        )
+
+    def window(self, size: int, step: int = 1) -> "Stream[tuple[T, ...]]":
+        positive("size", size)
+        positive("step", step)
+        return Stream(
+            self.value,
+            Stage(self.stages, WRAP, functools.partial(windows, size=size, step=step)),
+        )
+
+    def maybes(self: "Stream[Maybe[N]]") -> "Stream[N]":
+        """Maybe 스트림에서 nothing을 버리고 값만 남김"""
+        return Stream(
+            self.value, Stage(Stage(self.stages, FILTER, is_just), MAP, VALUE)
+        )
+
+    def successes(
+        self: "Stream[Result[N]]",
+        on_failed: Callable[[Exception], object] | None = None,
+    ) -> "Stream[N]":
+        """Result 스트림에서 성공한 값만 남기고, 실패는 on_failed로 넘김"""
+        keep = Stage(self.stages, FILTER, functools.partial(succeeded, on_failed))
+        return Stream(self.value, Stage(keep, MAP, VALUE))
+
+    def partition(self: "Stream[Result[N]]") -> tuple[list[N], list[Exception]]:
+        """한번의 순회로 성공한 값과 실패한 예외를 나눔"""
+        failures: list[Exception] = []
+        values = self.successes(failures.append).to_list()
+        return values, failures
+
+    def fold(self, func: Callable[[A, T], A], initial: A) -> A:
+        return functools.reduce(func, self, initial)
+
+    def to_list(self) -> list[T]:
+        return list(self)
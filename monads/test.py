@@ -1,6 +1,6 @@
 from functools import wraps
 from typing import Callable, ParamSpec, TypeVar
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 from random import randint
 
 P = ParamSpec("P")
@@ -75,10 +75,17 @@ def generate_monoid_test(monoid_class: type[Monoid[int]]):
 
 
 from .context import Context
-from .maybe import Maybe
-from .result import Result, Success, Failed
+from .maybe import Maybe, Nothing
+from .result import Result, Success, Failed, ErrorCode
 from .delay import Delay
 from .state import State
+from .cache import LRU, TTL, MaxBytes
+from .state import Checkpoints
+from .free import Program, Batch, Concurrent
+from .aio import AsyncMaybe, AsyncResult
+from .array import MaybeArray, ResultArray, np
+from .stream import Stream
+from . import flags, trace
 
 
 class TestMaybe(TestCase):
@@ -227,6 +234,23 @@ class TestMaybe(TestCase):
         self.assertEqual(left, right)
 
 
+    @note("메이비의 빈 값은 항상 같은 Nothing 인스턴스여야됨")
+    def test_19(self):
+        self.assertIs(Maybe.nothing(), Nothing)
+        self.assertIs(Maybe.of(None), Nothing)
+        self.assertIs(Maybe.call(lambda: 1 / 0), Nothing)
+        self.assertIs(Nothing.map(str), Nothing)
+        self.assertIs(Nothing.bind(Maybe.of), Nothing)
+        self.assertIs(Maybe.of(1).map(lambda x: None), Nothing)
+        self.assertIs(Maybe.of(1).combined(Nothing, max), Nothing)
+        self.assertIs(Maybe(None).map(str), Nothing)
+        self.assertEqual(Maybe(None), Nothing)
+
+    @note("메이비의 combined는 0 같은 falsy 값도 값으로 취급해야됨")
+    def test_20(self):
+        self.assertEqual(Maybe.of(0).combined(Maybe.of(5), max).get(), 5)
+        self.assertFalse(Maybe.of(0).is_nothing())
+
 TestMaybeMonoid = generate_monoid_test(Maybe)
 
 
@@ -294,6 +318,17 @@ class TestResult(TestCase):
         self.assertIsInstance(r2.value, ZeroDivisionError)
 
 
+    @note("리절트의 항등원과 실패 경로는 새 인스턴스를 만들지 않아야됨")
+    def test_10(self):
+        failed = self.on_failed()
+        self.assertIs(Result.identity(), Result.identity())
+        self.assertIs(failed.bind(str), failed)
+        self.assertIs(failed.flat_bind(lambda x: self.on_success()), failed)
+        self.assertIs(failed.combined(self.on_success(), max), Result.identity())
+        self.assertIsInstance(
+            self.on_success().combined(self.on_success(), max), Success
+        )
+
 TestResultMonoid = generate_monoid_test(Result)
 
 
@@ -360,6 +395,49 @@ class TestDelay(TestCase):
         # increase.bind(power).bind(lambda a, b, c: test(a, b, c))
 
 
+    @note("딜레이는 map으로 값을 변환 할 수 있어야됨")
+    def test_3(self):
+        @Delay
+        def add(a: int, b: int):
+            return a + b
+
+        delay = add.map(lambda x: x * 10).map(str)
+        self.assertEqual(delay.run(1, 2), "30")
+        self.assertEqual(delay(2, 3).run(), "50")
+        self.assertEqual(delay.map(len).run(1, 2), 2)
+
+    @note("딜레이는 map과 bind를 섞어도 순서대로 실행되어야됨")
+    def test_4(self):
+        log: list[str] = []
+
+        def record(name: str):
+            def inner(value: int):
+                log.append(name)
+                return value + 1
+
+            return inner
+
+        delay = (
+            Delay(record("root"))
+            .map(record("map1"))
+            .map(record("map2"))
+            .bind(lambda x: Delay(lambda: record("bind")(x)))
+            .map(record("map3"))
+        )
+        self.assertEqual(delay.run(0), 5)
+        self.assertEqual(log, ["root", "map1", "map2", "bind", "map3"])
+        self.assertEqual(delay.run(0), 5)
+
+    @note("딜레이는 긴 파이프라인도 재귀 제한 없이 실행되어야됨")
+    def test_5(self):
+        delay = Delay[[int], int].identity()
+        for _ in range(50000):
+            delay = delay.map(lambda x: x + 1)
+        delay = delay.bind(lambda x: Delay(lambda: x * 2))
+        self.assertEqual(delay.run(0), 100000)
+        self.assertEqual(delay(1).run(), 100002)
+
+
 class TestDelayMonoid(TestCase):
     def pow(self, x: int):
         return x * x
@@ -403,6 +481,130 @@ class TestDelayMonoid(TestCase):
         self.assertEqual(left.run(20), right.run(20))
 
 
+class TestDelayCache(TestCase):
+    @note("캐시된 딜레이는 같은 인자에 대해 한번만 실행되어야됨")
+    def test_1(self):
+        calls: list[int] = []
+
+        @Delay.memo()
+        def square(x: int):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(square.run(3), 9)
+        self.assertEqual(square(3).run(), 9)
+        self.assertEqual(square.run(4), 16)
+        self.assertEqual(calls, [3, 4])
+        info = square.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    @note("딜레이의 cached는 파이프라인 전체를 캐시해야됨")
+    def test_2(self):
+        calls: list[int] = []
+
+        def record(x: int):
+            calls.append(x)
+            return x
+
+        delay = Delay(record).map(lambda x: x + 1).cached(LRU(maxsize=1))
+        self.assertEqual(delay.run(1), 2)
+        self.assertEqual(delay.run(1), 2)
+        self.assertEqual(delay.run(2), 3)
+        self.assertEqual(delay.run(1), 2)
+        self.assertEqual(calls, [1, 2, 1])
+        self.assertEqual(delay.cache_info().evictions, 2)
+        with self.assertRaises(TypeError):
+            Delay(record).cache_info()
+
+    @note("TTL 정책은 시간이 지난 값을 다시 계산해야됨")
+    def test_3(self):
+        now = [0.0]
+        calls: list[int] = []
+
+        @Delay.memo(TTL(10, clock=lambda: now[0]))
+        def record(x: int):
+            calls.append(x)
+            return x
+
+        record.run(1)
+        now[0] = 5
+        record.run(1)
+        now[0] = 11
+        record.run(1)
+        self.assertEqual(calls, [1, 1])
+
+    @note("MaxBytes 정책은 크기 합이 한도를 넘지 않게 축출해야됨")
+    def test_4(self):
+        policy = MaxBytes(10, sizeof=len)
+        delay = Delay.memo(policy)(lambda n: "x" * n)
+        delay.run(4)
+        delay.run(4)
+        delay.run(5)
+        self.assertEqual(policy.size, 9)
+        delay.run(3)
+        self.assertEqual(policy.size, 8)
+        delay.run(20)
+        self.assertEqual(len(policy), 2)
+        self.assertEqual(delay.cache_info().misses, 4)
+
+    @note("동시에 같은 키를 요청하면 한번만 실행되어야됨")
+    def test_5(self):
+        import threading
+
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[int] = []
+
+        @Delay.memo()
+        def slow(x: int):
+            calls.append(x)
+            started.set()
+            release.wait(5)
+            return x
+
+        results: list[int] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(slow.run(1)))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, [1] * 5)
+
+    @note("예외는 캐시되지 않아야됨")
+    def test_6(self):
+        calls: list[int] = []
+
+        @Delay.memo()
+        def fail(x: int):
+            calls.append(x)
+            raise ValueError
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                fail.run(1)
+        self.assertEqual(calls, [1, 1])
+
+    @note("키워드 인자로 부른 키와 같은 모양의 위치 인자로 부른 키는 겹치지 않아야됨")
+    def test_7(self):
+        @Delay.memo()
+        def show(*args, **kwargs):
+            return args, kwargs
+
+        self.assertEqual(show.run(1, a=2), ((1,), {"a": 2}))
+        self.assertEqual(
+            show.run((1,), frozenset({("a", 2)})), (((1,), frozenset({("a", 2)})), {})
+        )
+        self.assertEqual(show.run(b=1, a=2), show.run(a=2, b=1))
+        self.assertEqual(show.cache_info().misses, 3)
+
+
 class TestState(TestCase):
     @note("스테이트는 bind를 하여 메서드를 체이닝 할 수 있어야함")
     def test_1(self):
@@ -477,6 +679,43 @@ class TestState(TestCase):
         self.assertEqual(final_state, 1300)
 
 
+    @note("스테이트는 긴 bind 체인도 재귀 없이 실행해야됨")
+    def test_5(self):
+        def increase(_: int):
+            return State[int, int, int](lambda value: (value, value + 1))
+
+        state = State[int, int, int].of(0)
+        for _ in range(20000):
+            state = state.bind(increase)
+        value, final_state = state.run(0)
+        self.assertEqual(final_state, 20000)
+        self.assertEqual(value, 19999)
+
+    @note("스테이트는 bind 안에서 중첩된 체인도 순서대로 실행해야됨")
+    def test_6(self):
+        def push(item: str):
+            return State[list, str, list](lambda log: (item, log + [item]))
+
+        def nested(depth: int) -> State:
+            if depth == 0:
+                return push("end")
+            return push(str(depth)).bind(lambda _: nested(depth - 1))
+
+        value, log = push("start").bind(lambda _: nested(3)).run([])
+        self.assertEqual(value, "end")
+        self.assertEqual(log, ["start", "3", "2", "1", "end"])
+
+        def step(n: int) -> State:
+            if n == 0:
+                return State[int, int, int].of(0)
+            return State[int, int, int](lambda s: (n, s + 1)).bind(
+                lambda _: step(n - 1)
+            )
+
+        value, final_state = step(20000).run(0)
+        self.assertEqual(final_state, 20000)
+
+
 class TestContext(TestCase):
     @note("컨텍스트는 컨텍스트를 인자로받는 콜백함수를 인자로 받아야됨")
     def test_1(self):
@@ -559,3 +798,1792 @@ class TestContext(TestCase):
 
         result = what_ther(10)(5)
         print(result)
+
+
+class TestAsync(TestCase):
+    @note("AsyncResult.wraps는 코루틴의 성공과 실패를 Result로 감싸야됨")
+    def test_1(self):
+        import asyncio
+
+        @AsyncResult.wraps
+        async def divide(a: int, b: int):
+            await asyncio.sleep(0)
+            return a / b
+
+        self.assertEqual(asyncio.run(divide(4, 2).run()), Success(2.0))
+        self.assertIsInstance(asyncio.run(divide(1, 0).run()).value, ZeroDivisionError)
+
+    @note("AsyncResult는 동기/비동기 함수를 섞어서 체이닝 할 수 있어야됨")
+    def test_2(self):
+        import asyncio
+
+        @AsyncResult.wraps
+        async def fetch(x: int):
+            return x
+
+        async def double(x: int):
+            return x * 2
+
+        async def main():
+            result = await (
+                fetch(3)
+                .map(lambda x: x + 1)
+                .bind(double)
+                .flat_bind(lambda x: fetch(x * 10))
+                .flat_bind(lambda x: Success(str(x)))
+            )
+            failed = await fetch(1).bind(lambda x: x / 0).map(str)
+            return result, failed
+
+        result, failed = asyncio.run(main())
+        self.assertEqual(result, Success("80"))
+        self.assertIsInstance(failed.value, ZeroDivisionError)
+
+    @note("AsyncResult.gather는 동시에 실행되고 하나라도 실패하면 나머지를 취소해야됨")
+    def test_3(self):
+        import asyncio
+
+        cancelled: list[int] = []
+
+        @AsyncResult.wraps
+        async def sleep(x: int):
+            try:
+                await asyncio.sleep(x / 100)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return x
+
+        @AsyncResult.wraps
+        async def fail():
+            raise ValueError
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            ok = await AsyncResult.gather(sleep(5), sleep(5), sleep(5))
+            elapsed = loop.time() - start
+            failed = await AsyncResult.gather(sleep(100), fail())
+            return ok, elapsed, failed
+
+        ok, elapsed, failed = asyncio.run(main())
+        self.assertEqual(ok, Success((5, 5, 5)))
+        self.assertLess(elapsed, 0.1)
+        self.assertIsInstance(failed.value, ValueError)
+        self.assertEqual(cancelled, [100])
+
+    @note("AsyncMaybe는 None을 nothing으로 처리하고 이후 단계를 건너뛰어야됨")
+    def test_4(self):
+        import asyncio
+
+        @AsyncMaybe.wraps
+        async def find(key: str):
+            return {"a": 1}.get(key)
+
+        async def main():
+            found = await find("a").map(lambda x: x + 1).bind(lambda x: find("a"))
+            missing = await find("b").map(lambda x: x + 1)
+            both = await AsyncMaybe.gather(find("a"), AsyncMaybe.of(2))
+            either = await AsyncMaybe.gather(find("a"), find("b"))
+            return found, missing, both, either
+
+        found, missing, both, either = asyncio.run(main())
+        self.assertEqual(found.get(), 1)
+        self.assertTrue(missing.is_nothing())
+        self.assertEqual(both.get(), (1, 2))
+        self.assertTrue(either.is_nothing())
+
+    @note("딜레이는 코루틴 함수를 감싸고 await 할 수 있어야됨")
+    def test_5(self):
+        import asyncio
+
+        @Delay
+        async def fetch(x: int):
+            await asyncio.sleep(0)
+            return x
+
+        async def twice(x: int):
+            return x * 2
+
+        delay = fetch.map(twice).bind(lambda x: fetch(x + 1)).map(str)
+
+        async def main():
+            return await delay(3), await delay.arun(4)
+
+        self.assertEqual(asyncio.run(main()), ("7", "9"))
+
+    @note("메모된 코루틴 딜레이는 여러번 await 해도 한번만 실행되어야됨")
+    def test_6(self):
+        import asyncio
+
+        calls: list[int] = []
+
+        @Delay.memo()
+        async def fetch(x: int):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        async def main():
+            first = await fetch(1)
+            together = await asyncio.gather(fetch(2).arun(), fetch(2).arun())
+            return first, await fetch(1), together, await fetch.map(str)(1)
+
+        self.assertEqual(asyncio.run(main()), (2, 2, [4, 4], "2"))
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(fetch.cache_info().hits, 3)
+
+    @note("Delay.all은 await 하면 코루틴 딜레이들을 동시에 기다려야됨")
+    def test_7(self):
+        import asyncio
+        import time
+
+        @Delay
+        async def fetch(x: int):
+            await asyncio.sleep(0.05)
+            return x
+
+        both = Delay.all(fetch(1), fetch(2), Delay(lambda: 3))
+        chained = fetch(1).bind(lambda x: Delay.all(fetch(x), fetch(x + 1)))
+
+        async def main():
+            start = time.perf_counter()
+            values = await both
+            elapsed = time.perf_counter() - start
+            return values, elapsed, await chained.arun()
+
+        values, elapsed, pair = asyncio.run(main())
+        self.assertEqual(values, (1, 2, 3))
+        self.assertLess(elapsed, 0.09)
+        self.assertEqual(pair, (1, 2))
+
+    @note("긴 비동기 체인도 단계 수에 비례하는 시간에 만들고 실행해야됨")
+    def test_8(self):
+        import asyncio
+        import time
+
+        start = time.perf_counter()
+        result, maybe = AsyncResult.of(0), AsyncMaybe.of(0)
+        for _ in range(40000):
+            result = result.map(lambda x: x + 1)
+            maybe = maybe.map(lambda x: x + 1)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(asyncio.run(result.run()), Success(40000))
+        self.assertEqual(asyncio.run(maybe.run()), Maybe.of(40000))
+
+    @note("cached로 감싼 비동기 파이프라인도 단계마다 기다린 결과를 캐시해야됨")
+    def test_9(self):
+        import asyncio
+
+        calls: list[int] = []
+
+        async def fetch(x: int):
+            calls.append(x)
+            await asyncio.sleep(0)
+            return x * 2
+
+        cached = Delay(fetch).map(lambda x: x + 1).cached()
+
+        async def main():
+            return await cached.arun(3), await cached.arun(3)
+
+        self.assertEqual(asyncio.run(main()), (7, 7))
+        self.assertEqual(calls, [3])
+
+
+@Result.wraps
+def parse_positive(text: str) -> int:
+    value = int(text)
+    if value <= 0:
+        raise ValueError(text)
+    return value
+
+
+def half(value: int) -> Maybe[int]:
+    return Maybe.of(value // 2 if value % 2 == 0 else None)
+
+
+class TestTraverse(TestCase):
+    @note("Result.traverse는 모두 성공하면 Success[list]를 반환해야됨")
+    def test_1(self):
+        result = Result.traverse(parse_positive, ["1", "2", "3"])
+        self.assertEqual(result, Success([1, 2, 3]))
+        self.assertEqual(Result.traverse(parse_positive, []), Success([]))
+
+    @note("Result.traverse는 첫번째 Failed를 반환하고 이후 원소는 실행하지 않아야됨")
+    def test_2(self):
+        seen: list[str] = []
+
+        def record(text: str):
+            seen.append(text)
+            return parse_positive(text)
+
+        result = Result.traverse(record, ["1", "x", "-1", "2"], chunksize=1)
+        self.assertIsInstance(result.value, ValueError)
+        self.assertIn("'x'", str(result.value))
+        self.assertEqual(seen, ["1", "x"])
+
+    @note("Result.traverse는 executor로 청크를 병렬 실행해도 순서를 유지해야됨")
+    def test_3(self):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        texts = [str(i) for i in range(1, 2001)]
+        with ThreadPoolExecutor(4) as executor:
+            result = Result.traverse(parse_positive, texts, executor, chunksize=100)
+            self.assertEqual(result.value, list(range(1, 2001)))
+            failed = Result.traverse(
+                parse_positive, texts[:500] + ["0"] + texts, executor, chunksize=7
+            )
+            self.assertEqual(str(failed.value), "0")
+        with ProcessPoolExecutor(2) as executor:
+            result = Result.traverse(parse_positive, texts, executor, chunksize=500)
+            self.assertEqual(result.value, list(range(1, 2001)))
+
+    @note("Result.traverse는 실패하면 아직 시작하지 않은 청크를 취소해야됨")
+    def test_4(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        seen: list[str] = []
+
+        def record(text: str):
+            seen.append(text)
+            return parse_positive(text)
+
+        texts = ["0"] + ["1"] * 10000
+        with ThreadPoolExecutor(1) as executor:
+            result = Result.traverse(record, texts, executor, chunksize=10)
+        self.assertIsInstance(result, Failed)
+        self.assertLess(len(seen), 1000)
+
+    @note("Maybe.traverse는 하나라도 nothing이면 nothing을 반환해야됨")
+    def test_5(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.assertEqual(Maybe.traverse(half, [2, 4, 6]).get(), [1, 2, 3])
+        self.assertTrue(Maybe.traverse(half, [2, 3, 6]).is_nothing())
+        with ThreadPoolExecutor(2) as executor:
+            maybe = Maybe.traverse(half, range(2, 2002, 2), executor, chunksize=50)
+            self.assertEqual(maybe.get(), list(range(1, 1001)))
+
+    @note("sequence는 Result/Maybe 목록을 하나로 합쳐야됨")
+    def test_6(self):
+        self.assertEqual(Result.sequence([Success(1), Success(2)]), Success([1, 2]))
+        self.assertIsInstance(
+            Result.sequence([Success(1), Failed(KeyError())]).value, KeyError
+        )
+        self.assertEqual(Maybe.sequence([Maybe.of(1), Maybe.of(2)]).get(), [1, 2])
+        self.assertTrue(Maybe.sequence([Maybe.of(1), Maybe.nothing()]).is_nothing())
+
+
+class TestSlots(TestCase):
+    @note("모나드 인스턴스는 __dict__ 없이 슬롯만 사용해야됨")
+    def test_1(self):
+        instances = [
+            Maybe.of(1),
+            Maybe.nothing(),
+            Success(1),
+            Failed(Exception()),
+            Delay(lambda: 1),
+            Delay(lambda: 1).map(str),
+            State.of(1),
+            State.of(1).bind(State.of),
+            Context(lambda c: c),
+            AsyncResult.of(1),
+            AsyncMaybe.of(1),
+        ]
+        for instance in instances:
+            self.assertFalse(hasattr(instance, "__dict__"), instance)
+
+
+@skipUnless(np, "numpy가 설치되어 있지 않음")
+class TestMaybeArray(TestCase):
+    @note("MaybeArray의 map은 유효한 칸에만 적용되어야됨")
+    def test_1(self):
+        array = MaybeArray.from_maybes([Maybe.of(1), Nothing, Maybe.of(3)])
+        mapped = array.map(lambda values: values * 10)
+        self.assertEqual(mapped.to_maybes(), [Maybe.of(10), Nothing, Maybe.of(30)])
+        self.assertEqual(mapped.or_else(-1).tolist(), [10, -1, 30])
+
+    @note("MaybeArray는 Maybe.map과 같은 결과를 내야됨")
+    def test_2(self):
+        maybes = [Maybe.of(i) if i % 3 else Nothing for i in range(20)]
+        array = MaybeArray.from_maybes(maybes).map(lambda x: x + 1)
+        self.assertEqual(array.to_maybes(), [m.map(lambda x: x + 1) for m in maybes])
+        self.assertEqual(array[1], Maybe.of(2))
+        self.assertIs(array[0], Nothing)
+
+    @note("MaybeArray의 combined는 양쪽 마스크를 모두 전파해야됨")
+    def test_3(self):
+        left = MaybeArray.of([1, 2, 3, 4], [True, False, True, True])
+        right = MaybeArray.of([1, 1, 0, 2], [True, True, False, True])
+        combined = left.combined(right, np.add)
+        expected = [
+            a.combined(b, lambda x, y: x + y)
+            for a, b in zip(left.to_maybes(), right.to_maybes())
+        ]
+        self.assertEqual(combined.to_maybes(), expected)
+
+    @note("MaybeArray의 bind는 내부 마스크를 합쳐야됨")
+    def test_4(self):
+        array = MaybeArray.of([2, 3, 4, 5], [True, True, False, True])
+        bound = array.bind(lambda values: MaybeArray.of(values // 2, values % 2 == 0))
+        self.assertEqual(bound.to_maybes(), [Maybe.of(1), Nothing, Nothing, Nothing])
+
+    @note("object 배열의 None은 nothing으로 취급해야됨")
+    def test_5(self):
+        array = MaybeArray.of(np.array(["a", None, "c"], dtype=object))
+        self.assertEqual(array.mask.tolist(), [True, False, True])
+
+
+if np is not None:
+    TestMaybeArrayMonoid = generate_monoid_test(MaybeArray)
+    TestResultArrayMonoid = generate_monoid_test(ResultArray)
+
+
+@skipUnless(np, "numpy가 설치되어 있지 않음")
+class TestResultArray(TestCase):
+    @note("ResultArray의 bind는 실패한 칸만 Failed로 만들어야됨")
+    def test_1(self):
+        array = ResultArray.of(np.array([1.0, 0.0, 4.0]))
+        divided = array.bind(lambda x: 1 / x)
+        results = divided.to_results()
+        self.assertEqual(results[0], Success(1.0))
+        self.assertIsInstance(results[1].value, FloatingPointError)
+        self.assertEqual(results[2], Success(0.25))
+        self.assertEqual(divided.value_or(-1).tolist(), [1.0, -1, 0.25])
+
+    @note("ResultArray는 Result.bind처럼 실패한 칸을 이어가지 않아야됨")
+    def test_2(self):
+        results = [Success(1), Failed(KeyError()), Success(3)]
+        array = ResultArray.from_results(results).bind(lambda x: x * 2)
+        self.assertEqual(array.to_results(), [r.bind(lambda x: x * 2) for r in results])
+        self.assertIsInstance(array[1].value, KeyError)
+
+    @note("ResultArray의 combined는 Result.combined와 같은 의미여야됨")
+    def test_3(self):
+        left = ResultArray.from_results([Success(1), Failed(KeyError()), Success(3)])
+        right = ResultArray.from_results([Success(2), Success(2), Failed(ValueError())])
+        combined = left.combined(right, np.multiply)
+        expected = [
+            a.combined(b, lambda x, y: x * y)
+            for a, b in zip(left.to_results(), right.to_results())
+        ]
+        self.assertEqual(combined.to_results(), expected)
+
+    @note("ResultArray의 flat_bind는 내부 에러를 합쳐야됨")
+    def test_4(self):
+        array = ResultArray.from_results([Success(1), Failed(KeyError()), Success(2)])
+
+        def check(values):
+            return ResultArray.from_results(
+                [Success(v) if v > 1 else Failed(ValueError()) for v in values.tolist()]
+            )
+
+        bound = array.flat_bind(check)
+        self.assertEqual(
+            [r.value.__class__ for r in bound.to_results()], [ValueError, KeyError, int]
+        )
+
+    @note("ResultArray의 언더플로는 스칼라 Result.bind처럼 실패가 아니어야됨")
+    def test_5(self):
+        import math
+
+        values = np.array([-1000.0, 0.0, 1000.0])
+        bound = ResultArray.of(values).bind(np.exp)
+        scalar = [Success(value).bind(math.exp) for value in values.tolist()]
+        results = bound.to_results()
+        self.assertEqual(results[:2], scalar[:2])
+        self.assertEqual(results[0], Success(0.0))
+        self.assertIsInstance(results[2].value, FloatingPointError)
+        self.assertIsInstance(scalar[2].value, OverflowError)
+
+
+class TestStream(TestCase):
+    @note("스트림은 순회하기 전까지 아무것도 실행하지 않아야됨")
+    def test_1(self):
+        seen: list[int] = []
+
+        def record(x: int):
+            seen.append(x)
+            return x
+
+        stream = Stream.of(range(5)).map(record).filter(lambda x: x % 2 == 0)
+        self.assertEqual(seen, [])
+        self.assertEqual(stream.to_list(), [0, 2, 4])
+        self.assertEqual(seen, [0, 1, 2, 3, 4])
+        self.assertEqual(list(stream), [0, 2, 4])
+
+    @note("스트림은 무한한 입력도 take로 필요한 만큼만 처리해야됨")
+    def test_2(self):
+        from itertools import count
+
+        stream = Stream.of(count()).map(lambda x: x * x).take(4)
+        self.assertEqual(stream.to_list(), [0, 1, 4, 9])
+
+    @note("스트림의 bind는 반환한 이터러블을 평탄화해야됨")
+    def test_3(self):
+        stream = Stream.of([1, 2, 3]).bind(lambda x: Stream.of([x] * x))
+        self.assertEqual(stream.to_list(), [1, 2, 2, 3, 3, 3])
+        self.assertEqual(Stream.of([1, 2]).bind(range).to_list(), [0, 0, 1])
+
+    @note("스트림은 chunk와 window로 원소를 묶을 수 있어야됨")
+    def test_4(self):
+        self.assertEqual(Stream.of(range(5)).chunk(2).to_list(), [[0, 1], [2, 3], [4]])
+        self.assertEqual(
+            Stream.of(range(5)).window(3).to_list(),
+            [(0, 1, 2), (1, 2, 3), (2, 3, 4)],
+        )
+        self.assertEqual(
+            Stream.of(range(9)).window(2, 3).to_list(), [(0, 1), (3, 4), (6, 7)]
+        )
+        self.assertEqual(Stream.of(range(2)).window(3).to_list(), [])
+
+    @note("스트림은 Maybe의 nothing을 버리고 Result의 성공과 실패를 나눠야됨")
+    def test_5(self):
+        maybes = Stream.of([1, None, 3]).map(Maybe.of).maybes()
+        self.assertEqual(maybes.to_list(), [1, 3])
+
+        parse = Result.wraps(int)
+        results = Stream.of(["1", "x", "3", "y"]).map(parse)
+        failed: list[Exception] = []
+        self.assertEqual(results.successes(failed.append).to_list(), [1, 3])
+        self.assertEqual(len(failed), 2)
+        values, failures = results.partition()
+        self.assertEqual(values, [1, 3])
+        self.assertTrue(all(isinstance(e, ValueError) for e in failures))
+        self.assertEqual(results.map(lambda r: r.value_or(0)).fold(max, 0), 3)
+
+    @note("스트림은 파일을 한 줄씩 읽어야됨")
+    def test_6(self):
+        import os
+        import tempfile
+
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+            file.write("1\n2\nx\n4\n")
+        try:
+            stream = Stream.lines(file.name).map(Result.wraps(int)).successes()
+            self.assertEqual(stream.fold(lambda a, b: a + b, 0), 7)
+            self.assertEqual(stream.to_list(), [1, 2, 4])
+        finally:
+            os.remove(file.name)
+
+    @note("스트림의 chunk와 window는 1보다 작은 크기와 간격을 거부해야됨")
+    def test_7(self):
+        stream = Stream.of(range(5))
+        with self.assertRaises(ValueError):
+            stream.chunk(0)
+        with self.assertRaises(ValueError):
+            stream.window(0)
+        with self.assertRaises(ValueError):
+            stream.window(2, 0)
+
+    @note("스트림은 긴 단계 체인도 재귀 없이 순회해야됨")
+    def test_8(self):
+        stream = Stream.of(range(10))
+        for _ in range(5_000):
+            stream = stream.map(lambda x: x + 1).filter(lambda x: x >= 0)
+        for _ in range(1_000):
+            stream = stream.take(10)
+        self.assertEqual(stream.to_list(), list(range(5_000, 5_010)))
+        self.assertEqual(stream.fold(lambda a, b: a + b, 0), sum(range(5_000, 5_010)))
+
+
+def cube(x: int) -> int:
+    return x**3
+
+
+class TestDelayExecutor(TestCase):
+    @note("Delay.all은 그냥 run하면 순서대로 실행해 튜플을 반환해야됨")
+    def test_1(self):
+        delay = Delay.all(Delay(cube)(2), Delay(cube)(3)).map(sum)
+        self.assertEqual(delay.run(), 35)
+
+    @note("run_on은 독립적인 딜레이들을 동시에 실행해야됨")
+    def test_2(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        @Delay
+        def wait(x: int):
+            barrier.wait()
+            return x
+
+        delay = Delay.all(wait(1), wait(2), wait(3)).map(sum)
+        with ThreadPoolExecutor(3) as executor:
+            self.assertEqual(delay.run_on(executor), 6)
+            nested = Delay(cube)(2).bind(lambda x: Delay.all(wait(x), wait(1), wait(1)))
+            self.assertEqual(nested.run_on(executor), (8, 1, 1))
+
+    @note("run_on은 프로세스 풀에서도 실행되어야됨")
+    def test_3(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        delay = Delay.all(*(Delay(cube)(x).map(str) for x in range(4)))
+        with ProcessPoolExecutor(2) as executor:
+            self.assertEqual(delay.run_on(executor), ("0", "1", "8", "27"))
+
+    @note("pickle 할 수 없는 딜레이를 프로세스 풀로 보내면 TypeError가 나야됨")
+    def test_4(self):
+        from concurrent.futures import ProcessPoolExecutor
+
+        delay = Delay.all(Delay(lambda: 1))
+        with ProcessPoolExecutor(1) as executor:
+            with self.assertRaises(TypeError):
+                delay.run_on(executor)
+
+    @note("run_on 중 하나가 실패하면 예외가 전달되어야됨")
+    def test_5(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        delay = Delay.all(Delay(cube)(1), Delay(lambda: 1 / 0))
+        with ThreadPoolExecutor(2) as executor:
+            with self.assertRaises(ZeroDivisionError):
+                delay.run_on(executor)
+
+
+class TestTrace(TestCase):
+    @note("트레이싱 중에는 각 단계의 이름과 결과가 기록되어야됨")
+    def test_1(self):
+        def parse(text: str):
+            return int(text)
+
+        def invert(value: int):
+            return 1 / value
+
+        with trace.tracing() as tracer:
+            Success("0").bind(parse).bind(invert).bind(str)
+            Maybe.of(1).map(lambda x: None).map(str)
+
+        outcomes = [(span.kind, span.name, span.outcome) for span in tracer.spans]
+        self.assertEqual(
+            outcomes[:3],
+            [
+                ("Result.bind", "TestTrace.test_1.<locals>.parse", trace.OK),
+                ("Result.bind", "TestTrace.test_1.<locals>.invert", trace.ERROR),
+                ("Result.bind", "str", trace.SKIPPED),
+            ],
+        )
+        self.assertEqual(
+            [span.outcome for span in tracer.spans[3:]], [trace.EMPTY, trace.SKIPPED]
+        )
+        self.assertTrue(all(span.wall >= 0 for span in tracer.spans))
+
+    @note("중첩된 단계는 부모 경로를 가지고 collapsed 형식으로 내보낼 수 있어야됨")
+    def test_2(self):
+        @Result.wraps
+        def inner(value: int):
+            return value + 1
+
+        def outer(value: int):
+            return inner(value).flat_bind(inner)
+
+        with trace.tracing() as tracer:
+            Success(1).flat_bind(outer)
+
+        paths = [span.path for span in tracer.spans]
+        self.assertIn(
+            (
+                "Result.flat_bind:TestTrace.test_2.<locals>.outer",
+                "Result.flat_bind:TestTrace.test_2.<locals>.inner",
+            ),
+            paths,
+        )
+        lines = tracer.collapsed().splitlines()
+        self.assertEqual(len(lines), 2)
+        for line in lines:
+            stack, micros = line.rsplit(" ", 1)
+            self.assertTrue(stack.startswith("Result.flat_bind:"))
+            self.assertGreaterEqual(int(micros), 0)
+
+    @note("Metrics는 단계별로 횟수와 결과를 집계해야됨")
+    def test_3(self):
+        metrics = trace.Metrics()
+        parse = Result.wraps(int)
+        with trace.tracing(keep=False, sinks=[metrics]) as tracer:
+            for text in ["1", "x", "3"]:
+                Success(text).flat_bind(parse)
+        self.assertEqual(tracer.spans, [])
+        summary = metrics.summary()["Result.flat_bind int"]
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["outcomes"], {trace.OK: 2, trace.ERROR: 1})
+
+    @note("트레이싱이 끝나면 아무것도 기록되지 않아야됨")
+    def test_4(self):
+        with trace.tracing() as tracer:
+            pass
+        Maybe.of(1).map(str)
+        self.assertEqual(flags.tracing, 0)
+        self.assertEqual(tracer.spans, [])
+
+    @note(
+        "동시에 실행된 형제 단계들은 서로의 자식이 아니라 같은 부모 아래에 기록되어야됨"
+    )
+    def test_5(self):
+        import time
+
+        def slow(value: int) -> int:
+            time.sleep(0.02)
+            return value
+
+        readers = [Context(lambda x: Maybe.of(x).map(slow).get()) for _ in range(4)]
+        gathered = Context.gather(*readers)
+
+        def fan_out(value: int) -> tuple:
+            return gathered(value)
+
+        with trace.tracing() as tracer:
+            self.assertEqual(Maybe.of(1).map(fan_out).get(), (1, 1, 1, 1))
+        children = [span for span in tracer.spans if span.name.endswith("slow")]
+        parent = next(span for span in tracer.spans if span.name.endswith("fan_out"))
+        self.assertEqual(len(children), 4)
+        self.assertEqual(
+            {span.path for span in children}, {(*parent.path, children[0].path[-1])}
+        )
+        self.assertGreaterEqual(parent.self_wall, 0.0)
+
+
+class Request:
+    def __init__(self, raw: str):
+        self.raw = raw
+
+
+class TestContextProvider(TestCase):
+    @note("provider는 같은 컨텍스트 객체에 대해 한번만 계산되어야됨")
+    def test_1(self):
+        calls: list[str] = []
+
+        @Context.provider
+        def config(request: Request):
+            calls.append(request.raw)
+            return dict(item.split("=") for item in request.raw.split(","))
+
+        host = config.pipe(Context(lambda c: c["host"]))
+        port = config.pipe(Context(lambda c: int(c["port"])))
+        request = Request("host=a,port=1")
+        self.assertEqual(host(request), "a")
+        self.assertEqual(port(request), 1)
+        other = Request("host=b,port=2")
+        self.assertEqual(host(other), "b")
+        self.assertEqual(calls, ["host=a,port=1", "host=b,port=2"])
+
+    @note(
+        "provider 캐시는 컨텍스트와 함께 사라지고, 컨텍스트를 참조하는 값은 스코프와 함께 사라져야됨"
+    )
+    def test_2(self):
+        import gc
+        import weakref
+
+        class Handle:
+            def __init__(self, request: Request):
+                self.request = request
+
+        @Context.provider
+        def handle(request: Request):
+            return Handle(request)
+
+        @Context.provider
+        def raw(request: Request):
+            return request.raw.upper()
+
+        request = Request("r")
+        self.assertEqual(raw(request), "R")
+        alive = weakref.ref(request)
+        del request
+        gc.collect()
+        self.assertIsNone(alive())
+        self.assertEqual(raw.values, {})
+
+        request = Request("r")
+        with Context.scope(request):
+            self.assertIs(handle(request).request, request)
+            self.assertIs(handle(request), handle(request))
+        alive = weakref.ref(request)
+        del request
+        gc.collect()
+        self.assertIsNone(alive())
+
+        @Context.provider
+        def connection(request: Request):
+            yield "conn"
+
+        with self.assertRaises(RuntimeError):
+            connection(Request("r"))
+
+    @note(
+        "스코프 안에서는 provider가 한번만 계산되고 블록이 끝나면 역순으로 정리되어야됨"
+    )
+    def test_3(self):
+        events: list[str] = []
+
+        @Context.provider
+        def config(request: dict):
+            events.append("config")
+            yield {"dsn": request["dsn"]}
+            events.append("close config")
+
+        @Context.provider
+        def db(request: dict):
+            events.append("connect " + config(request)["dsn"])
+            yield "db"
+            events.append("disconnect")
+
+        handler = db.bind(config).pipe(Context(lambda c: c["dsn"]))
+        request = {"dsn": "sqlite"}
+        with Context.scope(request):
+            self.assertEqual(handler(request), "sqlite")
+            self.assertEqual(db(request), "db")
+            events.append("handled")
+        self.assertEqual(
+            events,
+            ["config", "connect sqlite", "handled", "disconnect", "close config"],
+        )
+        with Context.scope(request):
+            db(request)
+        self.assertEqual(events.count("connect sqlite"), 2)
+
+    @note("약한 참조를 만들 수 없는 컨텍스트는 스코프 밖에서 TypeError가 나야됨")
+    def test_4(self):
+        provider = Context.provider(lambda request: len(request))
+        with self.assertRaises(TypeError):
+            provider({"a": 1})
+        with Context.scope({"a": 1}) as scope:
+            self.assertEqual(provider(scope.context), 1)
+
+    @note("스코프의 provider는 여러 스레드에서 동시에 불러도 한번만 계산되어야됨")
+    def test_5(self):
+        import contextvars
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls: list[int] = []
+
+        @Context.provider
+        def slow(request: Request):
+            calls.append(1)
+            time.sleep(0.01)
+            return request.raw
+
+        request = Request("x")
+        with Context.scope(request):
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(4) as executor:
+                futures = [
+                    executor.submit(context.copy().run, slow, request) for _ in range(8)
+                ]
+                self.assertEqual({future.result() for future in futures}, {"x"})
+        self.assertEqual(calls, [1])
+
+    @note("provider는 ==가 같더라도 다른 컨텍스트 객체와 값을 공유하지 않아야됨")
+    def test_6(self):
+        class Same(Request):
+            def __eq__(self, other: object):
+                return isinstance(other, Same)
+
+            def __hash__(self):
+                return 0
+
+        provider = Context.provider(lambda request: request.raw)
+        self.assertEqual(provider(Same("a")), "a")
+        self.assertEqual(provider(Same("b")), "b")
+
+    @note("provider는 컨텍스트 객체를 건드리지 않고 복사본과 값을 공유하지 않아야됨")
+    def test_7(self):
+        import copy
+        from dataclasses import dataclass
+
+        @dataclass(frozen=True)
+        class Frozen:
+            user: str
+
+        greeting = Context.provider(lambda request: f"hi {request.user}")
+        frozen = Frozen("a")
+        self.assertEqual(greeting(frozen), "hi a")
+        self.assertEqual(vars(frozen), {"user": "a"})
+
+        request = Request("a")
+        raw = Context.provider(lambda request: f"hi {request.raw}")
+        self.assertEqual(raw(request), "hi a")
+        copied = copy.copy(request)
+        copied.raw = "b"
+        self.assertEqual(raw(copied), "hi b")
+        self.assertEqual(raw(request), "hi a")
+
+    @note(
+        "스코프의 provider는 값을 계산하는 동안 다른 스레드의 다른 provider 조회를 막지 않아야됨"
+    )
+    def test_8(self):
+        import contextvars
+        import threading
+
+        @Context.provider
+        def name(request: Request):
+            return request.raw
+
+        @Context.provider
+        def greeting(request: Request):
+            # 다른 스레드에서 같은 스코프의 name을 계산함
+            thread = threading.Thread(target=context.run, args=(name, request))
+            thread.start()
+            thread.join(2)
+            self.assertFalse(thread.is_alive())
+            return "hi " + name(request)
+
+        request = Request("a")
+        with Context.scope(request):
+            context = contextvars.copy_context()
+            self.assertEqual(greeting(request), "hi a")
+
+
+class TestContextGather(TestCase):
+    @note("gather는 독립적인 컨텍스트들을 스레드에서 동시에 실행해 튜플로 반환해야됨")
+    def test_1(self):
+        import threading
+
+        barrier = threading.Barrier(3, timeout=1)
+
+        def reader(offset: int):
+            def read(context: int):
+                barrier.wait()
+                return context + offset
+
+            return Context(read)
+
+        gathered = Context.gather(reader(1), reader(2), reader(3))
+        self.assertEqual(gathered(10), (11, 12, 13))
+
+    @note("max_concurrency 이상으로 동시에 실행되면 안됨")
+    def test_2(self):
+        import threading
+        import time
+
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def read(context: int):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+            return context
+
+        contexts = [Context(read) for _ in range(6)]
+        self.assertEqual(Context.gather(*contexts, max_concurrency=2)(1), (1,) * 6)
+        self.assertEqual(running[1], 2)
+
+    @note(
+        "하나가 실패하면 시작하지 않은 컨텍스트는 취소되고 그 예외가 그대로 던져져야됨"
+    )
+    def test_3(self):
+        started: list[int] = []
+
+        def reader(index: int):
+            def read(context: int):
+                started.append(index)
+                if index == 0:
+                    raise ValueError(index)
+                return index
+
+            return Context(read)
+
+        gathered = Context.gather(*map(reader, range(5)), max_concurrency=1)
+        with self.assertRaises(ValueError):
+            gathered(0)
+        self.assertEqual(started, [0])
+
+    @note(
+        "코루틴 컨텍스트가 섞여있으면 asyncio로 실행되고, 실패하면 나머지를 취소해야됨"
+    )
+    def test_4(self):
+        import asyncio
+
+        cancelled: list[str] = []
+
+        async def fetch(context: int):
+            await asyncio.sleep(0)
+            return context * 2
+
+        async def slow(context: int):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+
+        async def broken(context: int):
+            await asyncio.sleep(0)
+            raise KeyError(context)
+
+        gathered = Context(fetch).zip(Context(lambda context: context + 1))
+        self.assertEqual(asyncio.run(gathered(3)), (6, 4))
+
+        with self.assertRaises(KeyError):
+            asyncio.run(Context.gather(Context(slow), Context(broken))(3))
+        self.assertEqual(cancelled, ["slow"])
+
+    @note("gather 안의 스레드에서도 호출한 쪽의 스코프가 보여야됨")
+    def test_5(self):
+        calls: list[str] = []
+
+        @Context.provider
+        def parsed(request: Request):
+            calls.append(request.raw)
+            return request.raw.split(",")
+
+        first = parsed.pipe(Context(lambda values: values[0]))
+        size = parsed.pipe(Context(len))
+        request = Request("a,b,c")
+        with Context.scope(request):
+            self.assertEqual(first.zip(size)(request), ("a", 3))
+        self.assertEqual(calls, ["a,b,c"])
+
+    @note(
+        "스코프의 provider 안에서 gather를 불러도 멈추지 않고 같은 스레드풀을 재사용해야됨"
+    )
+    def test_6(self):
+        import threading
+
+        from .context import default_executor
+
+        @Context.provider
+        def parsed(request: Request):
+            return request.raw.split(",")
+
+        @Context.provider
+        def summary(request: Request):
+            first = parsed.pipe(Context(lambda values: values[0]))
+            return first.zip(parsed.pipe(Context(len)))(request)
+
+        request = Request("a,b,c")
+        results: list[tuple] = []
+
+        def handle():
+            with Context.scope(request):
+                results.append(summary(request))
+                results.append(summary.zip(parsed)(request))
+
+        thread = threading.Thread(target=handle, daemon=True)
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [("a", 3), (("a", 3), ["a", "b", "c"])])
+        self.assertIs(default_executor(), default_executor())
+
+
+from .persistent import PMap, PVector
+
+
+class TestPersistent(TestCase):
+    @note("PMap의 set/delete는 새 맵을 반환하고 이전 맵은 그대로 남아야됨")
+    def test_1(self):
+        before = PMap({"a": 1})
+        after = before.set("b", 2).set("a", 3)
+        self.assertEqual(before, {"a": 1})
+        self.assertEqual(after, {"a": 3, "b": 2})
+        self.assertEqual(after.delete("b"), {"a": 3})
+        self.assertIs(after.set("a", 3), after)
+        with self.assertRaises(KeyError):
+            before.delete("b")
+
+    @note("해시가 같은 키들도 구분되어야됨")
+    def test_2(self):
+        class Key:
+            def __init__(self, raw: int):
+                self.raw = raw
+
+            def __hash__(self):
+                return 1
+
+            def __eq__(self, other: object):
+                return isinstance(other, Key) and other.raw == self.raw
+
+        pmap = PMap((Key(i), i) for i in range(5))
+        self.assertEqual(len(pmap), 5)
+        self.assertEqual(pmap[Key(3)], 3)
+        smaller = pmap.delete(Key(3)).delete(Key(0))
+        self.assertEqual(sorted(smaller.values()), [1, 2, 4])
+        self.assertNotIn(Key(3), smaller)
+
+    @note("큰 PMap을 갱신해도 바뀐 경로 밖의 노드는 공유되어야됨")
+    def test_3(self):
+        before = PMap((i, i) for i in range(10_000))
+        after = before.set(0, -1)
+        shared = set(map(id, before.root.children)) & set(map(id, after.root.children))
+        self.assertEqual(len(shared), len(before.root.children) - 1)
+        self.assertEqual(before[0], 0)
+        self.assertEqual(after[0], -1)
+
+    @note("PVector는 append와 set으로 새 벡터를 반환하고 인덱스로 접근 가능해야됨")
+    def test_4(self):
+        size = 32 * 32 + 33
+        vector = PVector(range(size))
+        self.assertEqual(list(vector), list(range(size)))
+        changed = vector.set(5, "x").set(-1, "y").append("z")
+        self.assertEqual(changed[5], "x")
+        self.assertEqual(changed[-2], "y")
+        self.assertEqual(changed[-1], "z")
+        self.assertEqual(vector[5], 5)
+        self.assertEqual(len(vector), size)
+        self.assertEqual(vector[2:5], PVector([2, 3, 4]))
+        with self.assertRaises(IndexError):
+            vector[size]
+
+    @note("State.get/put/modify로 영속 상태를 복사 없이 갱신할 수 있어야됨")
+    def test_5(self):
+        def count(word: str):
+            return State.modify(lambda words: words.set(word, words.get(word, 0) + 1))
+
+        program: State = State.of(None)
+        for word in "a b a c a".split():
+            program = program.bind(lambda _, word=word: count(word))
+        program = program.bind(lambda _: State.gets(len))
+
+        initial = PMap[str, int]()
+        self.assertEqual(program.run(initial), (3, {"a": 3, "b": 1, "c": 1}))
+        self.assertEqual(len(initial), 0)
+        self.assertEqual(State.get().run(1), (1, 1))
+        self.assertEqual(State.put(2).run(1), (None, 2))
+
+
+class TestCompile(TestCase):
+    @note("컴파일된 메이비 체인은 같은 체인을 직접 실행한 것과 같은 결과를 반환해야됨")
+    def test_1(self):
+        def build(maybe: Maybe[str]) -> Maybe[int]:
+            return (
+                maybe.map(str.strip)
+                .bind(lambda text: Maybe.of(int(text) if text.isdigit() else None))
+                .map(lambda number: number * 2)
+            )
+
+        compiled = Maybe.compile(build)
+        for value in [" 21 ", "x", None]:
+            self.assertEqual(compiled(value), build(Maybe.of(value)))
+        self.assertEqual(compiled(" 21 ").get(), 42)
+        self.assertIs(compiled("x"), Nothing)
+
+    @note(
+        "컴파일된 리절트 체인은 예외를 Failed로 바꾸고 flat_bind의 Failed를 그대로 반환해야됨"
+    )
+    def test_2(self):
+        failed = Failed(KeyError("missing"))
+        compiled = Result.compile(
+            lambda result: result.bind(lambda value: 1 / value)
+            .flat_bind(lambda value: failed if value > 1 else Success(value))
+            .bind(str)
+        )
+        self.assertEqual(compiled(2), Success("0.5"))
+        self.assertIsInstance(compiled(0).value, ZeroDivisionError)
+        self.assertIs(compiled(0.25), failed)
+
+    @note("같은 모양의 체인은 생성된 코드를 공유해야됨")
+    def test_3(self):
+        first = Maybe.compile(lambda maybe: maybe.map(str).map(len))
+        second = Maybe.compile(lambda maybe: maybe.map(repr).map(hash))
+        self.assertIs(first.__code__, second.__code__)
+        self.assertEqual(first(100).get(), 3)
+        with self.assertRaises(AttributeError):
+            Maybe.compile(lambda maybe: maybe.flat_bind(str))
+
+    @note("트레이서가 켜져있으면 컴파일된 체인도 단계별로 기록되어야됨")
+    def test_4(self):
+        compiled = Maybe.compile(lambda maybe: maybe.bind(half).map(cube))
+        with trace.tracing() as tracer:
+            self.assertEqual(compiled(4).get(), 8)
+        self.assertEqual(
+            [span.kind for span in tracer.spans], ["Maybe.bind", "Maybe.map"]
+        )
+
+
+class TestImportTime(TestCase):
+    @note("핫패스 모듈을 임포트하는 것만으로 무거운 모듈들을 불러오면 안됨")
+    def test_1(self):
+        import subprocess
+        import sys
+
+        from benchmarks.importtime import MODULES, probe
+
+        for module in MODULES:
+            # site가 미리 불러오는 모듈과 구분되도록 -S로 실행함
+            output = subprocess.run(
+                [sys.executable, "-S", "-c", probe(module)],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            self.assertEqual(output.strip(), "", module)
+
+    @note("패키지의 공개 이름은 처음 접근할 때 임포트되어야됨")
+    def test_2(self):
+        import subprocess
+        import sys
+
+        probe = (
+            "import sys, monads; loaded = 'monads.delay' in sys.modules; "
+            "monads.Delay; print(loaded, 'monads.delay' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.split(), ["False", "True"])
+        with self.assertRaises(AttributeError):
+            import monads
+
+            monads.Missing
+
+
+class TestErrorCode(TestCase):
+    @note(
+        "Failed.with_code는 코드마다 같은 인스턴스를 반환하고, 코드가 다르면 다른 실패여야됨"
+    )
+    def test_1(self):
+        not_found = Failed.with_code(404, "not found")
+        self.assertIs(Failed.with_code(404), not_found)
+        with self.assertRaises(ValueError):
+            Failed.with_code(404, "gone")
+        self.assertEqual(not_found.code, 404)
+        self.assertEqual(str(not_found.value), "[404] not found")
+        self.assertNotEqual(not_found, Failed.with_code(500))
+        self.assertIsNone(Failed(ValueError()).code)
+        self.assertIs(not_found.bind(str), not_found)
+
+    @note("wraps의 codes에 있는 예외는 공유된 코드 Failed로 바뀌어야됨")
+    def test_2(self):
+        @Result.wraps(codes={KeyError: 1, LookupError: 2})
+        def find(key: str) -> int:
+            return {"a": 1}[key] if key != "i" else [][0]
+
+        self.assertEqual(find("a"), Success(1))
+        self.assertIs(find("b"), Failed.with_code(1))
+        self.assertIs(find("i"), Failed.with_code(2))
+
+    @note("capture_traceback=False면 트레이스백을 남기지 않아야됨")
+    def test_3(self):
+        def fail(value: int) -> int:
+            raise ValueError(value)
+
+        self.assertIsNotNone(Result.wraps(fail)(1).value.__traceback__)
+        failed = Result.wraps(capture_traceback=False)(fail)(1)
+        self.assertIsInstance(failed.value, ValueError)
+        self.assertIsNone(failed.value.__traceback__)
+
+    @note("코드 Failed는 pickle을 거쳐도 같은 코드 인스턴스로 돌아와야됨")
+    def test_4(self):
+        import pickle
+
+        failed = Failed.with_code(7, "seven")
+        self.assertIs(pickle.loads(pickle.dumps(failed)).value, failed.value)
+
+    @note(
+        "메시지는 처음 등록할 때 정해지고, 다른 메시지로 바꾸려 하면 ValueError가 나야됨"
+    )
+    def test_5(self):
+        import pickle
+
+        bare = Failed.with_code(410)
+        with self.assertRaises(ValueError):
+            Failed.with_code(410, "gone")
+        self.assertEqual(str(bare.value), "[410]")
+        self.assertIs(Failed.with_code(410), bare)
+        data = pickle.dumps(ErrorCode(410, "gone"))
+        self.assertIs(pickle.loads(data), bare.value)
+
+    @note("codes는 넣은 순서와 상관없이 가장 구체적인 예외 클래스의 코드를 써야됨")
+    def test_6(self):
+        @Result.wraps(codes={LookupError: 2, KeyError: 1})
+        def find(key: str) -> int:
+            return {"a": 1}[key] if key != "i" else [][0]
+
+        self.assertIs(find("b"), Failed.with_code(1))
+        self.assertIs(find("i"), Failed.with_code(2))
+
+
+from .aggregate import Aggregator
+
+
+class TestAggregator(TestCase):
+    @note("성공은 reducer로 접고, 실패는 처음 keep개와 종류별 개수만 남아야됨")
+    def test_1(self):
+        import operator
+
+        aggregator = Aggregator(operator.add, 0, keep=2)
+        report = aggregator.run(int, ["1", "x", "2", "y", "z", "3"])
+        self.assertEqual(report.value, 6)
+        self.assertEqual(report.successes, 3)
+        self.assertEqual(report.failures, 3)
+        self.assertEqual(len(report.first), 2)
+        self.assertEqual(report.counts, {"ValueError": 3})
+        self.assertIs(report.result(), report.first[0])
+        self.assertFalse(report.stopped)
+
+    @note("fail_fast만큼 실패하면 나머지 입력은 소비하지 않아야됨")
+    def test_2(self):
+        consumed: list[int] = []
+
+        def inputs():
+            for index in range(100):
+                consumed.append(index)
+                yield index
+
+        aggregator = Aggregator(lambda total, _: total + 1, 0, fail_fast=2)
+        report = aggregator.run(lambda index: 1 // (index % 3), inputs())
+        self.assertTrue(report.stopped)
+        self.assertEqual(report.failures, 2)
+        self.assertEqual(len(consumed), 4)
+        self.assertEqual(report.counts, {"ZeroDivisionError": 2})
+
+    @note("executor로 청크를 나눠 실행해도 순차 실행과 같은 결과여야됨")
+    def test_3(self):
+        import operator
+        from concurrent.futures import ThreadPoolExecutor
+
+        aggregator = Aggregator(operator.add, 0)
+        inputs = [str(index) if index % 7 else "?" for index in range(1000)]
+        expected = aggregator.run(int, inputs)
+        with ThreadPoolExecutor(4) as executor:
+            report = aggregator.run(int, inputs, executor=executor, chunksize=64)
+        self.assertEqual(report.value, expected.value)
+        self.assertEqual(report.counts, expected.counts)
+        self.assertEqual(len(report.first), 10)
+        self.assertEqual(report.result(), Result.wraps(int)("?"))
+
+    @note("코드로 된 실패는 코드별로 세어야됨")
+    def test_4(self):
+        aggregator = Aggregator(lambda total, value: total + value, 0)
+        limited = Failed.with_code(429, "too many requests")
+        report = aggregator.feed([Success(1), limited, limited, Success(2)])
+        self.assertEqual(report.value, 3)
+        self.assertEqual(report.counts, {"[429] too many requests": 2})
+
+    @note("initial이 항등원이 아니어도 executor로 실행한 결과가 순차 실행과 같아야됨")
+    def test_5(self):
+        import operator
+        from concurrent.futures import ThreadPoolExecutor
+
+        aggregator = Aggregator(operator.add, 100)
+        collect = Aggregator(
+            lambda items, item: items + [item], [], combine=operator.add
+        )
+        broken = Aggregator(
+            lambda items, item: items + [item], [0], combine=operator.add
+        )
+        with ThreadPoolExecutor(4) as executor:
+            report = aggregator.run(int, range(10), executor=executor, chunksize=2)
+            collected = collect.run(int, range(10), executor=executor, chunksize=3)
+            with self.assertRaises(ValueError):
+                broken.run(int, range(10), executor=executor)
+        self.assertEqual(report.value, aggregator.run(int, range(10)).value)
+        self.assertEqual(report.value, 145)
+        self.assertEqual(collected.value, list(range(10)))
+
+    @note(
+        "프로세스 풀에서 성공이 하나도 없는 청크가 있어도 순차 실행과 같은 결과여야됨"
+    )
+    def test_6(self):
+        import operator
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor
+
+        from .aggregate import EMPTY
+
+        self.assertIs(pickle.loads(pickle.dumps(EMPTY)), EMPTY)
+        aggregator = Aggregator(operator.add, 0)
+        inputs = ["1", "2", "x", "y", "5", "6"]
+        with ProcessPoolExecutor(2) as executor:
+            report = aggregator.run(int, inputs, executor=executor, chunksize=2)
+        self.assertEqual(report.value, aggregator.run(int, inputs).value)
+        self.assertEqual(report.value, 14)
+        self.assertEqual(report.counts, {"ValueError": 2})
+
+
+class TestMonoidFold(TestCase):
+    @note("fold는 왼쪽부터 접은 것과 같은 순서로 합쳐야됨")
+    def test_1(self):
+        import functools
+        import operator
+
+        maybes = [Maybe.of(str(index)) for index in range(1000)]
+        left = functools.reduce(lambda a, b: a.combined(b, operator.add), maybes)
+        self.assertEqual(Maybe.fold(maybes, operator.add), left)
+        self.assertEqual(Maybe.mconcat(maybes[:3], operator.add).get(), "012")
+
+    @note("비어있으면 항등원을, 빈 값이 섞여있으면 빈 값을 반환해야됨")
+    def test_2(self):
+        import operator
+
+        self.assertIs(Maybe.fold([], operator.add), Nothing)
+        self.assertIs(Result.fold([], operator.add), Result.identity())
+        results = [Success(1), Failed(ValueError()), Success(2)]
+        self.assertIsInstance(Result.fold(results, operator.add), Failed)
+        self.assertEqual(
+            Result.fold([Success(1), Success(2)], operator.add), Success(3)
+        )
+
+    @note("딜레이도 fold로 합성할 수 있어야됨")
+    def test_3(self):
+        def compose(f: Callable, g: Callable):
+            return lambda value: g(f(value))
+
+        delays = [
+            Delay(lambda value, index=index: value * 10 + index) for index in range(5)
+        ]
+        self.assertEqual(Delay.fold(delays, compose).run(0), 1234)
+        self.assertEqual(Delay.fold([], compose).run(7), 7)
+
+    @note("executor로 청크를 나눠 줄여도 순서가 유지되어야됨")
+    def test_4(self):
+        import operator
+        from concurrent.futures import ThreadPoolExecutor
+
+        maybes = [Maybe.of([index]) for index in range(5000)]
+        with ThreadPoolExecutor(4) as executor:
+            folded = Maybe.fold(maybes, operator.add, executor=executor, chunksize=256)
+        self.assertEqual(folded.get(), list(range(5000)))
+
+
+from .policy import Backoff, CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class TestPolicy(TestCase):
+    @note("정책은 실패하면 지수 백오프만큼 기다렸다가 다시 시도해야됨")
+    def test_1(self):
+        slept: list[float] = []
+        calls: list[int] = []
+        policy = RetryPolicy(
+            attempts=4, backoff=Backoff(0.1, jitter=False), sleep=slept.append
+        )
+
+        @Result.wraps(policy=policy)
+        def flaky(value: int) -> int:
+            calls.append(value)
+            if len(calls) < 3:
+                raise ConnectionError()
+            return value
+
+        self.assertEqual(flaky(7), Success(7))
+        self.assertEqual(slept, [0.1, 0.2])
+        summary = policy.summary()
+        self.assertEqual(summary["attempts"], 3)
+        self.assertEqual(summary["retries"], 2)
+        self.assertEqual(summary["successes"], 1)
+
+    @note(
+        "retry_on에 없는 예외는 재시도하지 않고, 횟수를 다 쓰면 마지막 실패를 반환해야됨"
+    )
+    def test_2(self):
+        calls: list[int] = []
+
+        def attempt() -> Result[int]:
+            calls.append(1)
+            return Failed(KeyError() if len(calls) > 2 else ConnectionError())
+
+        policy = RetryPolicy(attempts=5, retry_on=(ConnectionError,))
+        self.assertIsInstance(Result.retry(attempt, policy).value, KeyError)
+        self.assertEqual(len(calls), 3)
+        self.assertIsInstance(
+            Result.retry(attempt, RetryPolicy(attempts=1)).value, KeyError
+        )
+        self.assertEqual(policy.summary()["failures"], 1)
+
+    @note("데드라인을 넘기면 더 시도하지 않고 TimeoutError로 실패해야됨")
+    def test_3(self):
+        now = [0.0]
+        policy = RetryPolicy(
+            attempts=10,
+            backoff=Backoff(1.0, jitter=False),
+            deadline=5.0,
+            clock=lambda: now[0],
+            sleep=lambda seconds: now.__setitem__(0, now[0] + seconds),
+        )
+        result = Result.retry(lambda: Failed(ConnectionError()), policy)
+        self.assertIsInstance(result.value, TimeoutError)
+        self.assertIsInstance(result.value.__cause__, ConnectionError)
+        self.assertEqual(now[0], 3.0)
+        self.assertEqual(policy.summary()["timeouts"], 1)
+
+    @note(
+        "서킷 브레이커가 열리면 호출하지 않고 바로 실패하고, 시간이 지나면 시험 호출로 닫혀야됨"
+    )
+    def test_4(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failures=2, reset=10, clock=lambda: now[0])
+        policy = RetryPolicy(attempts=1, breaker=breaker)
+        calls: list[bool] = []
+        healthy = [False]
+
+        @Result.wraps(policy=policy)
+        def call() -> str:
+            calls.append(True)
+            if not healthy[0]:
+                raise ConnectionError()
+            return "ok"
+
+        call(), call()
+        self.assertEqual(breaker.state, "open")
+        rejected = call()
+        self.assertIsInstance(rejected.value, CircuitOpenError)
+        self.assertIs(rejected, call())
+        self.assertEqual(len(calls), 2)
+
+        now[0] = 11
+        healthy[0] = True
+        self.assertEqual(call(), Success("ok"))
+        self.assertEqual(breaker.state, "closed")
+        summary = policy.summary()
+        self.assertEqual(summary["rejected"], 2)
+        self.assertEqual(summary["breaker"]["opened"], 1)
+
+    @note("비동기 정책은 재시도하고, 데드라인이 지나면 실행중인 시도를 취소해야됨")
+    def test_5(self):
+        import asyncio
+
+        calls: list[int] = []
+
+        @AsyncResult.wraps(policy=RetryPolicy(attempts=3))
+        async def flaky() -> int:
+            calls.append(1)
+            await asyncio.sleep(0)
+            if len(calls) < 2:
+                raise ConnectionError()
+            return len(calls)
+
+        self.assertEqual(asyncio.run(flaky().run()), Success(2))
+
+        cancelled: list[bool] = []
+
+        async def hang() -> Result[int]:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return Success(1)
+
+        result = asyncio.run(AsyncResult.retry(hang, RetryPolicy(deadline=0.01)).run())
+        self.assertIsInstance(result.value, TimeoutError)
+        self.assertEqual(cancelled, [True])
+
+    @note("비동기 정책은 재시도 사이에 주입된 async_sleep으로 기다려야됨")
+    def test_6(self):
+        import asyncio
+        import time
+
+        slept: list[float] = []
+
+        async def sleep(seconds: float):
+            slept.append(seconds)
+
+        policy = RetryPolicy(
+            attempts=3, backoff=Backoff(1.0, jitter=False), async_sleep=sleep
+        )
+
+        async def broken() -> Result[int]:
+            return Failed(ConnectionError())
+
+        start = time.perf_counter()
+        result = asyncio.run(AsyncResult.retry(broken, policy).run())
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertIsInstance(result.value, ConnectionError)
+        self.assertEqual(slept, [1.0, 2.0])
+
+
+class TestHashable(TestCase):
+    @note("같은 값의 메이비는 같은 해시를 가져 딕셔너리와 집합의 키로 쓸 수 있어야됨")
+    def test_1(self):
+        keys = {Maybe.of(1): "one", Nothing: "none"}
+        self.assertEqual(keys[Maybe.of(1)], "one")
+        self.assertEqual(keys[Maybe.nothing()], "none")
+        self.assertEqual(len({Maybe.of("a"), Maybe.of("a"), Maybe.of("b")}), 2)
+        with self.assertRaises(TypeError):
+            hash(Maybe.of([1]))
+
+    @note("Failed는 예외 클래스로, 코드로 된 실패는 코드로 해시되어야됨")
+    def test_2(self):
+        self.assertEqual(hash(Success(1)), hash(Success(1)))
+        self.assertNotEqual(Success(1), Failed(ValueError(1)))
+        self.assertEqual(Failed(ValueError("a")), Failed(ValueError("b")))
+        self.assertEqual(hash(Failed(ValueError("a"))), hash(Failed(ValueError("b"))))
+        self.assertEqual(len({Failed.with_code(1), Failed.with_code(2)}), 2)
+        self.assertNotEqual(Failed.with_code(1), Failed.with_code(2))
+
+    @note("메이비와 리절트는 만든 뒤 값을 바꿀 수 없어야됨")
+    def test_3(self):
+        import pickle
+
+        maybe, success = Maybe.of(1), Success(2)
+        for monad in (maybe, success):
+            with self.assertRaises(AttributeError):
+                monad.value = 3  # type:ignore
+        self.assertEqual(pickle.loads(pickle.dumps(maybe)), maybe)
+        self.assertIs(pickle.loads(pickle.dumps(Nothing)), Nothing)
+        self.assertEqual(pickle.loads(pickle.dumps(success)), success)
+
+    @note("메이비를 인자로 받는 함수도 메모이제이션 할 수 있어야됨")
+    def test_4(self):
+        calls: list[int] = []
+
+        @Delay
+        def double(maybe: Maybe[int]) -> Maybe[int]:
+            calls.append(1)
+            return maybe.map(lambda value: value * 2)
+
+        memoized = double.cached()
+        self.assertEqual(memoized.run(Maybe.of(2)), Maybe.of(4))
+        self.assertEqual(memoized.run(Maybe.of(2)), Maybe.of(4))
+        self.assertEqual(len(calls), 1)
+
+
+class TestBatched(TestCase):
+    @note(
+        "배치로 감싼 함수는 호출들을 모아 한번에 실행하고 None은 nothing으로 돌려줘야됨"
+    )
+    def test_1(self):
+        calls: list[list[int]] = []
+
+        @Maybe.batched
+        def lookup(keys: list[int]) -> list[str | None]:
+            calls.append(keys)
+            return [str(key) if key % 2 else None for key in keys]
+
+        one, two, three = lookup(1), lookup(2), lookup(3)
+        self.assertEqual(calls, [])
+        self.assertEqual(one.map(lambda maybe: maybe.get()).run(), "1")
+        self.assertIs(two.run(), Nothing)
+        self.assertEqual(three.run(), Maybe.of("3"))
+        self.assertEqual(calls, [[1, 2, 3]])
+
+    @note("리절트 배치는 값마다의 예외와 배치 전체의 예외를 각각 Failed로 돌려줘야됨")
+    def test_2(self):
+        @Result.batched
+        def fetch(keys: list[int]) -> list[int | Exception]:
+            return [ValueError(key) if key < 0 else key * 10 for key in keys]
+
+        @Result.batched
+        def broken(keys: list[int]) -> list[int]:
+            raise ConnectionError()
+
+        @Result.batched
+        def mapped(keys: list[int]) -> dict[int, int]:
+            return {key: key for key in keys if key}
+
+        ok, failed = fetch(1), fetch(-1)
+        self.assertEqual(ok.run(), Success(10))
+        self.assertIsInstance(failed.run().value, ValueError)
+        self.assertIsInstance(broken(1).run().value, ConnectionError)
+        found, missing = mapped(1), mapped(0)
+        self.assertEqual(found.run(), Success(1))
+        self.assertIsInstance(missing.run().value, KeyError)
+
+    @note("배치는 size개가 모이면 바로 나가고 같은 키는 한번만 요청해야됨")
+    def test_3(self):
+        calls: list[list[str]] = []
+
+        @Result.batched(size=2)
+        def fetch(keys: list[str]) -> list[str]:
+            calls.append(keys)
+            return [key.upper() for key in keys]
+
+        handles = [fetch(key) for key in "aab"]
+        self.assertEqual(calls, [["a", "b"]])
+        handles.append(fetch("c"))
+        self.assertEqual([handle.run().value for handle in handles], list("AABC"))
+        self.assertEqual(calls, [["a", "b"], ["c"]])
+
+    @note("코루틴 함수의 배치는 같은 틱에 await 된 호출들을 한번에 실행해야됨")
+    def test_4(self):
+        import asyncio
+
+        calls: list[list[int]] = []
+
+        @Result.batched
+        async def fetch(keys: list[int]) -> list[float | Exception]:
+            calls.append(keys)
+            return [1 / key if key else ZeroDivisionError() for key in keys]
+
+        async def main():
+            gathered = await AsyncResult.gather(fetch(1), fetch(2), fetch(4))
+            failed = await fetch(0)
+            return gathered, failed
+
+        gathered, failed = asyncio.run(main())
+        self.assertEqual(gathered, Success((1.0, 0.5, 0.25)))
+        self.assertIsInstance(failed.value, ZeroDivisionError)
+        self.assertEqual(calls, [[1, 2, 4], [0]])
+
+
+class TestCheckpoints(TestCase):
+    @note(
+        "체크포인트가 있으면 뒤에 스텝을 이어붙인 체인은 앞부분을 다시 실행하지 않아야됨"
+    )
+    def test_1(self):
+        calls: list[int] = []
+
+        def step(index: int):
+            def run(total: int):
+                calls.append(index)
+                return index, total + index
+
+            return lambda _: State(run)
+
+        checkpoints = Checkpoints()
+        initial = 0
+        prefix = State.of(None)
+        for index in range(1, 4):
+            prefix = prefix.bind(step(index))
+        self.assertEqual(prefix.run(initial, checkpoints), (3, 6))
+        self.assertEqual(calls, [1, 2, 3])
+
+        calls.clear()
+        longer = prefix.bind(step(4))
+        other = prefix.bind(step(5))
+        self.assertEqual(longer.run(initial, checkpoints), (4, 10))
+        self.assertEqual(other.run(initial, checkpoints), (5, 11))
+        self.assertEqual(calls, [4, 5])
+        self.assertEqual(longer.run(initial, checkpoints), longer.run(initial))
+
+    @note("체크포인트는 초기 상태가 다르면 쓰지 않고 interval과 maxsize를 지켜야됨")
+    def test_2(self):
+        calls: list[int] = []
+
+        def increase(_: object):
+            def run(total: int):
+                calls.append(total)
+                return total, total + 1
+
+            return State(run)
+
+        chain = State.of(None)
+        for _ in range(10):
+            chain = chain.bind(increase)
+        checkpoints = Checkpoints(interval=4, maxsize=2)
+        self.assertEqual(chain.run(0, checkpoints), (9, 10))
+        self.assertEqual(chain.run(100, checkpoints), (109, 110))
+        self.assertEqual(len(calls), 20)
+        info = checkpoints.cache_info()
+        self.assertEqual(info.currsize, 2)
+        self.assertGreater(info.evictions, 0)
+        with self.assertRaises(ValueError):
+            Checkpoints(interval=0)
+
+    @note("체크포인트는 체인 길이와 상관없이 실행 한번마다 적중이나 실패를 한번 세야됨")
+    def test_3(self):
+        chain = State.of(0)
+        for _ in range(1_000):
+            chain = chain.bind(lambda value: State(lambda total: (value, total + 1)))
+        checkpoints = Checkpoints(interval=100)
+        self.assertEqual(chain.run(0, checkpoints), (0, 1_000))
+        self.assertEqual(chain.run(1, checkpoints), (0, 1_001))
+        info = checkpoints.cache_info()
+        self.assertEqual((info.hits, info.misses), (0, 2))
+
+        self.assertEqual(chain.run(0, checkpoints), (0, 1_000))
+        self.assertEqual(chain.bind(State.of).run(0, checkpoints), (0, 1_000))
+        info = checkpoints.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 2))
+
+
+class TestProgram(TestCase):
+    def profiles(self, calls: list):
+        def users(ids: list[int]) -> dict[int, str]:
+            calls.append(("users", ids))
+            return {id: f"user{id}" for id in ids if id >= 0}
+
+        def posts(names: list[str]) -> list[int]:
+            calls.append(("posts", names))
+            return [len(name) for name in names]
+
+        def greet(name: str) -> str:
+            calls.append(("greet", name))
+            return f"hi {name}"
+
+        def profile(id: int) -> Program[tuple]:
+            return Program.fetch(users, id).bind(
+                lambda name: Program.all(
+                    Program.fetch(posts, name), Program.effect(greet, name)
+                )
+            )
+
+        return Program.all(*(profile(id) for id in (1, 2, 1)))
+
+    @note("프로그램은 만들때는 실행되지 않고 Direct로 실행하면 순서대로 실행되어야됨")
+    def test_1(self):
+        calls: list = []
+        program = self.profiles(calls)
+        self.assertEqual(calls, [])
+        expected = ((5, "hi user1"), (5, "hi user2"), (5, "hi user1"))
+        self.assertEqual(program.run(), expected)
+        self.assertEqual(len(calls), 9)
+
+        chain = Program.pure(0)
+        for _ in range(20000):
+            chain = chain.map(lambda value: value + 1)
+        self.assertEqual(chain.run(), 20000)
+        self.assertEqual(chain.run(Batch()), 20000)
+
+    @note("Batch는 라운드마다 같은 bulk를 한번에 부르고 같은 효과는 한번만 실행해야됨")
+    def test_2(self):
+        calls: list = []
+        program = self.profiles(calls)
+        self.assertEqual(program.run(Batch()), program.run())
+        calls.clear()
+        program.run(Batch())
+        self.assertEqual(
+            calls,
+            [
+                ("users", [1, 2]),
+                ("greet", "user1"),
+                ("greet", "user2"),
+                ("posts", ["user1", "user2"]),
+            ],
+        )
+
+    @note("Concurrent는 독립적인 가지를 동시에 실행하고 중첩되어도 멈추지 않아야됨")
+    def test_3(self):
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def wait(seconds: float) -> float:
+            time.sleep(seconds)
+            return seconds
+
+        program = Program.all(*(Program.effect(wait, 0.05) for _ in range(4)))
+        with ThreadPoolExecutor(4) as pool:
+            start = time.perf_counter()
+            self.assertEqual(program.run(Concurrent(pool)), (0.05,) * 4)
+            self.assertLess(time.perf_counter() - start, 0.15)
+        nested = Program.all(program, program.map(sum))
+        with ThreadPoolExecutor(1) as pool:
+            self.assertEqual(nested.run(Concurrent(pool)), ((0.05,) * 4, 0.2))
+
+    @note(
+        "효과의 예외와 bulk가 돌려준 예외는 어느 인터프리터든 run 밖으로 전파되어야됨"
+    )
+    def test_4(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        broken = Program.all(Program.pure(1), Program.effect(int, "x"))
+        with ThreadPoolExecutor(2) as pool:
+            for interpreter in (None, Batch(), Batch(pool), Concurrent(pool)):
+                with self.assertRaises(ValueError):
+                    broken.run(interpreter)
+        lookup = Program.fetch(lambda ids: {}, 1)
+        for interpreter in (None, Batch()):
+            with self.assertRaises(KeyError):
+                lookup.run(interpreter)
+
+    @note(
+        "Batch는 효과가 이어지는 긴 순차 프로그램도 단계 수에 비례하는 시간에 실행해야됨"
+    )
+    def test_5(self):
+        import time
+
+        program = Program.pure(0)
+        for _ in range(20_000):
+            program = program.bind(lambda value: Program.effect(abs, value + 1))
+        start = time.perf_counter()
+        self.assertEqual(program.run(Batch()), 20_000)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        both = Program.all(program, program.map(str))
+        self.assertEqual(both.run(Batch()), (20_000, "20000"))
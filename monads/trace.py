@@ -0,0 +1,191 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+from . import flags
+
+OK = "ok"
+ERROR = "error"
+EMPTY = "empty"
+SKIPPED = "skipped"
+
+current: ContextVar["Tracer | None"] = ContextVar("monads.trace", default=None)
+lock = threading.Lock()
+
+
+def name_of(func: Callable) -> str:
+    return getattr(func, "__qualname__", None) or repr(func)
+
+
+class Span(NamedTuple):
+    """모나드 한 단계의 실행 기록
+
+    outcome은 ok, error(예외나 Failed), empty(None이나 Nothing), skipped(빈 값이라 실행되지 않음) 중 하나.
+    allocations는 단계 전후의 sys.getallocatedblocks() 차이로, 해제된 블록을 뺀 순증가량임.
+    """
+
+    kind: str
+    name: str
+    path: tuple[str, ...]
+    wall: float
+    self_wall: float
+    cpu: float
+    allocations: int
+    outcome: str
+
+
+class Stat:
+    __slots__ = ("count", "wall", "cpu", "max_wall", "allocations", "outcomes")
+
+    def __init__(self):
+        self.count = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.max_wall = 0.0
+        self.allocations = 0
+        self.outcomes: dict[str, int] = {}
+
+
+class Metrics:
+    """스팬을 (kind, 이름)별로 모으는 프로세스 내 집계기"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats: dict[tuple[str, str], Stat] = {}
+
+    def record(self, span: Span):
+        with self.lock:
+            stat = self.stats.setdefault((span.kind, span.name), Stat())
+            stat.count += 1
+            stat.wall += span.wall
+            stat.cpu += span.cpu
+            stat.max_wall = max(stat.max_wall, span.wall)
+            stat.allocations += span.allocations
+            stat.outcomes[span.outcome] = stat.outcomes.get(span.outcome, 0) + 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        with self.lock:
+            return {
+                f"{kind} {name}": {
+                    "count": stat.count,
+                    "wall": stat.wall,
+                    "cpu": stat.cpu,
+                    "max_wall": stat.max_wall,
+                    "allocations": stat.allocations,
+                    "outcomes": dict(stat.outcomes),
+                }
+                for (kind, name), stat in self.stats.items()
+            }
+
+
+def collapsed(spans: Iterable[Span]) -> str:
+    """flamegraph.pl이나 speedscope가 읽는 collapsed stack 형식(경로 마이크로초)으로 변환함"""
+    totals: dict[tuple[str, ...], float] = {}
+    for span in spans:
+        totals[span.path] = totals.get(span.path, 0.0) + span.self_wall
+    return "\n".join(
+        f"{';'.join(path)} {round(seconds * 1e6)}" for path, seconds in totals.items()
+    )
+
+
+class Tracer:
+    def __init__(self, keep: bool = True, sinks: Iterable[Metrics] = ()):
+        self.keep = keep
+        self.sinks = list(sinks)
+        self.spans: list[Span] = []
+        self.lock = threading.Lock()
+        # ([프레임 이름, 자식 단계들의 실행 시간], ...). 스레드나 태스크마다 복사된 컨텍스트에서 따로 쌓이므로
+        # 동시에 실행되는 형제 단계들이 서로의 자식으로 기록되지 않음
+        self.stack: ContextVar[tuple[list[Any], ...]] = ContextVar(
+            "monads.trace.stack", default=()
+        )
+
+    def emit(self, span: Span):
+        if self.keep:
+            self.spans.append(span)
+        for sink in self.sinks:
+            sink.record(span)
+
+    def call(
+        self,
+        kind: str,
+        func: Callable,
+        args: tuple,
+        outcome: Callable[[Any], str] | None,
+    ) -> Any:
+        name = name_of(func)
+        frame = [f"{kind}:{name}", 0.0]
+        parents = self.stack.get()
+        token = self.stack.set((*parents, frame))
+        path = tuple(entry[0] for entry in parents) + (frame[0],)
+        result_outcome = ERROR
+        blocks = sys.getallocatedblocks()
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        try:
+            result = func(*args)
+            result_outcome = outcome(result) if outcome is not None else OK
+            return result
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            blocks = sys.getallocatedblocks() - blocks
+            self.stack.reset(token)
+            if parents:
+                with self.lock:
+                    parents[-1][1] += wall
+            # 자식들이 동시에 실행됐다면 자식 시간의 합이 더 클 수 있음
+            self_wall = max(0.0, wall - frame[1])
+            self.emit(
+                Span(kind, name, path, wall, self_wall, cpu, blocks, result_outcome)
+            )
+
+    def skip(self, kind: str, func: Callable):
+        name = name_of(func)
+        path = (*(entry[0] for entry in self.stack.get()), f"{kind}:{name}")
+        self.emit(Span(kind, name, path, 0.0, 0.0, 0.0, 0, SKIPPED))
+
+    def collapsed(self) -> str:
+        return collapsed(self.spans)
+
+
+def call(
+    kind: str,
+    func: Callable,
+    *args: Any,
+    outcome: Callable[[Any], str] | None = None,
+) -> Any:
+    """트레이서가 켜져있으면 func 실행을 기록하고, 아니면 그냥 실행함"""
+    tracer = current.get()
+    if tracer is None:
+        return func(*args)
+    return tracer.call(kind, func, args, outcome)
+
+
+def skip(kind: str, func: Callable):
+    tracer = current.get()
+    if tracer is not None:
+        tracer.skip(kind, func)
+
+
+@contextmanager
+def tracing(keep: bool = True, sinks: Iterable[Metrics] = ()) -> Iterator[Tracer]:
+    """블록 안(같은 컨텍스트)에서 실행되는 모나드 단계들을 기록함
+
+    with tracing(sinks=[metrics]) as tracer:
+        ...
+    print(tracer.collapsed())
+    """
+    tracer = Tracer(keep, sinks)
+    token = current.set(tracer)
+    with lock:
+        flags.tracing += 1
+    try:
+        yield tracer
+    finally:
+        with lock:
+            flags.tracing -= 1
+        current.reset(token)